@@ -0,0 +1,98 @@
+"""Benchmarks the activation loops of BaseScheduler and RandomScheduler on scenarios with increasing numbers of agents.
+
+Each scenario runs a few steps in which every agent does nothing, except for 1% of them, which create a new agent when activated
+(similarly to data packets creating network flows), so that agents added in the middle of steps are also exercised. The previous
+(quadratic) activation loops are only measured on the smaller scenarios, as they take too long on larger ones.
+
+Usage:
+    python -m benchmarks.activation_schedulers
+"""
+
+# EdgeSimPy components
+from edge_sim_py.activation_schedulers import BaseScheduler, RandomScheduler
+from edge_sim_py.activation_schedulers.base_scheduler import was_activated
+
+# Mesa modules
+from mesa import Agent, Model
+
+# Python libraries
+import random
+import time
+
+STEPS = 3
+AGENT_COUNTS = [1000, 2000, 4000, 10000, 20000, 50000]
+LEGACY_MAX_AGENTS = 4000
+
+
+class BenchmarkAgent(Agent):
+    """Agent that creates a new (idle) agent when activated if its "spawner" flag is set."""
+
+    def __init__(self, unique_id: int, model: Model, spawner: bool = False):
+        Agent.__init__(self, unique_id=unique_id, model=model)
+        self.spawner = spawner
+
+    def step(self):
+        if self.spawner:
+            self.model.schedule.add(BenchmarkAgent(unique_id=self.model.next_id(), model=self.model))
+
+
+def legacy_base_step(schedule):
+    while any([not was_activated(agent, schedule.steps) for agent in list(schedule._agents.values())]):
+        agent = next((agent for agent in list(schedule._agents.values()) if not was_activated(agent, schedule.steps)), None)
+        agent.last_activation = schedule.steps
+        agent.step()
+
+    schedule.steps += 1
+    schedule.time += 1
+
+
+def legacy_random_step(schedule):
+    agents = list(schedule._agents.values())
+    agents = random.sample(agents, len(agents))
+
+    while any([not was_activated(agent, schedule.steps) for agent in agents]):
+        agent = next((agent for agent in agents if not was_activated(agent, schedule.steps)), None)
+        agent.last_activation = schedule.steps
+        agent.step()
+
+        agents = list(schedule._agents.values())
+        agents = random.sample(agents, len(agents))
+
+    schedule.steps += 1
+    schedule.time += 1
+
+
+def run(scheduler_class: type, number_of_agents: int, step_function=None) -> float:
+    """Runs a benchmark scenario.
+
+    Args:
+        scheduler_class (type): Scheduler class.
+        number_of_agents (int): Number of agents in the scenario.
+        step_function (Callable, optional): Function that replaces the scheduler's step() method. Defaults to None.
+
+    Returns:
+        float: Average time (in seconds) taken by each step.
+    """
+    random.seed(0)
+    model = Model()
+    model.schedule = scheduler_class(model)
+    for index in range(number_of_agents):
+        model.schedule.add(BenchmarkAgent(unique_id=model.next_id(), model=model, spawner=index % 100 == 0))
+
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        step_function(model.schedule) if step_function else model.schedule.step()
+
+    return (time.perf_counter() - start) / STEPS
+
+
+if __name__ == "__main__":
+    print(f"{'Agents':>8} | {'Base (legacy)':>14} | {'Base':>10} | {'Random (legacy)':>16} | {'Random':>10}")
+    for number_of_agents in AGENT_COUNTS:
+        results = []
+        for scheduler_class, legacy_step in [(BaseScheduler, legacy_base_step), (RandomScheduler, legacy_random_step)]:
+            legacy_time = run(scheduler_class, number_of_agents, legacy_step) if number_of_agents <= LEGACY_MAX_AGENTS else None
+            results.append(f"{legacy_time:.4f}s" if legacy_time is not None else "-")
+            results.append(f"{run(scheduler_class, number_of_agents):.4f}s")
+
+        print(f"{number_of_agents:>8} | {results[0]:>14} | {results[1]:>10} | {results[2]:>16} | {results[3]:>10}")
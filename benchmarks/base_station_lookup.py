@@ -0,0 +1,106 @@
+"""Benchmarks the lookup of the base stations closest to users at continuous coordinates with a linear scan over all base stations
+and with the spatial index of the BaseStation class ("find_nearest" and "find_within_radius"), as well as exact lookups of base
+stations located at the coordinates of users.
+
+Usage:
+    python -m benchmarks.base_station_lookup
+"""
+
+# EdgeSimPy components
+from edge_sim_py.components.base_station import BaseStation
+
+# Python libraries
+import math
+import random
+import time
+
+BASE_STATION_COUNTS = [1000, 10000, 100000]
+QUERIES = 1000
+RADIUS = 3
+
+
+def build_base_stations(number_of_base_stations: int):
+    """Creates base stations placed in a square grid with one base station per unit of area.
+
+    Args:
+        number_of_base_stations (int): Number of base stations.
+    """
+    BaseStation._instances = []
+    BaseStation._object_count = 0
+    BaseStation._reset_indexes()
+
+    side = math.ceil(math.sqrt(number_of_base_stations))
+    for index in range(number_of_base_stations):
+        base_station = BaseStation()
+        base_station.coordinates = (index % side, index // side)
+
+
+def linear_nearest(coordinates: tuple) -> object:
+    """Finds the base station closest to a pair of coordinates by inspecting all base stations.
+
+    Args:
+        coordinates (tuple): Coordinates.
+
+    Returns:
+        object: Closest base station.
+    """
+    return min(BaseStation.all(), key=lambda base_station: math.dist(base_station.coordinates, coordinates))
+
+
+def linear_within_radius(coordinates: tuple, radius: float) -> list:
+    """Finds the base stations within a given distance from a pair of coordinates by inspecting all base stations.
+
+    Args:
+        coordinates (tuple): Coordinates.
+        radius (float): Maximum distance.
+
+    Returns:
+        list: Base stations within the radius.
+    """
+    return [base_station for base_station in BaseStation.all() if math.dist(base_station.coordinates, coordinates) <= radius]
+
+
+def time_queries(function: object, arguments: list) -> float:
+    """Measures the time taken to run a lookup function for a list of arguments.
+
+    Args:
+        function (object): Lookup function.
+        arguments (list): Keyword arguments of each lookup.
+
+    Returns:
+        float: Elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    for kwargs in arguments:
+        function(**kwargs)
+
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'Base stations':>14} {'Nearest scan (s)':>17} {'Nearest index (s)':>18} {'Radius scan (s)':>16} {'Radius index (s)':>17} {'Exact index (s)':>16}")
+
+    for number_of_base_stations in BASE_STATION_COUNTS:
+        random.seed(1)
+        build_base_stations(number_of_base_stations=number_of_base_stations)
+
+        side = math.sqrt(number_of_base_stations)
+        points = [(random.uniform(0, side), random.uniform(0, side)) for _ in range(QUERIES)]
+        exact_points = [random.choice(BaseStation.all()).coordinates for _ in range(QUERIES)]
+
+        # Building the spatial index before measuring the queries
+        BaseStation.find_nearest(coordinates=points[0])
+
+        times = [
+            time_queries(function=linear_nearest, arguments=[{"coordinates": point} for point in points]),
+            time_queries(function=BaseStation.find_nearest, arguments=[{"coordinates": point} for point in points]),
+            time_queries(function=linear_within_radius, arguments=[{"coordinates": point, "radius": RADIUS} for point in points]),
+            time_queries(function=BaseStation.find_within_radius, arguments=[{"coordinates": point, "radius": RADIUS} for point in points]),
+            time_queries(function=BaseStation.find_nearest, arguments=[{"coordinates": point} for point in exact_points]),
+        ]
+
+        print(f"{number_of_base_stations:>14} {times[0]:>17.4f} {times[1]:>18.4f} {times[2]:>16.4f} {times[3]:>17.4f} {times[4]:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
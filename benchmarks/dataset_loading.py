@@ -0,0 +1,104 @@
+"""Benchmarks the time taken by Simulator.initialize() to load datasets with increasing numbers of users, applications, and services
+from Python dictionaries, JSON files, newline-delimited JSON files, and msgpack files.
+
+Each user accesses its own application, composed of a single service hosted by one of the edge servers of the infrastructure.
+
+Usage:
+    python -m benchmarks.dataset_loading
+"""
+
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import os
+import json
+import time
+import random
+import msgpack
+import tempfile
+
+USER_COUNTS = [1000, 5000, 10000, 50000]
+MAP_SIZE = 10
+
+
+def build_dataset(number_of_users: int) -> dict:
+    """Builds a dataset with a given number of users, each accessing its own single-service application.
+
+    Args:
+        number_of_users (int): Number of users in the dataset.
+
+    Returns:
+        dict: Dataset.
+    """
+    random.seed(0)
+    for component_class in ComponentManager.__subclasses__():
+        if component_class.__name__ != "Simulator":
+            component_class._object_count = 0
+            component_class._instances = []
+            component_class._reset_indexes()
+
+    for coordinates in hexagonal_grid(x_size=MAP_SIZE, y_size=MAP_SIZE):
+        base_station = BaseStation()
+        base_station.wireless_delay = 0
+        base_station.coordinates = coordinates
+        base_station._connect_to_network_switch(network_switch=sample_switch())
+
+        # Connecting an edge server to every fourth base station
+        if base_station.id % 4 == 0:
+            base_station._connect_to_edge_server(edge_server=jetson_tx2())
+
+    partially_connected_hexagonal_mesh(network_nodes=NetworkSwitch.all(), link_specifications=[{"number_of_objects": 261, "delay": 1, "bandwidth": 10}])
+
+    edge_servers = EdgeServer.all()
+    for index in range(number_of_users):
+        service = Service(cpu_demand=0, memory_demand=0, image_digest="sha256:0")
+        service.server = edge_servers[index % len(edge_servers)]
+        service.server.services.append(service)
+
+        app = Application()
+        app.connect_to_service(service=service)
+
+        user = User()
+        user.mobility_model = pathway
+        user._set_initial_position(coordinates=random.choice(BaseStation.all()).coordinates)
+        user._connect_to_application(app=app, delay_sla=10)
+        CircularDurationAndIntervalAccessPattern(user=user, app=app, start=1, duration_values=[2], interval_values=[3])
+
+    ignore_list = ["Simulator", "Topology", "NetworkFlow", "DataPacket"]
+    return {
+        component_class.__name__: [component._to_dict() for component in component_class.all()]
+        for component_class in ComponentManager.__subclasses__()
+        if component_class.__name__ not in ignore_list
+    }
+
+
+def main():
+    print(f"{'Users':>8} {'Dict (s)':>10} {'JSON (s)':>10} {'NDJSON (s)':>11} {'msgpack (s)':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for number_of_users in USER_COUNTS:
+            dataset = build_dataset(number_of_users=number_of_users)
+            records = [{"class": key, **specification} for key, specifications in dataset.items() for specification in specifications]
+
+            with open(f"{directory}/dataset.json", "w", encoding="UTF-8") as output_file:
+                json.dump(dataset, output_file)
+            with open(f"{directory}/dataset.ndjson", "w", encoding="UTF-8") as output_file:
+                output_file.writelines(f"{json.dumps(record)}\n" for record in records)
+            with open(f"{directory}/dataset.msgpack", "wb") as output_file:
+                output_file.writelines(msgpack.packb(record) for record in records)
+
+            times = []
+            for input_file in [dataset, f"{directory}/dataset.json", f"{directory}/dataset.ndjson", f"{directory}/dataset.msgpack"]:
+                start = time.perf_counter()
+                Simulator().initialize(input_file=input_file)
+                times.append(time.perf_counter() - start)
+
+            print(f"{number_of_users:>8} {times[0]:>10.3f} {times[1]:>10.3f} {times[2]:>11.3f} {times[3]:>12.3f}")
+
+            for extension in ["json", "ndjson", "msgpack"]:
+                os.remove(f"{directory}/dataset.{extension}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmarks the calculation of Max-Min Fairness bandwidth shares with the list-based and the vectorized implementations.
+
+Each scenario has links crossed by increasing numbers of concurrent flows with random demands, and all links have their shares
+recalculated at once (as happens when many flows start at the same step).
+
+Usage:
+    python -m benchmarks.flow_scheduling
+"""
+
+# EdgeSimPy components
+from edge_sim_py.components.flow_scheduling.max_min_fairness import calculate_fair_allocation
+from edge_sim_py.components.flow_scheduling.vectorized_max_min_fairness import calculate_vectorized_fair_allocation
+
+# Python libraries
+import numpy as np
+import random
+import time
+
+NUMBER_OF_LINKS = 100
+FLOWS_PER_LINK = [10, 100, 1000]
+
+
+def main():
+    random.seed(1)
+
+    print(f"{'Flows per link':>15} {'Lists (s)':>12} {'Vectorized (s)':>15}")
+    for flows_per_link in FLOWS_PER_LINK:
+        capacities = [random.choice([10, 100, 1000]) for _ in range(NUMBER_OF_LINKS)]
+        demands = [[random.randint(1, 1000) for _ in range(flows_per_link)] for _ in range(NUMBER_OF_LINKS)]
+
+        start = time.perf_counter()
+        for capacity, link_demands in zip(capacities, demands):
+            calculate_fair_allocation(capacity=capacity, demands=link_demands)
+        lists_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        calculate_vectorized_fair_allocation(
+            capacities=np.array(capacities, dtype=float),
+            links=np.repeat(np.arange(NUMBER_OF_LINKS), flows_per_link),
+            demands=np.array(demands, dtype=float).ravel(),
+        )
+        vectorized_time = time.perf_counter() - start
+
+        print(f"{flows_per_link:>15} {lists_time:>12.4f} {vectorized_time:>15.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Benchmarks the access to network link properties with the previous dictionary-backed link representation (in which attributes
+were resolved by "__getattr__" and algorithms used the mapping interface) and with the current slot-backed representation.
+
+The first table shows the cost of a single access to the properties read by flow scheduling algorithms and routing methods. The
+second table shows the time taken by "max_min_fairness" (with all links having their bandwidth shares recalculated) and by
+"calculate_path_delay" (with an empty cache of path delays), compared to their previous implementations running on the previous
+link representation.
+
+Usage:
+    python -m benchmarks.link_access
+"""
+
+# EdgeSimPy components
+from edge_sim_py.components.flow_scheduling.flow_tracker import FlowTracker
+from edge_sim_py.components.flow_scheduling.max_min_fairness import calculate_fair_allocation, max_min_fairness
+from edge_sim_py.components.network_flow import NetworkFlow
+from edge_sim_py.components.network_link import NetworkLink, OrderedSet
+from edge_sim_py.components.network_switch import NetworkSwitch
+from edge_sim_py.components.topology import Topology
+
+# Python libraries
+from collections import Counter
+import networkx as nx
+import random
+import timeit
+import time
+
+NUMBER_OF_LINKS = 50
+FLOWS_PER_LINK = [10, 100]
+REPETITIONS = 50
+ACCESSES = 1000000
+
+
+class DictBackedLink(dict):
+    """Network link that stores its properties as dictionary items (i.e., the previous link representation)."""
+
+    def __init__(self, obj_id: int):
+        """Creates a DictBackedLink object.
+
+        Args:
+            obj_id (int): Object identifier.
+        """
+        self.update(id=obj_id, delay=0, bandwidth=0, bandwidth_demand=0, applications=Counter(), active_flows=OrderedSet())
+
+    def __getattr__(self, attribute_name: str):
+        """Retrieves an object attribute by its name.
+
+        Args:
+            attribute_name (str): Name of the attribute to be retrieved.
+
+        Returns:
+            (any): Attribute value.
+        """
+        if attribute_name in self:
+            return self[attribute_name]
+        else:
+            raise AttributeError(f"Object {self} has no such attribute '{attribute_name}'.")
+
+
+def dict_backed_max_min_fairness(topology: object, flows: list):
+    """Previous implementation of "max_min_fairness", which accessed links through the mapping interface.
+
+    Args:
+        topology (object): Network topology object.
+        flows (list): List of flows in the topology.
+    """
+    flow_tracker = FlowTracker.get(topology=topology)
+    flow_tracker.update(topology=topology, flows=flows)
+    links_to_recalculate_bandwidth = flow_tracker.get_links_to_recalculate_bandwidth()
+
+    for link in links_to_recalculate_bandwidth:
+        flow_demands = [f.data_to_transfer for f in link["active_flows"]]
+        if sum(flow_demands) > 0:
+            bw_shares = calculate_fair_allocation(capacity=link["bandwidth"], demands=flow_demands)
+
+            for index, affected_flow in enumerate(link["active_flows"]):
+                affected_flow.bandwidth[link["id"]] = bw_shares[index]
+
+
+def build_topology(link_class: type, flows_per_link: int) -> tuple:
+    """Builds a line topology whose links are crossed by flows with random demands.
+
+    Args:
+        link_class (type): Class of the network links.
+        flows_per_link (int): Number of flows crossing each link.
+
+    Returns:
+        tuple: Topology, network path crossing all links, and network flows.
+    """
+    random.seed(1)
+    for component_class in [NetworkFlow, NetworkLink, NetworkSwitch, Topology]:
+        component_class._instances = []
+        component_class._object_count = 0
+
+    topology = Topology()
+    switches = [NetworkSwitch() for _ in range(NUMBER_OF_LINKS + 1)]
+    for index in range(NUMBER_OF_LINKS):
+        link = link_class() if link_class is NetworkLink else link_class(obj_id=index + 1)
+        link["delay"] = random.randint(1, 10)
+        link["bandwidth"] = random.choice([10, 100, 1000])
+        topology.add_edge(switches[index], switches[index + 1])
+        topology._adj[switches[index]][switches[index + 1]] = link
+        topology._adj[switches[index + 1]][switches[index]] = link
+
+    flows = []
+    for index in range(NUMBER_OF_LINKS):
+        for _ in range(flows_per_link):
+            path = switches[index : index + 2]
+            flows.append(NetworkFlow(topology=topology, path=path, data_to_transfer=random.randint(1, 1000)))
+
+    return topology, switches, flows
+
+
+def time_max_min_fairness(algorithm: object, topology: object, flows: list) -> float:
+    """Measures the time taken by a Max-Min Fairness implementation to recalculate the bandwidth shares of all links.
+
+    Args:
+        algorithm (object): Max-Min Fairness implementation.
+        topology (object): Network topology object.
+        flows (list): List of flows in the topology.
+
+    Returns:
+        float: Elapsed time in seconds.
+    """
+    elapsed_time = 0
+    for _ in range(REPETITIONS):
+        # Marking all flows as just started, so that the shares of all links are recalculated
+        for flow in flows:
+            for link_id in flow.bandwidth:
+                flow.bandwidth[link_id] = None
+
+        start = time.perf_counter()
+        algorithm(topology=topology, flows=flows)
+        elapsed_time += time.perf_counter() - start
+
+    return elapsed_time
+
+
+def time_path_delay(topology: object, path: list, dict_backed: bool) -> float:
+    """Measures the time taken to calculate the delay of a network path without cached results.
+
+    Args:
+        topology (object): Network topology object.
+        path (list): Network path.
+        dict_backed (bool): Whether to use the previous implementation (based on NetworkX's "path_weight" method).
+
+    Returns:
+        float: Elapsed time in seconds.
+    """
+    elapsed_time = 0
+    for _ in range(REPETITIONS * 10):
+        topology._path_delays.clear()
+
+        start = time.perf_counter()
+        if dict_backed:
+            nx.classes.function.path_weight(G=topology, path=path, weight="delay")
+        else:
+            topology.calculate_path_delay(path=path)
+        elapsed_time += time.perf_counter() - start
+
+    return elapsed_time
+
+
+def main():
+    # Measuring the cost of single accesses to link properties
+    dict_backed_link = DictBackedLink(obj_id=1)
+    slotted_link = NetworkLink()
+    namespace = {"dict_backed_link": dict_backed_link, "slotted_link": slotted_link}
+
+    print(f"{'Property':>13} {'Dict attr (ns)':>15} {'Dict item (ns)':>15} {'Slot attr (ns)':>15} {'Slot item (ns)':>15}")
+    for attribute in ["bandwidth", "active_flows", "id", "delay"]:
+        times = []
+        for statement in ["dict_backed_link.{0}", "dict_backed_link['{0}']", "slotted_link.{0}", "slotted_link['{0}']"]:
+            elapsed_time = min(timeit.repeat(statement.format(attribute), globals=namespace, number=ACCESSES, repeat=3))
+            times.append(elapsed_time / ACCESSES * 1e9)
+
+        print(f"{attribute:>13} {times[0]:>15.1f} {times[1]:>15.1f} {times[2]:>15.1f} {times[3]:>15.1f}")
+
+    # Measuring the time taken by the algorithms that access link properties
+    print()
+    print(f"{'Flows per link':>15} {'MMF dict (s)':>13} {'MMF slots (s)':>14} {'Delay dict (s)':>15} {'Delay slots (s)':>16}")
+    for flows_per_link in FLOWS_PER_LINK:
+        topology, switches, flows = build_topology(link_class=DictBackedLink, flows_per_link=flows_per_link)
+        dict_backed_times = [
+            time_max_min_fairness(algorithm=dict_backed_max_min_fairness, topology=topology, flows=flows),
+            time_path_delay(topology=topology, path=switches, dict_backed=True),
+        ]
+
+        topology, switches, flows = build_topology(link_class=NetworkLink, flows_per_link=flows_per_link)
+        slotted_times = [
+            time_max_min_fairness(algorithm=max_min_fairness, topology=topology, flows=flows),
+            time_path_delay(topology=topology, path=switches, dict_backed=False),
+        ]
+
+        print(f"{flows_per_link:>15} {dict_backed_times[0]:>13.4f} {slotted_times[0]:>14.4f} {dict_backed_times[1]:>15.4f} {slotted_times[1]:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
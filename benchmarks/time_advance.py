@@ -0,0 +1,128 @@
+"""Benchmarks the "tick" and "next_event" time advance modes on sparse workloads with increasing numbers of users.
+
+Each user accesses its own application (composed of a single service hosted by an edge server attached to another base station)
+for 2 steps every 500 steps and never moves, so that the simulation is idle most of the time. Metrics are collected every 100 steps and finished flows and data packets are archived, so
+that the measured times are dominated by the activation of agents rather than by monitoring.
+
+Usage:
+    python -m benchmarks.time_advance
+"""
+
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.activation_schedulers import DefaultScheduler, EventDrivenScheduler
+from edge_sim_py.components.data_packet import DataPacket
+
+# Python libraries
+import time
+import random
+
+USER_COUNTS = [10, 100, 500]
+STEPS = 2000
+MAP_SIZE = 6
+
+
+def static_mobility(user: object):
+    """Mobility model that keeps users at their current location for a long period.
+
+    Args:
+        user (object): User whose mobility trace will be extended.
+    """
+    user.coordinates_trace.append(user.coordinates, repeats=STEPS)
+
+
+def idle_algorithm(parameters: dict):
+    """Resource management algorithm that does nothing (and therefore only needs to be called when the simulation executes steps).
+
+    Args:
+        parameters (dict): User-defined parameters.
+    """
+    parameters["next_call_step"] = float("inf")
+
+
+def build_simulator(number_of_users: int, scheduler: type, time_advance: str) -> Simulator:
+    """Builds a simulator with a given number of sparse users.
+
+    Args:
+        number_of_users (int): Number of users in the scenario.
+        scheduler (type): Agent activation scheduler.
+        time_advance (str): Time advance mode.
+
+    Returns:
+        Simulator: Simulator object.
+    """
+    random.seed(0)
+    Simulator._instances = []
+    for component_class in ComponentManager.__subclasses__():
+        if component_class.__name__ != "Simulator":
+            component_class._object_count = 0
+            component_class._instances = []
+            component_class._reset_indexes()
+
+    simulator = Simulator(
+        stopping_criterion=lambda model: model.schedule.steps == STEPS,
+        resource_management_algorithm=idle_algorithm,
+        scheduler=scheduler,
+        time_advance=time_advance,
+        dump_interval=float("inf"),
+        retention_policy="archive",
+    )
+
+    for coordinates in hexagonal_grid(x_size=MAP_SIZE, y_size=MAP_SIZE):
+        base_station = BaseStation()
+        base_station.wireless_delay = 0
+        base_station.coordinates = coordinates
+        base_station._connect_to_network_switch(network_switch=sample_switch())
+
+        # Connecting an edge server to every fourth base station
+        if base_station.id % 4 == 0:
+            base_station._connect_to_edge_server(edge_server=jetson_tx2())
+
+    topology = partially_connected_hexagonal_mesh(network_nodes=NetworkSwitch.all(), link_specifications=[{"number_of_objects": 85, "delay": 1, "bandwidth": 10}])
+
+    edge_servers = EdgeServer.all()
+    free_base_stations = [base_station for base_station in BaseStation.all() if len(base_station.edge_servers) == 0]
+    for index in range(number_of_users):
+        service = Service(cpu_demand=0, memory_demand=0, image_digest="sha256:0", processing_time=20)
+        service.server = edge_servers[index % len(edge_servers)]
+        service.server.services.append(service)
+        service._available = True
+
+        app = Application()
+        app.connect_to_service(service=service)
+
+        user = User()
+        user.set_packet_size_strategy(mode="fixed", size=20)
+        user.mobility_model = static_mobility
+        user._set_initial_position(coordinates=random.choice(free_base_stations).coordinates)
+        user._connect_to_application(app=app, delay_sla=10)
+        CircularDurationAndIntervalAccessPattern(user=user, app=app, start=1 + index % 500, duration_values=[2], interval_values=[500])
+
+    simulator.topology = simulator.initialize_agent(agent=topology)
+    for component_class in [NetworkSwitch, NetworkLink, BaseStation, EdgeServer, Service, User, Application]:
+        for component in component_class.all():
+            simulator.initialize_agent(agent=component)
+
+    for component_class in [Topology, NetworkSwitch, NetworkLink, BaseStation, EdgeServer, Service, User, Application, DataPacket, NetworkFlow]:
+        simulator.configure_monitoring(component_class=component_class, interval=100)
+
+    return simulator
+
+
+def main():
+    print(f"{'Users':>6} {'Default (s)':>12} {'Event-driven (s)':>17} {'Next event (s)':>15} {'Skipped steps':>14}")
+
+    for number_of_users in USER_COUNTS:
+        times = []
+        for scheduler, time_advance in [(DefaultScheduler, "tick"), (EventDrivenScheduler, "tick"), (EventDrivenScheduler, "next_event")]:
+            simulator = build_simulator(number_of_users=number_of_users, scheduler=scheduler, time_advance=time_advance)
+
+            start = time.perf_counter()
+            simulator.run_model()
+            times.append(time.perf_counter() - start)
+
+        print(f"{number_of_users:>6} {times[0]:>12.3f} {times[1]:>17.3f} {times[2]:>15.3f} {simulator.skipped_steps:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from .simulator import Simulator
 
 # Misc components
 from .component_manager import ComponentManager
+from .metrics import MetricsWriter, ParquetMetricsWriter, ArrowMetricsWriter, read_metrics
+from .sweep import run_sweep
 
 # EdgeSimPy components
 from .components import *
@@ -6,6 +6,9 @@ from edge_sim_py.components import *
 # Mesa modules
 from mesa.time import BaseScheduler as MesaBaseScheduler
 
+# Python libraries
+from collections import deque
+
 
 def was_activated(agent, current_step):
     return hasattr(agent, "last_activation") and agent.last_activation == current_step
@@ -16,14 +19,45 @@ class BaseScheduler(MesaBaseScheduler):
     is based on Mesa's BaseScheduler. It activates agents one at a time, in the order they were added. This is explicitly
     meant to replicate the scheduler in MASON"""
 
+    def __init__(self, model: object):
+        """Creates a BaseScheduler object.
+
+        Args:
+            model (object): Simulation model.
+        """
+        MesaBaseScheduler.__init__(self, model)
+
+        # Queue of agents waiting to be activated in the current step (None outside steps)
+        self._activation_queue: deque = None
+
+    def add(self, agent: object):
+        """Adds an agent to the schedule. Agents added during a step are activated in that same step.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.add(self, agent)
+
+        if self._activation_queue is not None:
+            self._activation_queue.append(agent)
+
     def step(self) -> None:
         """Defines what happens at each step of the simulation model."""
-        while any([not was_activated(agent, self.steps) for agent in list(self._agents.values())]):
-            agent = next((agent for agent in list(self._agents.values()) if not was_activated(agent, self.steps)), None)
+        self._activation_queue = deque(self._agents.values())
+
+        while len(self._activation_queue) > 0:
+            agent = self._activation_queue.popleft()
+
+            # Skipping agents removed from the schedule or already activated in the current step
+            if self._agents.get(agent.unique_id) is not agent or was_activated(agent, self.steps):
+                continue
+
             agent.last_activation = self.steps
 
             agent.step()
 
+        self._activation_queue = None
+
         # Advancing simulation
         self.steps += 1
         self.time += 1
@@ -63,9 +63,9 @@ class DefaultScheduler(MesaBaseScheduler):
         for agent in ContainerRegistry.all():
             agent.step()
 
-        other_agents = NetworkSwitch.all() + NetworkLink.all() + BaseStation.all() + ContainerLayer.all() + ContainerImage.all() + Application.all()
-        for agent in other_agents:
-            agent.step()
+        for agent_class in [NetworkSwitch, NetworkLink, BaseStation, ContainerLayer, ContainerImage, Application]:
+            for agent in agent_class.all():
+                agent.step()
 
         # Advancing simulation
         self.steps += 1
@@ -0,0 +1,403 @@
+"""Contains an agent activation scheduler that only activates agents with pending work."""
+
+# EdgeSimPy components
+from edge_sim_py.components import *
+from edge_sim_py.components.data_packet import DataPacket
+
+# Mesa modules
+from mesa.time import BaseScheduler as MesaBaseScheduler
+
+# Python libraries
+import heapq
+
+# Network flow scheduling algorithms whose bandwidth shares only change when flows start, finish, or have more bandwidth than needed
+STEADY_FLOW_SCHEDULING_ALGORITHMS = [max_min_fairness, equal_share, network_wide_max_min_fairness, vectorized_max_min_fairness]
+
+# Built-in step() methods that do nothing. Agents whose classes use one of these methods are never activated (classes that override
+# or replace them are activated at every step)
+PASSIVE_STEP_METHODS = {NetworkSwitch.step, BaseStation.step, ContainerLayer.step, ContainerImage.step, Application.step}
+
+
+def is_passive(agent_class: type) -> bool:
+    """Checks whether the step() method of a given agent class is one of the built-in methods that do nothing.
+
+    Args:
+        agent_class (type): Agent class.
+
+    Returns:
+        bool: Information of whether the agent class has no built-in activation procedures.
+    """
+    return getattr(agent_class, "step", None) in PASSIVE_STEP_METHODS
+
+
+class EventDrivenScheduler(MesaBaseScheduler):
+    """Class responsible for scheduling the events that take place at each step of the simulation model. Agents are activated in
+    the same order as the DefaultScheduler. However, instead of activating every agent at each step, this scheduler only keeps track
+    of agents with pending work, putting the others to sleep until a known future time step or until an event wakes them up. This
+    way, the cost of each step scales with the simulation activity rather than with the number of components.
+
+    Activation Rules:
+        - Data Packets: activated while not waiting for a network flow (woken up once their flow finishes). Finished and dropped packets are no longer activated
+        - Edge Servers: activated while they can start downloading container layers from their waiting queue
+        - Services: activated while being provisioned
+        - Topology: activated at every step
+        - Network Flows: activated while waiting for bandwidth, once their bottleneck bandwidth changes, and at the step they finish
+          (finished flows leave the schedule). Flows are activated at every step if the flow scheduling algorithm is not built-in
+        - Users: activated while requesting applications, and woken up when new accesses are created or when their mobility trace changes
+        - Container Registries: activated while being provisioned
+        - Network Links: activated while crossed by network flows (and in the step their last flow finishes)
+        - Network Switches, Base Stations, Container Layers, Container Images, and Applications: only activated if their step() method is overridden
+    """
+
+    # Agent classes in the order they are activated at each step
+    activation_order = [
+        DataPacket,
+        EdgeServer,
+        Service,
+        Topology,
+        NetworkFlow,
+        User,
+        ContainerRegistry,
+        NetworkSwitch,
+        NetworkLink,
+        BaseStation,
+        ContainerLayer,
+        ContainerImage,
+        Application,
+    ]
+
+    def __init__(self, model: object):
+        """Creates an EventDrivenScheduler object.
+
+        Args:
+            model (object): Simulation model.
+        """
+        MesaBaseScheduler.__init__(self, model)
+
+        # Agents that must be activated at the current step, grouped by class and indexed by their unique IDs
+        self._active_agents = {agent_class: {} for agent_class in self.activation_order}
+
+        # Heap of (time step, unique ID) entries representing sleeping agents, along with the step each agent must wake up at
+        self._wakeups: list = []
+        self._wakeup_steps: dict = {}
+
+        # Cache that maps agent types to the activation groups they belong to (None for agents that are never activated)
+        self._agent_groups: dict = {}
+
+    def add(self, agent: object):
+        """Adds an agent to the schedule.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.add(self, agent)
+        self.wake(agent=agent)
+
+        # Network links crossed by new network flows must update their bandwidth demand
+        if isinstance(agent, NetworkFlow):
+            self._wake_flow_links(flow=agent)
+
+    def remove(self, agent: object):
+        """Removes an agent from the schedule.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.remove(self, agent)
+        self._wakeup_steps.pop(agent.unique_id, None)
+
+        group = self._get_group(agent=agent)
+        if group is not None:
+            self._active_agents[group].pop(agent.unique_id, None)
+
+        # Waking up the agents waiting for network flows that have just finished
+        if isinstance(agent, NetworkFlow):
+            self._wake_flow_links(flow=agent)
+
+            if agent.metadata.get("type") == "data_packet":
+                self.wake(agent=agent.metadata["object"])
+            elif agent.metadata.get("type") == "layer":
+                self.wake(agent=agent.target)
+            elif agent.metadata.get("type") == "service_state":
+                self.wake(agent=agent.metadata["object"])
+
+    def wake(self, agent: object, step: int = None):
+        """Wakes up an agent so that it is activated from a given time step on.
+
+        Args:
+            agent (object): Agent object.
+            step (int, optional): Time step in which the agent will be activated. Defaults to None (as soon as possible).
+        """
+        group = self._get_group(agent=agent)
+        if group is None or self._agents.get(agent.unique_id) is not agent:
+            return
+
+        if step is None or step <= self.steps:
+            self._wakeup_steps.pop(agent.unique_id, None)
+            self._active_agents[group][agent.unique_id] = agent
+
+        elif agent.unique_id not in self._active_agents[group] and step < self._wakeup_steps.get(agent.unique_id, float("inf")):
+            self._wakeup_steps[agent.unique_id] = step
+            heapq.heappush(self._wakeups, (step, agent.unique_id))
+
+    def next_wakeup(self) -> int:
+        """Gets the next time step in which sleeping agents will wake up.
+
+        Returns:
+            int: Next wake-up time step (None if there are no sleeping agents).
+        """
+        while len(self._wakeups) > 0 and self._wakeup_steps.get(self._wakeups[0][1]) != self._wakeups[0][0]:
+            heapq.heappop(self._wakeups)
+
+        return self._wakeups[0][0] if len(self._wakeups) > 0 else None
+
+    def step(self) -> None:
+        """Defines what happens at each step of the simulation model."""
+        # Waking up agents scheduled to the current step
+        while len(self._wakeups) > 0 and self._wakeups[0][0] <= self.steps:
+            step, unique_id = heapq.heappop(self._wakeups)
+            if self._wakeup_steps.get(unique_id) == step:
+                self.wake(agent=self._agents[unique_id])
+
+        for group in self.activation_order:
+            active_agents = self._active_agents[group]
+
+            # Agents are activated in the order they were added to the schedule. Agents added to the group while it
+            # is being activated are activated as well, as happens when iterating over the list of instances of a class
+            last_activated = -1
+            unique_ids = sorted(active_agents)
+            while len(unique_ids) > 0:
+                for unique_id in unique_ids:
+                    agent = active_agents.get(unique_id)
+                    if agent is None:
+                        continue
+
+                    agent.step()
+
+                    wakeup = self._get_wakeup_step(agent=agent)
+                    if wakeup != self.steps + 1 and self._agents.get(unique_id) is agent:
+                        del active_agents[unique_id]
+                        if wakeup is not None:
+                            self.wake(agent=agent, step=wakeup)
+
+                last_activated = max(last_activated, unique_ids[-1])
+                unique_ids = sorted(unique_id for unique_id in active_agents if unique_id > last_activated)
+
+            # Waking up the network flows whose bandwidth shares have just been changed by the network flow scheduling algorithm
+            if group is Topology:
+                self._wake_reallocated_flows()
+
+        # Advancing simulation
+        self.steps += 1
+        self.time += 1
+
+    def get_skippable_steps(self) -> int:
+        """Gets the number of upcoming steps whose outcome is known in advance, so that they can be skipped without activating agents.
+        That is the case while no sleeping agent must wake up and the only agents with pending work are the network links crossed by
+        flows transferring data at constant rates, the network topology, and data packets being processed. Skippable steps last until
+        the next event, i.e., until the next step in which a sleeping agent wakes up (e.g., a network flow finishes or a user starts
+        making requests) or a data packet finishes processing.
+
+        Returns:
+            int: Number of skippable steps (0 if the current step must be executed through the step() method, infinity if no event is
+                scheduled).
+        """
+        next_wakeup = self.next_wakeup()
+        if next_wakeup is not None and next_wakeup <= self.steps:
+            return 0
+
+        data_packets = self._active_agents[DataPacket].values()
+
+        for group in self.activation_order:
+            active_agents = self._active_agents[group]
+            if len(active_agents) == 0 or group is DataPacket:
+                continue
+
+            # Network links and the topology only do something when bandwidth shares change
+            if group is Topology:
+                if any(type(agent).step is not Topology.step for agent in active_agents.values()) or not self._has_steady_bandwidth_shares():
+                    return 0
+
+            elif group is NetworkLink:
+                for link in active_agents.values():
+                    if type(link).step is not NetworkLink.step:
+                        return 0
+                    if link.bandwidth_demand != sum(flow.bandwidth[link.id] for flow in link.active_flows):
+                        return 0
+
+            else:
+                return 0
+
+        skippable_steps = float("inf") if next_wakeup is None else next_wakeup - self.steps
+
+        # Data packets are skipped while they are being processed and until the step in which they finish processing
+        for data_packet in data_packets:
+            if type(data_packet).step is not DataPacket.step or not data_packet._is_processing:
+                return 0
+
+            service = data_packet.application.services[data_packet._current_hop - 1]
+            if service.server is None or service.server.network_switch != data_packet._processing_switch:
+                return 0
+
+            skippable_steps = min(skippable_steps, data_packet._processing_remaining_time - 1)
+
+        return max(0, skippable_steps)
+
+    def skip_steps(self, steps: int):
+        """Advances the simulation by a number of steps without activating agents. The progress of the data packets being processed
+        is updated analytically, exactly as their step() methods would do (network flows calculate their own progress from their
+        bottleneck bandwidth). The number of steps must not exceed the number of skippable steps (see "get_skippable_steps()").
+
+        Args:
+            steps (int): Number of steps to skip.
+        """
+        # Updating the progress of data packets
+        for data_packet in self._active_agents[DataPacket].values():
+            data_packet._processing_remaining_time -= steps
+
+        # Advancing simulation
+        self.steps += steps
+        self.time += steps
+
+    def _has_steady_bandwidth_shares(self) -> bool:
+        """Checks whether the network flow scheduling algorithm would keep the current bandwidth shares. Only built-in algorithms
+        are considered, as they only recalculate bandwidth shares when flows start, finish, or have more bandwidth than needed.
+
+        Returns:
+            bool: Information of whether bandwidth shares are guaranteed not to change at the current step.
+        """
+        if len(self._active_agents[NetworkFlow]) == 0 and len(NetworkFlow.all()) == 0:
+            return True
+
+        if not self._has_built_in_flow_scheduling():
+            return False
+
+        flow_tracker = getattr(self.model.topology, "_flow_tracker", None)
+        return flow_tracker is not None and not flow_tracker.has_pending_changes(flows=NetworkFlow.all())
+
+    def _has_built_in_flow_scheduling(self) -> bool:
+        """Checks whether the network flow scheduling algorithm is one of the built-in algorithms, which only recalculate bandwidth
+        shares when flows start, finish, or have more bandwidth than needed (see the FlowTracker class).
+
+        Returns:
+            bool: Information of whether the network flow scheduling algorithm is a built-in algorithm.
+        """
+        return self.model.network_flow_scheduling_algorithm in STEADY_FLOW_SCHEDULING_ALGORITHMS
+
+    def _wake_reallocated_flows(self):
+        """Wakes up the network flows whose bottleneck bandwidth differs from the one they are using to calculate their progress."""
+        flow_tracker = getattr(self.model.topology, "_flow_tracker", None)
+        if flow_tracker is None or not self._has_built_in_flow_scheduling():
+            return
+
+        active_flows = self._active_agents[NetworkFlow]
+        for flow in flow_tracker.active_flows:
+            if flow.status == "active" and flow.unique_id not in active_flows and None not in flow.bandwidth.values():
+                if min(flow.bandwidth.values()) != flow._bottleneck_bandwidth:
+                    self.wake(agent=flow)
+
+    def _get_group(self, agent: object) -> type:
+        """Gets the activation group of a given agent.
+
+        Args:
+            agent (object): Agent object.
+
+        Returns:
+            type: Activation group (None if the agent has no built-in activation procedures).
+        """
+        agent_type = type(agent)
+        if agent_type not in self._agent_groups:
+            group = next((agent_class for agent_class in self.activation_order if isinstance(agent, agent_class)), None)
+            self._agent_groups[agent_type] = None if group is None or is_passive(agent_type) else group
+
+        return self._agent_groups[agent_type]
+
+    def _wake_flow_links(self, flow: object):
+        """Wakes up the network links that comprehend the path of a network flow.
+
+        Args:
+            flow (object): Network flow.
+        """
+        for i in range(0, len(flow.path) - 1):
+            self.wake(agent=flow.topology[flow.path[i]][flow.path[i + 1]])
+
+    def _get_wakeup_step(self, agent: object) -> int:
+        """Gets the next time step in which an agent that has just been activated needs to be activated again.
+
+        Args:
+            agent (object): Agent object.
+
+        Returns:
+            int: Next activation step (None if the agent will only be activated again once an event wakes it up).
+        """
+        next_step = self.steps + 1
+
+        if isinstance(agent, DataPacket):
+            waiting_for_flow = not agent._is_processing and agent._current_flow is not None
+            if agent._status in ["finished", "dropped"] or waiting_for_flow:
+                return None
+
+        elif isinstance(agent, EdgeServer):
+            if len(agent.waiting_queue) == 0 or len(agent.download_queue) >= agent.max_concurrent_layer_downloads:
+                return None
+
+        elif isinstance(agent, Service):
+            migrations = agent._Service__migrations
+            if len(migrations) == 0 or migrations[-1]["end"] is not None:
+                return None
+
+        elif isinstance(agent, ContainerRegistry):
+            if agent.available:
+                return None
+
+        elif isinstance(agent, NetworkFlow):
+            # Flows using built-in scheduling algorithms sleep until they finish or until their bottleneck bandwidth changes
+            if agent.status == "active" and agent._bottleneck_start is not None and self._has_built_in_flow_scheduling():
+                return agent._completion_step
+
+        elif isinstance(agent, NetworkLink):
+            if len(agent.active_flows) == 0 and agent.bandwidth_demand == 0:
+                return None
+
+        elif isinstance(agent, User):
+            return self._get_user_wakeup_step(user=agent)
+
+        return next_step
+
+    def _get_user_wakeup_step(self, user: object) -> int:
+        """Gets the next time step in which a user needs to be activated, i.e., the first step in which the user either makes
+        requests, creates a new access, or has its location changed by its mobility trace.
+
+        Args:
+            user (object): User object.
+
+        Returns:
+            int: Next activation step.
+        """
+        next_step = self.steps + 1
+        wakeup = float("inf")
+
+        # Users are activated while making requests. Otherwise, they are woken up once their next access starts or is created
+        for app in user.applications:
+            if user._is_making_requests(app=app, step=next_step + 1):
+                return next_step
+
+            last_access = user.access_patterns[str(app.id)].history[-1]
+            if last_access["start"] > next_step:
+                wakeup = min(wakeup, last_access["start"] - 1)
+            if last_access["next_access"] - 2 >= next_step:
+                wakeup = min(wakeup, last_access["next_access"] - 2)
+
+            # Users are also woken up once the next requests loaded from datasets start
+            for start, _ in user._loaded_requests.get(str(app.id), []):
+                if start > next_step + 1:
+                    wakeup = min(wakeup, start - 1)
+                    break
+
+        # Users are woken up once their location changes or once their mobility model must extend their mobility trace
+        trace = user.coordinates_trace
+        move_step = next_step
+        while move_step < len(trace) and move_step < wakeup and trace[move_step] == user.coordinates:
+            move_step = trace.get_run_end(index=move_step)
+
+        return min(wakeup, move_step)
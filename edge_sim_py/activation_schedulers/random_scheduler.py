@@ -20,19 +20,47 @@ class RandomScheduler(MesaBaseScheduler):
     is equivalent to the NetLogo 'ask agents...' and is generally the default behavior for an ABM.
     """
 
+    def __init__(self, model: object):
+        """Creates a RandomScheduler object.
+
+        Args:
+            model (object): Simulation model.
+        """
+        MesaBaseScheduler.__init__(self, model)
+
+        # Agents that were not activated in the current step yet (None outside steps)
+        self._activation_pool: list = None
+
+    def add(self, agent: object):
+        """Adds an agent to the schedule. Agents added during a step are activated in that same step.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.add(self, agent)
+
+        if self._activation_pool is not None:
+            self._activation_pool.append(agent)
+
     def step(self) -> None:
         """Defines what happens at each step of the simulation model."""
-        agents = list(self._agents.values())
-        agents = random.sample(agents, len(agents))
+        self._activation_pool = list(self._agents.values())
+
+        while len(self._activation_pool) > 0:
+            # Drawing (and removing) a random agent from the pool of agents not yet activated
+            index = random.randrange(len(self._activation_pool))
+            self._activation_pool[index], self._activation_pool[-1] = self._activation_pool[-1], self._activation_pool[index]
+            agent = self._activation_pool.pop()
+
+            # Skipping agents removed from the schedule or already activated in the current step
+            if self._agents.get(agent.unique_id) is not agent or was_activated(agent, self.steps):
+                continue
 
-        while any([not was_activated(agent, self.steps) for agent in agents]):
-            agent = next((agent for agent in agents if not was_activated(agent, self.steps)), None)
             agent.last_activation = self.steps
 
             agent.step()
 
-            agents = list(self._agents.values())
-            agents = random.sample(agents, len(agents))
+        self._activation_pool = None
 
         # Advancing simulation
         self.steps += 1
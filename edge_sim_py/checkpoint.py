@@ -0,0 +1,396 @@
+"""Contains the functionality used to save the state of a running simulation to disk and to restore it later.
+
+Checkpoints store the whole object graph of the simulation (components, network topology, agent activation scheduler, metrics kept
+in memory, and the state of random number generators) as msgpack data. Objects referenced from multiple places (e.g., network
+links stored in both directions of the topology adjacency, or lists shared by components) are stored once, so that references are
+preserved when checkpoints are restored.
+
+Functions and classes referenced by components (e.g., user mobility models) are stored by name. Thus, they must be importable (or
+registered as user-defined functions in the Simulator) when checkpoints are restored. The callables passed to the Simulator
+constructor (e.g., the stopping criterion and the resource management algorithm) are not stored, as the Simulator object that
+restores a checkpoint keeps its own.
+"""
+
+# Python libraries
+import os
+import random
+import struct
+import msgpack
+import importlib
+
+# Version of the checkpoint format
+CHECKPOINT_VERSION = 1
+
+# Simulator attributes defined by the user when creating the Simulator object (kept as is when checkpoints are restored)
+SIMULATOR_SETTINGS = [
+    "id",
+    "running",
+    "stopping_criterion",
+    "resource_management_algorithm",
+    "network_flow_scheduling_algorithm",
+    "user_defined_functions",
+    "dump_interval",
+    "logs_directory",
+    "metrics_writer",
+    "_metrics_writer",
+]
+
+# Codes of the msgpack extension types used to represent references and values with no msgpack counterpart
+REFERENCE = 1
+TUPLE = 2
+CALLABLE = 3
+MODEL = 4
+
+INDEX = struct.Struct(">I")
+
+
+def save_checkpoint(simulator: object, file_path: str):
+    """Saves the state of a simulation to a checkpoint file.
+
+    Args:
+        simulator (object): Simulator object.
+        file_path (str): Checkpoint file path.
+    """
+    # Importing the ComponentManager class here to avoid circular imports
+    from edge_sim_py.component_manager import ComponentManager
+
+    encoder = _Encoder(model=simulator)
+
+    components = {}
+    for component_class in ComponentManager.__subclasses__():
+        if component_class is not type(simulator):
+            components[component_class.__name__] = {
+                "class": encoder.encode(component_class),
+                "instances": encoder.encode(component_class._instances),
+                "object_count": component_class._object_count,
+            }
+
+    # Files already written by the metrics writer (so that the restored simulation appends new metrics to them)
+    metrics_writer = simulator._metrics_writer
+    metrics_files = sorted(metrics_writer._files) if metrics_writer is not None else []
+
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "simulator": encoder.encode({key: value for key, value in vars(simulator).items() if key not in SIMULATOR_SETTINGS}),
+        "components": components,
+        "random_state": encoder.encode(random.getstate()),
+        "metrics_files": metrics_files,
+        "objects": encoder.get_objects(),
+    }
+
+    directory = os.path.dirname(file_path)
+    if directory != "" and not os.path.exists(f"{directory}/"):
+        os.makedirs(directory)
+
+    # Writing the checkpoint through a temporary file, so that an interrupted checkpoint never replaces a complete one
+    with open(f"{file_path}.tmp", "wb") as output_file:
+        output_file.write(msgpack.packb(checkpoint))
+    os.replace(f"{file_path}.tmp", file_path)
+
+
+def load_checkpoint(simulator: object, file_path: str):
+    """Restores the state of a simulation from a checkpoint file, replacing the components of the current simulation.
+
+    Args:
+        simulator (object): Simulator object that will continue the simulation.
+        file_path (str): Checkpoint file path.
+    """
+    # Importing the ComponentManager class here to avoid circular imports
+    from edge_sim_py.component_manager import ComponentManager
+
+    with open(file_path, "rb") as input_file:
+        checkpoint = msgpack.unpackb(input_file.read(), strict_map_key=False)
+
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise Exception(f"Unsupported checkpoint version {checkpoint.get('version')}. Supported version is {CHECKPOINT_VERSION}.")
+
+    decoder = _Decoder(model=simulator, objects=checkpoint["objects"])
+
+    # Restoring the list of instances of each component class
+    for class_name, state in checkpoint["components"].items():
+        component_class = decoder.decode(state["class"])
+        component_class._instances = decoder.decode(state["instances"])
+        component_class._object_count = state["object_count"]
+        component_class._reset_indexes()
+
+    # Restoring the simulation state
+    for key, value in decoder.decode(checkpoint["simulator"]).items():
+        setattr(simulator, key, value)
+
+    random.setstate(decoder.decode(checkpoint["random_state"]))
+
+    # Resuming the metrics writer so that metrics files written before the checkpoint are not overwritten
+    simulator._metrics_writer = None
+    if len(checkpoint["metrics_files"]) > 0:
+        simulator._metrics_writer = simulator.metrics_writer(logs_directory=simulator.logs_directory)
+        simulator._metrics_writer._files = set(checkpoint["metrics_files"])
+
+    ComponentManager._ComponentManager__model = simulator
+
+
+class _Encoder:
+    """Converts an object graph into msgpack-friendly data. Lists, dictionaries, sets, and objects are stored in a table of objects
+    and replaced by references to their position in that table."""
+
+    def __init__(self, model: object):
+        """Creates an _Encoder object.
+
+        Args:
+            model (object): Simulator object (stored as a special reference, as it is replaced by the Simulator that restores the checkpoint).
+        """
+        self.model = model
+
+        # Table of objects and position of each object in the table (indexed by the object's identity)
+        self.objects = []
+        self.references = {}
+
+        # Objects whose contents are yet to be encoded
+        self.pending = []
+
+    def encode(self, value: object) -> object:
+        """Encodes a value.
+
+        Args:
+            value (object): Value to be encoded.
+
+        Returns:
+            object: Encoded value.
+        """
+        value_type = type(value)
+
+        if value is None or value_type in (bool, int, float, str, bytes):
+            return value
+
+        # Converting subclasses of built-in types (e.g., NumPy floats) into their base types
+        for base_type in (bool, int, float, str):
+            if isinstance(value, base_type):
+                return base_type(value)
+
+        if value is self.model:
+            return msgpack.ExtType(MODEL, b"")
+
+        if value_type is tuple:
+            return msgpack.ExtType(TUPLE, msgpack.packb([self.encode(item) for item in value]))
+
+        if isinstance(value, type) or callable(value) and hasattr(value, "__qualname__"):
+            return msgpack.ExtType(CALLABLE, _get_callable_name(value).encode())
+
+        index = self.references.get(id(value))
+        if index is None:
+            index = len(self.objects)
+            self.references[id(value)] = index
+            self.objects.append(None)
+            self.pending.append((index, value))
+
+        return msgpack.ExtType(REFERENCE, INDEX.pack(index))
+
+    def get_objects(self) -> list:
+        """Encodes the contents of the objects referenced so far and returns the table of objects.
+
+        Returns:
+            list: Table of objects.
+        """
+        while len(self.pending) > 0:
+            index, value = self.pending.pop()
+            self.objects[index] = self._encode_object(value=value)
+
+        return self.objects
+
+    def _encode_object(self, value: object) -> list:
+        """Encodes the contents of an object stored in the table of objects.
+
+        Args:
+            value (object): Object to be encoded.
+
+        Returns:
+            list: Encoded object, formatted as [kind, class name, items, attributes].
+        """
+        value_type = type(value)
+
+        if value_type is list:
+            return ["list", None, [self.encode(item) for item in value], None]
+
+        if value_type is dict:
+            return ["dict", None, [[self.encode(key), self.encode(item)] for key, item in value.items()], None]
+
+        if value_type is set:
+            return ["set", None, [self.encode(item) for item in value], None]
+
+        if value_type is random.Random:
+            return ["random", None, self.encode(value.getstate()), None]
+
+        # Encoding objects (including objects from classes that extend dictionaries, such as network links)
+        attributes = []
+        for key, item in _get_attributes(value=value).items():
+            # Skipping views cached by NetworkX graphs, which are recreated on demand
+            if type(item).__module__.startswith("networkx.classes"):
+                continue
+            attributes.append([key, self.encode(item)])
+
+        # Encoding the items of objects that extend dictionaries (items shared with attributes, such as link properties, are encoded as references)
+        items = [[self.encode(key), self.encode(item)] for key, item in dict.items(value)] if isinstance(value, dict) else None
+
+        return ["object", _get_callable_name(value_type), items, attributes]
+
+
+class _Decoder:
+    """Rebuilds an object graph from data created by the _Encoder class."""
+
+    def __init__(self, model: object, objects: list):
+        """Creates a _Decoder object.
+
+        Args:
+            model (object): Simulator object that replaces the Simulator referenced in the checkpoint.
+            objects (list): Table of objects.
+        """
+        self.model = model
+        self.callables = {}
+
+        # Creating empty objects first, so that references can be resolved regardless of the order objects are filled
+        self.objects = [self._create_object(kind=kind, class_name=class_name) for kind, class_name, _, _ in objects]
+
+        # Filling objects before containers, as containers may hold objects whose hashes depend on their attributes
+        for position in ["object", "random", "list", "dict", "set"]:
+            for obj, (kind, _, items, attributes) in zip(self.objects, objects):
+                if kind == position:
+                    self._fill_object(obj=obj, kind=kind, items=items, attributes=attributes)
+
+    def decode(self, value: object) -> object:
+        """Decodes a value.
+
+        Args:
+            value (object): Encoded value.
+
+        Returns:
+            object: Decoded value.
+        """
+        if type(value) is not msgpack.ExtType:
+            return value
+
+        if value.code == REFERENCE:
+            return self.objects[INDEX.unpack(value.data)[0]]
+
+        if value.code == TUPLE:
+            return tuple(self.decode(item) for item in msgpack.unpackb(value.data, strict_map_key=False))
+
+        if value.code == CALLABLE:
+            return self._resolve_callable(name=value.data.decode())
+
+        if value.code == MODEL:
+            return self.model
+
+        raise Exception(f"Unknown value type {value.code} found in checkpoint.")
+
+    def _create_object(self, kind: str, class_name: str) -> object:
+        """Creates an empty object.
+
+        Args:
+            kind (str): Object kind ("list", "dict", "set", "random", or "object").
+            class_name (str): Object class name.
+
+        Returns:
+            object: Empty object.
+        """
+        if kind == "list":
+            return []
+        if kind == "dict":
+            return {}
+        if kind == "set":
+            return set()
+        if kind == "random":
+            return random.Random()
+
+        object_class = self._resolve_callable(name=class_name)
+        return object_class.__new__(object_class)
+
+    def _fill_object(self, obj: object, kind: str, items: list, attributes: list):
+        """Fills an empty object with its decoded contents.
+
+        Args:
+            obj (object): Empty object.
+            kind (str): Object kind ("list", "dict", "set", "random", or "object").
+            items (list): Encoded items.
+            attributes (list): Encoded attributes.
+        """
+        if kind == "list":
+            obj.extend(self.decode(item) for item in items)
+
+        elif kind == "set":
+            obj.update(self.decode(item) for item in items)
+
+        elif kind == "random":
+            obj.setstate(self.decode(items))
+
+        elif kind == "dict":
+            for key, item in items:
+                obj[self.decode(key)] = self.decode(item)
+
+        else:
+            for key, item in attributes:
+                object.__setattr__(obj, key, self.decode(item))
+
+            if items is not None:
+                for key, item in items:
+                    dict.__setitem__(obj, self.decode(key), self.decode(item))
+
+    def _resolve_callable(self, name: str) -> object:
+        """Finds a function or class based on its name.
+
+        Args:
+            name (str): Name formatted as "module:qualified name".
+
+        Returns:
+            object: Function or class.
+        """
+        if name not in self.callables:
+            module_name, qualified_name = name.split(":")
+
+            try:
+                obj = importlib.import_module(module_name)
+                for attribute in qualified_name.split("."):
+                    obj = getattr(obj, attribute)
+            except (ImportError, AttributeError):
+                # Falling back to the functions registered in the Simulator (e.g., user-defined functions)
+                simulator_module = importlib.import_module(type(self.model).__module__)
+                obj = vars(simulator_module).get(qualified_name)
+
+                if obj is None:
+                    raise Exception(f"Could not find '{name}' while restoring the checkpoint. Please make sure it can be imported.")
+
+            self.callables[name] = obj
+
+        return self.callables[name]
+
+
+def _get_callable_name(value: object) -> str:
+    """Gets the name used to store a function or class in checkpoints.
+
+    Args:
+        value (object): Function or class.
+
+    Returns:
+        str: Name formatted as "module:qualified name".
+    """
+    if "<" in value.__qualname__:
+        raise Exception(f"Could not store {value} in the checkpoint. Only functions and classes defined at module level can be stored.")
+
+    return f"{value.__module__}:{value.__qualname__}"
+
+
+def _get_attributes(value: object) -> dict:
+    """Gets the attributes of an object, including attributes stored in slots.
+
+    Args:
+        value (object): Object.
+
+    Returns:
+        dict: Object attributes.
+    """
+    attributes = dict(vars(value)) if hasattr(value, "__dict__") else {}
+
+    for object_class in type(value).__mro__:
+        for slot in object_class.__dict__.get("__slots__", ()):
+            if slot not in ("__dict__", "__weakref__") and hasattr(value, slot):
+                attributes[slot] = getattr(value, slot)
+
+    return attributes
@@ -6,9 +6,41 @@ Example:
     'Service.find_by_id(3)' allows you to find the Service object that has id attribute = 3
 """
 
-# Python libraries
-import os
-import json
+# EdgeSimPy components
+from edge_sim_py.dataset_io import DatasetWriter
+
+SUPPORTED_DATASET_FORMATS = ["json", "ndjson", "msgpack"]
+
+
+class _InstanceIndex:
+    """Hash index that maps the values of a given attribute to the first instance (in creation order) holding them."""
+
+    __slots__ = ("instances", "synced", "entries")
+
+    def __init__(self, instances: list):
+        """Creates an _InstanceIndex object.
+
+        Args:
+            instances (list): List of instances of the class being indexed.
+        """
+        self.instances = instances
+        self.synced = 0
+        self.entries = {}
+
+
+def _hashable(value: object) -> object:
+    """Converts lists (e.g., coordinates loaded from JSON datasets) into tuples so that they can be used as index keys.
+
+    Args:
+        value (object): Attribute value.
+
+    Returns:
+        object: Hashable representation of the value.
+    """
+    if type(value) == list:
+        return tuple(_hashable(item) for item in value)
+
+    return value
 
 
 class ComponentManager:
@@ -16,6 +48,9 @@ class ComponentManager:
 
     __model = None
 
+    # Attributes (besides "id", which is always indexed) whose values are indexed to speed up "find_by" lookups
+    _indexed_attributes: tuple = ()
+
     def __str__(self) -> str:
         """Defines how the object is represented inside print statements.
 
@@ -34,30 +69,57 @@ class ComponentManager:
 
     @classmethod
     def export_scenario(
-        cls, ignore_list: list = ["Simulator", "Topology", "NetworkFlow", "DataPacket"], save_to_file: bool = False, file_name: str = "dataset"
+        cls,
+        ignore_list: list = ["Simulator", "Topology", "NetworkFlow", "DataPacket"],
+        save_to_file: bool = False,
+        file_name: str = "dataset",
+        file_format: str = "json",
+        compress: bool = False,
+        keep_in_memory: bool = True,
     ) -> dict:
         """Exports metadata about the simulation model to a Python dictionary. If the "save_to_file" attribute is set to True, the
-        external dataset file generated is saved inside the "datasets/" directory by default.
+        external dataset file generated is saved inside the "datasets/" directory by default. Components are written to the file as
+        soon as they are serialized (see the "edge_sim_py.dataset_io" module), and the file can be loaded by "Simulator.initialize()".
 
         Args:
             ignore_list (list, optional): List of entities that will not be included in the output dict. Defaults to ["Simulator", "Topology", "NetworkFlow"].
             save_to_file (bool, optional): Attribute that tells the method if it needs to save the scenario to an external file. Defaults to False.
             file_name (str, optional): Output file name. Defaults to "dataset".
+            file_format (str, optional): Output file format. Valid options: "json", "ndjson", and "msgpack". Defaults to "json".
+            compress (bool, optional): Whether the output file is compressed with gzip. Defaults to False.
+            keep_in_memory (bool, optional): Whether the exported scenario is kept in memory and returned. Large scenarios saved to
+                files can skip it, so that components are never held in memory all at once. Defaults to True.
 
         Returns:
-            scenario (dict): Python dictionary representing the simulation model.
+            scenario (dict): Python dictionary representing the simulation model (empty if "keep_in_memory" is False).
         """
-        scenario = {}
+        if file_format not in SUPPORTED_DATASET_FORMATS:
+            raise Exception(f"Unsupported dataset format {file_format}. Supported dataset formats are {SUPPORTED_DATASET_FORMATS}.")
 
-        # Creating the "datasets" directory if it doesn't exists
-        if not os.path.exists("datasets/"):
-            os.makedirs("datasets")
+        scenario = {}
 
-        for component in ComponentManager.__subclasses__():
-            if component.__name__ not in ignore_list:
-                scenario[component.__name__] = [instance._to_dict() for instance in component._instances]
-                with open(f"datasets/{file_name}.json", "w", encoding="UTF-8") as output_file:
-                    json.dump(scenario, output_file, indent=4)
+        writer = None
+        if save_to_file:
+            writer = DatasetWriter(file_path=f"datasets/{file_name}.{file_format}{'.gz' if compress else ''}")
+
+        try:
+            for component in ComponentManager.__subclasses__():
+                if component.__name__ not in ignore_list:
+                    if keep_in_memory:
+                        scenario[component.__name__] = []
+                    if writer is not None:
+                        writer.write(class_name=component.__name__)
+
+                    for instance in component._instances:
+                        specification = instance._to_dict()
+
+                        if keep_in_memory:
+                            scenario[component.__name__].append(specification)
+                        if writer is not None:
+                            writer.write(class_name=component.__name__, specification=specification)
+        finally:
+            if writer is not None:
+                writer.close()
 
         return scenario
 
@@ -88,6 +150,9 @@ class ComponentManager:
         Returns:
             object: Class object.
         """
+        if attribute_name == "id" or attribute_name in cls._indexed_attributes:
+            return cls._find_indexed(attribute_name=attribute_name, attribute_value=attribute_value)
+
         class_object = next((obj for obj in cls._instances if getattr(obj, attribute_name) == attribute_value), None)
         return class_object
 
@@ -101,9 +166,77 @@ class ComponentManager:
         Returns:
             class_object (object): Class object found.
         """
-        class_object = next((obj for obj in cls._instances if obj.id == obj_id), None)
+        class_object = cls._find_indexed(attribute_name="id", attribute_value=obj_id)
         return class_object
 
+    @classmethod
+    def _get_index(cls, attribute_name: str) -> _InstanceIndex:
+        """Gets the up-to-date hash index of a given attribute. Instances created since the last lookup are appended to the index,
+        whereas the index is rebuilt from scratch whenever the list of instances is replaced (e.g., by "Simulator.initialize()").
+
+        Args:
+            attribute_name (str): Attribute name.
+
+        Returns:
+            index (_InstanceIndex): Attribute index.
+        """
+        indexes = cls.__dict__.get("_indexes")
+        if indexes is None:
+            indexes = {}
+            setattr(cls, "_indexes", indexes)
+
+        index = indexes.get(attribute_name)
+        if index is None or index.instances is not cls._instances or index.synced > len(cls._instances):
+            index = _InstanceIndex(instances=cls._instances)
+            indexes[attribute_name] = index
+
+        # Indexing the instances created after the last synchronization
+        if index.synced < len(index.instances):
+            for obj in index.instances[index.synced :]:
+                try:
+                    index.entries.setdefault(_hashable(getattr(obj, attribute_name)), obj)
+                except (AttributeError, TypeError):
+                    pass
+            index.synced = len(index.instances)
+
+        return index
+
+    @classmethod
+    def _find_indexed(cls, attribute_name: str, attribute_value: object) -> object:
+        """Finds objects from a given class through the hash index of an attribute. As attributes can be freely reassigned, indexed
+        entries are validated against the object's current value, falling back to a linear scan (that repairs the index) when needed.
+
+        Args:
+            attribute_name (str): Attribute name.
+            attribute_value (object): Attribute value.
+
+        Returns:
+            class_object (object): Class object found.
+        """
+        index = cls._get_index(attribute_name=attribute_name)
+
+        try:
+            key = _hashable(attribute_value)
+            class_object = index.entries.get(key)
+        except TypeError:
+            key = None
+            class_object = None
+
+        if class_object is not None and getattr(class_object, attribute_name) == attribute_value:
+            return class_object
+
+        class_object = next((obj for obj in cls._instances if getattr(obj, attribute_name) == attribute_value), None)
+
+        if class_object is not None and key is not None:
+            index.entries[key] = class_object
+
+        return class_object
+
+    @classmethod
+    def _reset_indexes(cls):
+        """Drops the attribute indexes of a given class."""
+        setattr(cls, "_indexes", {})
+
     @classmethod
     def all(cls) -> list:
         """Returns the list of created objects of a given class.
@@ -154,3 +287,15 @@ class ComponentManager:
             raise Exception(f"Object {obj} is not in the list of instances of the '{cls.__name__}' class.")
 
         cls._instances.remove(obj)
+
+        # Removing the object from the attribute indexes of its class
+        for attribute_name, index in cls.__dict__.get("_indexes", {}).items():
+            if index.instances is cls._instances and index.synced > 0:
+                index.synced -= 1
+
+                try:
+                    key = _hashable(getattr(obj, attribute_name))
+                    if index.entries.get(key) is obj:
+                        del index.entries[key]
+                except (AttributeError, TypeError):
+                    pass
@@ -19,6 +19,9 @@ from .edge_server import EdgeServer
 # Network flow scheduling algorithms
 from .flow_scheduling import *
 
+# Analytical latency models
+from .latency_models import *
+
 # User mobility models
 from .mobility_models import *
 
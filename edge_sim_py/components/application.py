@@ -51,6 +51,10 @@ class Application(ComponentManager, Agent):
         # List of data packets generated by the application for each user
         self._user_data_packets: dict[str, list["DataPacket"]] = {}
 
+        # Bulk data packets registered at a given step, indexed by their aggregation keys (see "_register_datapacket()")
+        self._bulk_data_packets: dict[tuple, "DataPacket"] = {}
+        self._bulk_data_packets_step = None
+
         # Model-specific attributes (defined inside the model's "initialize()" method)
         self.model = None
         self.unique_id = None
@@ -85,7 +89,7 @@ class Application(ComponentManager, Agent):
             "Label": self.label,
             "Services": [service.id for service in self.services],
             "Users": [user.id for user in self.users],
-            "Data packets": {user_id: [dp.id for dp in dp_list] for user_id, dp_list in self._user_data_packets.items()},
+            "Data packets": {user_id: [dp._get_packet_id(user_id=user_id) for dp in dp_list] for user_id, dp_list in self._user_data_packets.items()},
         }
 
         return metrics
@@ -108,20 +112,39 @@ class Application(ComponentManager, Agent):
 
         return self
 
-    def _register_datapacket(self, user: "User", size: int) -> "DataPacket":
-        """Registers a data packet generated by the application for a given user.
+    def _register_datapacket(self, user: "User", size: int, aggregation_key: tuple = None) -> "DataPacket":
+        """Registers a data packet generated by the application for a given user. Data packets registered at the same step with the
+        same size and aggregation key (e.g., the communication path used by the data packets) are merged into a bulk data packet. As
+        users generate at most one data packet per application at each step, bulk data packets only merge data packets from different users.
 
         Args:
             user (User): User object.
             size (int): Size of the data packet in bytes.
+            aggregation_key (tuple, optional): Aggregation key. Defaults to None (the data packet is not aggregated).
 
         Returns:
-            object: Created DataPacket object.
+            object: Created DataPacket object (or bulk data packet that the data packet joined).
         """
         if user not in self.users or self not in user.applications:
             raise ValueError("Connection between application users is not allowed.")
 
-        dp = DataPacket(user=user, application=self, size=size)
+        dp = None
+        if aggregation_key is not None:
+            # Bulk data packets only accept data packets registered at the step they were created
+            if self._bulk_data_packets_step != self.model.schedule.steps:
+                self._bulk_data_packets = {}
+                self._bulk_data_packets_step = self.model.schedule.steps
+
+            aggregation_key = (size, aggregation_key)
+            dp = self._bulk_data_packets.get(aggregation_key)
+            if dp is not None:
+                dp._add_packet(user=user)
+
+        if dp is None:
+            dp = DataPacket(user=user, application=self, size=size)
+
+            if aggregation_key is not None:
+                self._bulk_data_packets[aggregation_key] = dp
 
         if str(user.id) not in self._user_data_packets:
             self._user_data_packets[str(user.id)] = []
@@ -1,11 +1,182 @@
 """Contains base-station-related functionality."""
 
 # EdgeSimPy components
-from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.component_manager import ComponentManager, _hashable
 
 # Mesa modules
 from mesa import Agent  # type: ignore
 
+# Python libraries
+import math
+
+
+class _SpatialIndex:
+    """Hash grid that groups base stations by the square cell of the map that contains their coordinates, so that nearest-neighbor
+    and within-radius queries only inspect the cells around the queried coordinates. Cells are sized so that each cell holds one
+    base station on average, and base stations created after the grid is built are added to it incrementally.
+    """
+
+    __slots__ = ("instances", "synced", "indexed", "cell_size", "cells", "bounds")
+
+    def __init__(self, instances: list):
+        """Creates a _SpatialIndex object.
+
+        Args:
+            instances (list): List of base stations being indexed.
+        """
+        self.instances = instances
+        self.synced = 0
+        self.cells = {}
+
+        # Memory addresses of the base stations already inspected by "sync()" (including those that had no coordinates by then)
+        self.indexed = set()
+
+        # Sizing cells based on the area covered by the base stations
+        points = [(obj.coordinates[0], obj.coordinates[1]) for obj in instances if obj.coordinates is not None]
+        self.cell_size = 1
+        if len(points) > 0:
+            width = max(x for x, _ in points) - min(x for x, _ in points)
+            height = max(y for _, y in points) - min(y for _, y in points)
+            if width > 0 and height > 0:
+                self.cell_size = math.sqrt(width * height / len(points))
+            elif width + height > 0:
+                self.cell_size = (width + height) / len(points)
+
+        # Range of cells that hold base stations, formatted as [min. column, min. row, max. column, max. row]
+        self.bounds = None
+
+    def get_cell(self, coordinates: tuple) -> tuple:
+        """Gets the cell of the grid that contains a given pair of coordinates.
+
+        Args:
+            coordinates (tuple): Coordinates.
+
+        Returns:
+            tuple: Column and row of the cell.
+        """
+        return (math.floor(coordinates[0] / self.cell_size), math.floor(coordinates[1] / self.cell_size))
+
+    def sync(self):
+        """Adds the base stations created since the last synchronization to the grid. Entries store the position of base stations
+        in the list of instances, which breaks ties between base stations equally distant from queried coordinates.
+        """
+        for position in range(self.synced, len(self.instances)):
+            obj = self.instances[position]
+            self.indexed.add(id(obj))
+            if obj.coordinates is None:
+                continue
+
+            column, row = self.get_cell(coordinates=obj.coordinates)
+            self.cells.setdefault((column, row), []).append((obj.coordinates[0], obj.coordinates[1], position, obj))
+
+            if self.bounds is None:
+                self.bounds = [column, row, column, row]
+            else:
+                self.bounds = [min(self.bounds[0], column), min(self.bounds[1], row), max(self.bounds[2], column), max(self.bounds[3], row)]
+
+        self.synced = len(self.instances)
+
+    def nearest(self, coordinates: tuple) -> object:
+        """Finds the base station closest to a given pair of coordinates. Cells are inspected in rings of increasing distance
+        around the cell that contains the coordinates, stopping once no unvisited cell can hold a closer base station.
+
+        Args:
+            coordinates (tuple): Coordinates.
+
+        Returns:
+            object: Closest base station (None if there are no base stations with coordinates).
+        """
+        if self.bounds is None:
+            return None
+
+        x, y = coordinates[0], coordinates[1]
+        column, row = self.get_cell(coordinates=coordinates)
+
+        # Rings closer than the nearest cell that holds base stations are empty, and rings beyond the farthest one are not needed
+        first_ring = max(self.bounds[0] - column, column - self.bounds[2], self.bounds[1] - row, row - self.bounds[3], 0)
+        last_ring = max(column - self.bounds[0], self.bounds[2] - column, row - self.bounds[1], self.bounds[3] - row, 0)
+
+        best = None
+        for ring in range(first_ring, last_ring + 1):
+            # Base stations in cells beyond the current ring are more than "ring * cell_size" away from the coordinates
+            if best is not None and best[0] <= (ring - 1) * self.cell_size:
+                break
+
+            for cell in _get_ring_cells(column=column, row=row, ring=ring, bounds=self.bounds):
+                for station_x, station_y, position, obj in self.cells.get(cell, ()):
+                    candidate = (math.hypot(station_x - x, station_y - y), position, obj)
+                    if best is None or candidate[:2] < best[:2]:
+                        best = candidate
+
+        return best[2] if best is not None else None
+
+    def within_radius(self, coordinates: tuple, radius: float) -> list:
+        """Finds the base stations located within a given distance from a pair of coordinates.
+
+        Args:
+            coordinates (tuple): Coordinates.
+            radius (float): Maximum distance.
+
+        Returns:
+            list: Base stations within the radius, sorted by their distance to the coordinates.
+        """
+        if self.bounds is None:
+            return []
+
+        x, y = coordinates[0], coordinates[1]
+        min_column, min_row = self.get_cell(coordinates=(x - radius, y - radius))
+        max_column, max_row = self.get_cell(coordinates=(x + radius, y + radius))
+
+        # Only cells that hold base stations are inspected
+        min_column, min_row = max(min_column, self.bounds[0]), max(min_row, self.bounds[1])
+        max_column, max_row = min(max_column, self.bounds[2]), min(max_row, self.bounds[3])
+
+        if (max_column - min_column + 1) * (max_row - min_row + 1) > len(self.cells):
+            cells = [cell for cell in self.cells if min_column <= cell[0] <= max_column and min_row <= cell[1] <= max_row]
+        else:
+            cells = [(column, row) for column in range(min_column, max_column + 1) for row in range(min_row, max_row + 1)]
+
+        matches = []
+        for cell in cells:
+            for station_x, station_y, position, obj in self.cells.get(cell, ()):
+                distance = math.hypot(station_x - x, station_y - y)
+                if distance <= radius:
+                    matches.append((distance, position, obj))
+
+        return [obj for _, _, obj in sorted(matches, key=lambda match: match[:2])]
+
+
+def _get_ring_cells(column: int, row: int, ring: int, bounds: list) -> list:
+    """Gets the cells whose Chebyshev distance to a given cell equals a given ring number, skipping cells outside a range of cells.
+
+    Args:
+        column (int): Column of the central cell.
+        row (int): Row of the central cell.
+        ring (int): Ring number.
+        bounds (list): Range of cells, formatted as [min. column, min. row, max. column, max. row].
+
+    Returns:
+        list: Cells of the ring within the range.
+    """
+    if ring == 0:
+        return [(column, row)] if bounds[0] <= column <= bounds[2] and bounds[1] <= row <= bounds[3] else []
+
+    cells = []
+
+    # Top and bottom sides of the ring (including its corners)
+    columns = range(max(column - ring, bounds[0]), min(column + ring, bounds[2]) + 1)
+    for side_row in [row - ring, row + ring]:
+        if bounds[1] <= side_row <= bounds[3]:
+            cells.extend((side_column, side_row) for side_column in columns)
+
+    # Left and right sides of the ring (excluding its corners)
+    rows = range(max(row - ring + 1, bounds[1]), min(row + ring - 1, bounds[3]) + 1)
+    for side_column in [column - ring, column + ring]:
+        if bounds[0] <= side_column <= bounds[2]:
+            cells.extend((side_column, side_row) for side_row in rows)
+
+    return cells
+
 
 class BaseStation(ComponentManager, Agent):
     """Class that represents a base station."""
@@ -14,6 +185,12 @@ class BaseStation(ComponentManager, Agent):
     _instances: list["BaseStation"] = []
     _object_count = 0
 
+    # Attributes indexed to speed up lookups (e.g., base station handoffs based on user coordinates)
+    _indexed_attributes = ("coordinates",)
+
+    # Hash grid that speeds up nearest-neighbor and within-radius queries (built on demand by "_get_spatial_index()")
+    _spatial_index = None
+
     def __init__(self, obj_id: int | None = None):
         """Creates a BaseStation object.
 
@@ -67,6 +244,94 @@ class BaseStation(ComponentManager, Agent):
         }
         return dictionary
 
+    @property
+    def coordinates(self) -> tuple:
+        """Coordinates of the base station.
+
+        Returns:
+            tuple: Base station coordinates.
+        """
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, value: tuple):
+        """Defines the coordinates of the base station. The spatial index of its class is dropped if it already inspected the base
+        station (as it may hold its previous position), whereas base stations created after the index was built are added to it later.
+
+        Args:
+            value (tuple): Base station coordinates.
+        """
+        self._coordinates = value
+
+        index = self.__class__.__dict__.get("_spatial_index")
+        if index is not None and id(self) in index.indexed:
+            self.__class__._spatial_index = None
+
+    @classmethod
+    def _get_spatial_index(cls) -> _SpatialIndex:
+        """Gets the up-to-date spatial index of the base stations. The index is rebuilt from scratch whenever the list of instances
+        is replaced or shrinks, and base stations created since the last query are added to it.
+
+        Returns:
+            index (_SpatialIndex): Spatial index.
+        """
+        index = cls.__dict__.get("_spatial_index")
+        if index is None or index.instances is not cls._instances or index.synced > len(cls._instances):
+            index = _SpatialIndex(instances=cls._instances)
+            setattr(cls, "_spatial_index", index)
+
+        if index.synced < len(index.instances):
+            index.sync()
+
+        return index
+
+    @classmethod
+    def _reset_indexes(cls):
+        """Drops the attribute indexes and the spatial index of the class."""
+        super()._reset_indexes()
+        setattr(cls, "_spatial_index", None)
+
+    @classmethod
+    def remove(cls, obj: object):
+        """Removes a base station from the list of instances of its class.
+
+        Args:
+            obj (object): Base station to be removed.
+        """
+        super().remove(obj)
+        setattr(cls, "_spatial_index", None)
+
+    @classmethod
+    def find_nearest(cls, coordinates: tuple) -> "BaseStation":
+        """Finds the base station closest to a given pair of coordinates (e.g., to connect users at continuous positions of the map).
+        Base stations located exactly at the coordinates are found through the hash index of the "coordinates" attribute (without
+        falling back to a linear scan when no base station is found there).
+
+        Args:
+            coordinates (tuple): Coordinates.
+
+        Returns:
+            BaseStation: Closest base station (the first one created in case of ties, or None if there are no base stations).
+        """
+        base_station = cls._get_index(attribute_name="coordinates").entries.get(_hashable(coordinates))
+        if base_station is not None and base_station.coordinates == coordinates:
+            return base_station
+
+        return cls._get_spatial_index().nearest(coordinates=coordinates)
+
+    @classmethod
+    def find_within_radius(cls, coordinates: tuple, radius: float) -> list:
+        """Finds the base stations located within a given distance from a pair of coordinates.
+
+        Args:
+            coordinates (tuple): Coordinates.
+            radius (float): Maximum distance.
+
+        Returns:
+            list: Base stations within the radius, sorted by their distance to the coordinates.
+        """
+        return cls._get_spatial_index().within_radius(coordinates=coordinates, radius=radius)
+
     def collect(self) -> dict:
         """Method that collects a set of metrics for the object.
 
@@ -14,6 +14,9 @@ class ContainerLayer(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes indexed to speed up lookups (e.g., finding template objects based on their digest)
+    _indexed_attributes = ("digest",)
+
     def __init__(self, obj_id: int = None, digest: str = "", size: int = 0, instruction: str = "") -> object:
         """Creates an User object.
 
@@ -176,6 +176,10 @@ class ContainerRegistry(ComponentManager, Agent):
                     # Adding the layer to the target server's waiting queue (layers it must download at some point)
                     target_server.waiting_queue.append(layer)
 
+        # Waking up the target server in case the scheduler only activates agents with pending work
+        if hasattr(target_server.model.schedule, "wake"):
+            target_server.model.schedule.wake(agent=target_server)
+
         return registry
 
     def deprovision(self, purge_images: bool = False):
@@ -212,7 +216,7 @@ class ContainerRegistry(ComponentManager, Agent):
 
                     # Removing the unused image from the simulator's agent list and from its class instance list
                     image.model.schedule.remove(image)
-                    image.__class__._instances.remove(image)
+                    image.__class__.remove(image)
 
                 # Removing unused layers
                 for layer in unused_layers:
@@ -223,7 +227,7 @@ class ContainerRegistry(ComponentManager, Agent):
 
                     # Removing the unused layer from the simulator's agent list and from its class instance list
                     layer.model.schedule.remove(layer)
-                    layer.__class__._instances.remove(layer)
+                    layer.__class__.remove(layer)
 
             # Removing relationship between the registry and its server
             self.server.container_registries.remove(self)
@@ -233,4 +237,4 @@ class ContainerRegistry(ComponentManager, Agent):
 
             # Removing the registry
             self.model.schedule.remove(self)
-            self.__class__._instances.remove(self)
+            self.__class__.remove(self)
@@ -1,7 +1,7 @@
 """Contains data packet-related functionality."""
 
 # EdgeSimPy components
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING
 from edge_sim_py.component_manager import ComponentManager
 from edge_sim_py.components.network_flow import NetworkFlow
@@ -16,9 +16,11 @@ if TYPE_CHECKING:
     from edge_sim_py.components.user import User
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LinkHop:
-    """Class that represents a link hop in the data packet's path."""
+    """Class that represents a link hop in the data packet's path. Data packets store their hops as tuples with the fields of this
+    class (in the same order), which are only turned into LinkHop objects on request (see "DataPacket.get_hops()").
+    """
 
     hop_index: int
     link_index: int
@@ -42,6 +44,15 @@ class LinkHop:
     data_output: int
 
 
+# Names of the fields of link hops and positions of the delay fields within the tuples that store the hops of data packets
+LINK_HOP_FIELDS = tuple(field.name for field in fields(LinkHop))
+END_TIME = LINK_HOP_FIELDS.index("end_time")
+QUEUE_DELAY = LINK_HOP_FIELDS.index("queue_delay")
+TRANSMISSION_DELAY = LINK_HOP_FIELDS.index("transmission_delay")
+PROCESSING_DELAY = LINK_HOP_FIELDS.index("processing_delay")
+PROPAGATION_DELAY = LINK_HOP_FIELDS.index("propagation_delay")
+
+
 class DataPacket(ComponentManager, Agent):
     """Class that represents an data packet."""
 
@@ -49,6 +60,9 @@ class DataPacket(ComponentManager, Agent):
     _instances: list["DataPacket"] = []
     _object_count = 0
 
+    # Metrics kept in the compact records of archived data packets (see the "archive" retention policy of the Simulator)
+    _archived_metrics = ("Id", "User", "Application", "Size", "Status", "Queue Delay", "Transmission Delay", "Processing Delay", "Propagation Delay", "Total Delay")
+
     def __init__(self, user: "User", application: "Application", size: int = 1, obj_id: int | None = None):
         """Creates a DataPacket object.
 
@@ -82,6 +96,12 @@ class DataPacket(ComponentManager, Agent):
         # User
         self.user: "User" = user
 
+        # Number of identical data packets represented by the object (see the "data_packet_aggregation" simulator option), users
+        # that generated them, and identifiers of each data packet (the first one is the identifier of the object)
+        self.count = 1
+        self._users: list["User"] = [user]
+        self._ids: list[int] = [self.id]
+
         # Status: active(default), finished, processing, dropped
         self._status = "active"
 
@@ -98,8 +118,12 @@ class DataPacket(ComponentManager, Agent):
         self._processing_output = 0
         self._processing_switch = None
 
-        # Hops
-        self._link_hops: list[LinkHop] = []
+        # Hops (stored as tuples with the fields of LinkHop objects) and running totals of their delays
+        self._link_hops: list[tuple] = []
+        self._queue_delay_total = 0
+        self._transmission_delay_total = 0
+        self._processing_delay_total = 0
+        self._propagation_delay_total = 0
 
         # Current flow
         self._current_flow: "NetworkFlow | None" = None
@@ -119,38 +143,54 @@ class DataPacket(ComponentManager, Agent):
             "user": self.user.id,
             "application": self.application.id,
             "size": self.size,
+            "count": self.count,
             "status": self._status,
             "current_hop": self._current_hop,
             "current_link": self._current_link,
             "is_processing": self._is_processing,
             "processing_remaining_time": self._processing_remaining_time,
             "total_path": [[sw.id for sw in hop] for hop in self._total_path],
-            "hops": [asdict(hop) for hop in self._link_hops],
+            "hops": self._get_hop_dictionaries(),
         }
 
-    def collect(self) -> dict:
-        """Method that collects a set of metrics for the object.
+    def collect(self, fields: list = None) -> dict | list[dict]:
+        """Method that collects a set of metrics for the object. Bulk data packets provide a list with the metrics of each data
+        packet they represent.
+
+        Args:
+            fields (list, optional): Metrics to be collected (the others are not computed). Defaults to None (all metrics).
 
         Returns:
-            metrics (dict): Object metrics.
+            metrics (dict | list[dict]): Object metrics.
         """
+        metric_getters = {
+            "Id": lambda: self.id,
+            "User": lambda: self.user.id,
+            "Application": lambda: self.application.id,
+            "Size": lambda: self.size,
+            "Status": lambda: self._status,
+            "Queue Delay": lambda: self.queue_delay_total,
+            "Transmission Delay": lambda: self.transmission_delay_total,
+            "Processing Delay": lambda: self.processing_delay_total,
+            "Propagation Delay": lambda: self.propagation_delay_total,
+            "Total Delay": lambda: self.total_delay,
+            "Total Path": lambda: [[network_switch.id for network_switch in hop] for hop in self._total_path],
+        }
 
-        total_path = [[network_switch.id for network_switch in hop] for hop in self._total_path]
+        # The details of each hop are only included once the data packet reaches a terminal status
+        if self._status in ["finished", "dropped"]:
+            metric_getters["Hops"] = self._get_hop_dictionaries
 
-        return {
-            "Id": self.id,
-            "User": self.user.id,
-            "Application": self.application.id,
-            "Size": self.size,
-            "Status": self._status,
-            "Queue Delay": self.queue_delay_total,
-            "Transmission Delay": self.transmission_delay_total,
-            "Processing Delay": self.processing_delay_total,
-            "Propagation Delay": self.propagation_delay_total,
-            "Total Delay": self.total_delay,
-            "Total Path": total_path,
-            "Hops": [asdict(hop) for hop in self._link_hops],
-        }
+        metrics = {metric: getter() for metric, getter in metric_getters.items() if fields is None or metric in fields}
+
+        # Expanding the metrics of bulk data packets into the metrics of each data packet they represent
+        if self.count > 1:
+            return [
+                {"Object": f"{self.__class__.__name__}_{packet_id}", **metrics, "Id": packet_id, "User": user.id}
+                for packet_id, user in zip(self._ids, self._users)
+            ]
+
+        return metrics
 
     def get_hops(self) -> list[LinkHop]:
         """Method that returns the data packet's hops.
@@ -158,7 +198,44 @@ class DataPacket(ComponentManager, Agent):
         Returns:
             Data packet's hops.
         """
-        return self._link_hops.copy()
+        return [LinkHop(*link_hop) for link_hop in self._link_hops]
+
+    def _add_packet(self, user: "User"):
+        """Method that adds an identical data packet generated by a given user to a bulk data packet. The data packet receives its
+        own identifier, as if it were a separate DataPacket object.
+
+        Args:
+            user (User): User that generated the data packet.
+        """
+        self.__class__._object_count += 1
+
+        self.count += 1
+        self._users.append(user)
+        self._ids.append(self.__class__._object_count)
+
+    def _get_packet_id(self, user_id: str) -> int:
+        """Method that gets the identifier of the data packet generated by a given user (which differs from the identifier of the
+        object for data packets added to bulk data packets).
+
+        Args:
+            user_id (str): Identifier of the user that generated the data packet.
+
+        Returns:
+            int: Data packet identifier.
+        """
+        for packet_id, user in zip(self._ids, self._users):
+            if str(user.id) == str(user_id):
+                return packet_id
+
+        return self.id
+
+    def _get_hop_dictionaries(self) -> list[dict]:
+        """Method that returns the data packet's hops formatted as dictionaries.
+
+        Returns:
+            list[dict]: Data packet's hops.
+        """
+        return [dict(zip(LINK_HOP_FIELDS, link_hop)) for link_hop in self._link_hops]
 
     def step(self):
         """Method that executes the events involving the object at each time step."""
@@ -211,14 +288,24 @@ class DataPacket(ComponentManager, Agent):
         if link + 1 >= len(self._total_path[hop]):
             raise IndexError("Index link out of range.")
 
+        metadata = {"type": "data_packet", "object": self, "index_hop": hop, "index_link": link}
+
+        # In the cut-through mode, a single flow transfers the data packet through all the remaining links of the hop
+        if getattr(self.model, "packet_switching", "store_and_forward") == "cut_through":
+            path = self._total_path[hop][link:]
+            metadata["index_last_link"] = len(self._total_path[hop]) - 2
+        else:
+            path = self._total_path[hop][link : link + 2]
+
         flow = NetworkFlow(
             topology=self.application.model.topology,
-            source=self._total_path[hop][link],
-            target=self._total_path[hop][link + 1],
-            path=self._total_path[hop][link : link + 2],
+            source=path[0],
+            target=path[-1],
+            path=path,
             start=start_step,
-            data_to_transfer=self.size,
-            metadata={"type": "data_packet", "object": self, "index_hop": hop, "index_link": link},
+            data_to_transfer=self.size * self.count,
+            metadata=metadata,
+            count=self.count,
         )
 
         self._current_flow = flow
@@ -232,7 +319,7 @@ class DataPacket(ComponentManager, Agent):
         """
 
         hop = flow.metadata["index_hop"]
-        link = flow.metadata["index_link"]
+        link = flow.metadata.get("index_last_link", flow.metadata["index_link"])
 
         if hop >= len(self._total_path):
             raise IndexError("Index hop out of range. No more services to process.")
@@ -309,66 +396,102 @@ class DataPacket(ComponentManager, Agent):
             hop = self._current_hop
             link = 0
 
-            link_hop = LinkHop(
-                hop_index=hop,
-                link_index=link,
-                source=self._total_path[hop][link].id,
-                target=self._total_path[hop][link].id,
-                start_time=self._link_hops[-1].end_time,
-                end_time=self._link_hops[-1].end_time + (service.processing_time if service else 0),
-                queue_delay=0,
-                transmission_delay=0,
-                processing_delay=service.processing_time if service else 0,
-                propagation_delay=0,
-                min_bandwidth=0,
-                max_bandwidth=0,
-                avg_bandwidth=0,
-                data_input=self.size,
-                data_output=service.processing_output if service else self.size,
+            start_time = self._link_hops[-1][END_TIME]
+            processing_delay = service.processing_time if service else 0
+
+            # Fields are listed in the order defined by the LinkHop class
+            self._record_link_hop(
+                (
+                    hop,
+                    link,
+                    self._total_path[hop][link].id,
+                    self._total_path[hop][link].id,
+                    start_time,
+                    start_time + processing_delay,
+                    0,
+                    0,
+                    processing_delay,
+                    0,
+                    0,
+                    0,
+                    0,
+                    self.size,
+                    service.processing_output if service else self.size,
+                )
             )
-
-            self._link_hops.append(link_hop)
             return
 
         hop = flow.metadata["index_hop"]
-        link = flow.metadata["index_link"]
-
-        link_hop = LinkHop(
-            hop_index=hop,
-            link_index=link,
-            source=flow.source.id,
-            target=flow.target.id,
-            start_time=flow.start,
-            end_time=flow.end + (service.processing_time if service else 0),
-            queue_delay=flow._queue_delay,
-            transmission_delay=(flow.end - flow.start) - flow._queue_delay,
-            processing_delay=service.processing_time if service else 0,
-            propagation_delay=flow.topology[flow.path[0]][flow.path[1]]["delay"],
-            min_bandwidth=min(flow._bandwidth_history),
-            max_bandwidth=max(flow._bandwidth_history),
-            avg_bandwidth=sum(flow._bandwidth_history) / len(flow._bandwidth_history),
-            data_input=self.size,
-            data_output=service.processing_output if service else self.size,
-        )
+        first_link = flow.metadata["index_link"]
+        number_of_links = len(flow.path) - 1
+
+        # Flows of bulk data packets carry all their data packets at once, so their bandwidth is split among the data packets
+        min_bandwidth = flow._min_bandwidth
+        max_bandwidth = flow._max_bandwidth
+        avg_bandwidth = flow._bandwidth_sum / flow._transfer_steps
+        if self.count > 1:
+            min_bandwidth, max_bandwidth, avg_bandwidth = min_bandwidth / self.count, max_bandwidth / self.count, avg_bandwidth / self.count
+
+        # Flows that cross multiple links (see the "cut_through" packet switching mode) produce one link hop per link. As the data
+        # packet crosses all links at the rate of the flow's bottleneck, the queue and transmission delays are assigned to the first
+        # link, the processing delay is assigned to the last link, and each link adds its own propagation delay. For the same reason,
+        # every link hop reports the bandwidth statistics of the flow (i.e., of its bottleneck) rather than the bandwidth shares
+        # allocated by each link, which are not fully used by the flow in links other than the bottleneck
+        for index in range(number_of_links):
+            is_first_link = index == 0
+            is_last_link = index == number_of_links - 1
+            processing_delay = service.processing_time if service and is_last_link else 0
+
+            # Fields are listed in the order defined by the LinkHop class
+            self._record_link_hop(
+                (
+                    hop,
+                    first_link + index,
+                    flow.path[index].id,
+                    flow.path[index + 1].id,
+                    flow.start,
+                    flow.end + processing_delay,
+                    flow._queue_delay if is_first_link else 0,
+                    (flow.end - flow.start) - flow._queue_delay if is_first_link else 0,
+                    processing_delay,
+                    flow.topology[flow.path[index]][flow.path[index + 1]]["delay"],
+                    min_bandwidth,
+                    max_bandwidth,
+                    avg_bandwidth,
+                    self.size,
+                    service.processing_output if service and is_last_link else self.size,
+                )
+            )
 
+    def _record_link_hop(self, link_hop: tuple):
+        """Method that stores a link hop and adds its delays to the data packet's delay totals.
+
+        Args:
+            link_hop (tuple): Link hop fields, listed in the order defined by the LinkHop class.
+        """
         self._link_hops.append(link_hop)
 
+        self._queue_delay_total += link_hop[QUEUE_DELAY]
+        self._transmission_delay_total += link_hop[TRANSMISSION_DELAY]
+        self._processing_delay_total += link_hop[PROCESSING_DELAY]
+        self._propagation_delay_total += link_hop[PROPAGATION_DELAY]
+
     @property
     def queue_delay_total(self):
-        return sum(h.queue_delay for h in self._link_hops)
+        return self._queue_delay_total
 
     @property
     def transmission_delay_total(self):
-        return sum(h.transmission_delay for h in self._link_hops)
+        return self._transmission_delay_total
 
     @property
     def processing_delay_total(self):
-        return sum(h.processing_delay for h in self._link_hops)
+        return self._processing_delay_total
 
     @property
     def propagation_delay_total(self):
-        return sum(h.propagation_delay for h in self._link_hops)
+        return self._propagation_delay_total
 
     @property
     def total_delay(self):
-        return sum(h.queue_delay + h.transmission_delay + h.processing_delay + h.propagation_delay for h in self._link_hops)
+        return self._queue_delay_total + self._transmission_delay_total + self._processing_delay_total + self._propagation_delay_total
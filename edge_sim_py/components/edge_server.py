@@ -11,7 +11,6 @@ from edge_sim_py.components.container_layer import ContainerLayer
 from mesa import Agent  # type: ignore
 
 # Python libraries
-import networkx as nx  # type: ignore
 import typing
 
 
@@ -141,32 +140,37 @@ class EdgeServer(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Metrics to be collected (the others are not computed). Defaults to None (all metrics).
+
         Returns:
             metrics (dict): Object metrics.
         """
-        metrics = {
-            "Instance ID": self.id,
-            "Coordinates": self.coordinates,
-            "Available": self.available,
-            "CPU": self.cpu,
-            "RAM": self.memory,
-            "Disk": self.disk,
-            "CPU Demand": self.cpu_demand,
-            "RAM Demand": self.memory_demand,
-            "Disk Demand": self.disk_demand,
-            "Ongoing Migrations": self.ongoing_migrations,
-            "Services": [service.id for service in self.services],
-            "Registries": [registry.id for registry in self.container_registries],
-            "Layers": [layer.instruction for layer in self.container_layers],
-            "Images": [image.name for image in self.container_images],
-            "Download Queue": [f.metadata["object"].instruction for f in self.download_queue],
-            "Waiting Queue": [layer.instruction for layer in self.waiting_queue],
-            "Max. Concurrent Layer Downloads": self.max_concurrent_layer_downloads,
-            "Power Consumption": self.get_power_consumption(),
+        metric_getters = {
+            "Instance ID": lambda: self.id,
+            "Coordinates": lambda: self.coordinates,
+            "Available": lambda: self.available,
+            "CPU": lambda: self.cpu,
+            "RAM": lambda: self.memory,
+            "Disk": lambda: self.disk,
+            "CPU Demand": lambda: self.cpu_demand,
+            "RAM Demand": lambda: self.memory_demand,
+            "Disk Demand": lambda: self.disk_demand,
+            "Ongoing Migrations": lambda: self.ongoing_migrations,
+            "Services": lambda: [service.id for service in self.services],
+            "Registries": lambda: [registry.id for registry in self.container_registries],
+            "Layers": lambda: [layer.instruction for layer in self.container_layers],
+            "Images": lambda: [image.name for image in self.container_images],
+            "Download Queue": lambda: [f.metadata["object"].instruction for f in self.download_queue],
+            "Waiting Queue": lambda: [layer.instruction for layer in self.waiting_queue],
+            "Max. Concurrent Layer Downloads": lambda: self.max_concurrent_layer_downloads,
+            "Power Consumption": lambda: self.get_power_consumption(),
         }
+
+        metrics = {metric: getter() for metric, getter in metric_getters.items() if fields is None or metric in fields}
         return metrics
 
     def step(self):
@@ -180,8 +184,7 @@ class EdgeServer(ComponentManager, Agent):
                 # Checking if the registry is hosted on a valid host in the infrastructure and if it has the layer we need to pull
                 if registry.server and any(layer.digest == l.digest for l in registry.server.container_layers):
                     # Selecting a network path to be used to pull the layer from the registry
-                    path = nx.shortest_path(
-                        G=self.model.topology,
+                    path = self.model.topology.get_shortest_path(
                         source=registry.server.base_station.network_switch,
                         target=self.base_station.network_switch,
                     )
@@ -5,3 +5,5 @@ __version__ = "1.1.0"
 # Network flow scheduling algorithms
 from .max_min_fairness import max_min_fairness
 from .equal_share import equal_share
+from .network_wide_max_min_fairness import network_wide_max_min_fairness
+from .vectorized_max_min_fairness import vectorized_max_min_fairness
@@ -1,3 +1,7 @@
+# EdgeSimPy components
+from edge_sim_py.components.flow_scheduling.flow_tracker import FlowTracker
+
+
 def equal_share(topology: object, flows: list):
     """Manages the execution of a equal bandwidth share algorithm for network flows.
 
@@ -5,45 +9,40 @@ def equal_share(topology: object, flows: list):
         topology (object): Network topology object.
         flows (list): List of flows in the topology.
     """
-    # Gathering the links of used by flows that either started or finished or that have more bandwidth than needed
-    links_to_recalculate_bandwidth = []
-    for flow in flows:
-        flow_just_started = len([bw for bw in flow.bandwidth.values() if bw == None]) > 0
-        flow_just_ended = flow.data_to_transfer == 0
-
-        if flow_just_started or flow_just_ended:
-            for i in range(0, len(flow.path) - 1):
-                # Gathering link nodes
-                link = (flow.path[i], flow.path[i + 1])
-
-                # Checking if the link is not already included in "links_to_recalculate_bandwidth"
-                if link not in links_to_recalculate_bandwidth:
-                    links_to_recalculate_bandwidth.append(link)
+    # Gathering the links of used by flows that either started or finished
+    flow_tracker = FlowTracker.get(topology=topology)
+    flow_tracker.update(topology=topology, flows=flows)
+    links_to_recalculate_bandwidth = flow_tracker.get_links_to_recalculate_bandwidth(include_flows_wasting_bandwidth=False)
 
     # Calculating the bandwidth shares for the active flows
-    for link_nodes in links_to_recalculate_bandwidth:
-        link = topology[link_nodes[0]][link_nodes[1]]
-
+    for link in links_to_recalculate_bandwidth:
         # Recalculating bandwidth shares for the flows as some of them have changed
-        flow_demands = [f.data_to_transfer for f in link["active_flows"]]
+        flow_demands = [f.data_to_transfer for f in link.active_flows]
         if sum(flow_demands) > 0:
-            bw_shares = calculate_bandwidth_allocation(capacity=link["bandwidth"], demands=flow_demands)
+            flow_weights = [f.count for f in link.active_flows]
+            bw_shares = calculate_bandwidth_allocation(capacity=link.bandwidth, demands=flow_demands, weights=flow_weights)
 
-            for index, affected_flow in enumerate(link["active_flows"]):
-                affected_flow.bandwidth[link["id"]] = bw_shares[index]
+            for index, affected_flow in enumerate(link.active_flows):
+                affected_flow.bandwidth[link.id] = bw_shares[index]
 
 
-def calculate_bandwidth_allocation(capacity: int, demands: list) -> list:
+def calculate_bandwidth_allocation(capacity: int, demands: list, weights: list = None) -> list:
     """Calculates network shares using the simple notion of equal sharing, where the allocated bandwidth
     for each flow is equal to the available bandwidth divided by the number of active flows.
 
     Args:
         capacity (int): Network bandwidth to be shared.
         demands (list): List of demands (e.g.: list of demands of services that will be migrated).
+        weights (list, optional): Number of identical items represented by each item (e.g., flows that carry multiple data
+            packets at once), which receive proportionally larger slices. Defaults to None (all items represent a single item).
 
     Returns:
         list: Network allocation scheme.
     """
+    if weights is not None and any(weight != 1 for weight in weights):
+        total_weight = sum(weights)
+        return [capacity * weight / total_weight for weight in weights]
+
     # Giving a equal slice of bandwidth to each item in the demands list
     allocated_bandwidth = [capacity / len(demands)] * len(demands)
 
@@ -0,0 +1,138 @@
+class FlowTracker:
+    """Keeps track of the network flows handled by a flow scheduling algorithm. Instead of inspecting every flow ever created at
+    each time step (finished flows are never removed from the list of flows), the tracker only inspects new flows and flows that
+    are still active, gathering the links whose bandwidth shares must be recalculated (i.e., the "dirty" links).
+    """
+
+    def __init__(self):
+        """Creates a FlowTracker object."""
+        # List of flows received in the last update, along with the number of flows already inspected from that list
+        self.flows = None
+        self.known_flows = 0
+        self.last_known_flow = None
+
+        # Flows that were active by the last update and the network links that comprehend their paths
+        self.active_flows = {}
+
+    @classmethod
+    def get(cls, topology: object) -> object:
+        """Gets the flow tracker attached to a network topology, creating it if necessary.
+
+        Args:
+            topology (object): Network topology object.
+
+        Returns:
+            object: Flow tracker.
+        """
+        tracker = getattr(topology, "_flow_tracker", None)
+        if tracker is None:
+            tracker = cls()
+            topology._flow_tracker = tracker
+
+        return tracker
+
+    def update(self, topology: object, flows: list):
+        """Registers the flows created since the last update.
+
+        Args:
+            topology (object): Network topology object.
+            flows (list): List of flows in the topology.
+        """
+        # New flows are appended to the list of flows. If that list was replaced or had items removed (e.g., when finished flows are
+        # archived), all of its flows are inspected again. Flows tracked so far are kept, so that finished flows that were removed
+        # from the list still have their links recalculated
+        known_flows = self.known_flows
+        if (
+            self.flows is not flows
+            or known_flows > len(flows)
+            or (known_flows > 0 and flows[known_flows - 1] is not self.last_known_flow)
+        ):
+            self.flows = flows
+            known_flows = 0
+
+        for flow in flows[known_flows:]:
+            if flow not in self.active_flows:
+                self.active_flows[flow] = [topology[flow.path[i]][flow.path[i + 1]] for i in range(0, len(flow.path) - 1)]
+
+        self.known_flows = len(flows)
+        self.last_known_flow = flows[-1] if len(flows) > 0 else None
+
+    def remove_flows(self, flows: list, removed_flows: list):
+        """Removes flows from the list of flows (e.g., finished flows being archived) through the "remove()" method of their class.
+        The number of flows already inspected is updated accordingly, so that the remaining flows are not inspected again.
+
+        Args:
+            flows (list): List of flows in the topology.
+            removed_flows (list): Flows to be removed.
+        """
+        tracked = self.flows is flows
+        if tracked:
+            # Flows removed from the part of the list that was not inspected yet do not change the number of inspected flows
+            removed = set(removed_flows)
+            uninspected_removals = sum(1 for flow in flows[self.known_flows :] if flow in removed)
+            known_flows = self.known_flows - (len(removed) - uninspected_removals)
+
+        for flow in removed_flows:
+            type(flow).remove(flow)
+
+        if tracked:
+            self.known_flows = known_flows
+            self.last_known_flow = flows[known_flows - 1] if known_flows > 0 else None
+
+    def get_links_to_recalculate_bandwidth(self, include_flows_wasting_bandwidth: bool = True) -> list:
+        """Gathers the links used by flows that either started or finished since the last update (finished flows stop being tracked
+        afterwards) and, optionally, by flows that have more bandwidth than needed.
+
+        Args:
+            include_flows_wasting_bandwidth (bool, optional): Whether to consider flows with more bandwidth than needed. Defaults to True.
+
+        Returns:
+            list: Network links whose bandwidth shares must be recalculated.
+        """
+        links_to_recalculate_bandwidth = {}
+
+        for flow, links in list(self.active_flows.items()):
+            if flow.status != "active":
+                del self.active_flows[flow]
+
+            if self._has_changed(flow=flow, include_flows_wasting_bandwidth=include_flows_wasting_bandwidth):
+                for link in links:
+                    links_to_recalculate_bandwidth[id(link)] = link
+
+        return list(links_to_recalculate_bandwidth.values())
+
+    def has_pending_changes(self, flows: list) -> bool:
+        """Checks whether the next update would lead to bandwidth shares being recalculated, i.e., whether flows were created since the
+        last update or whether tracked flows either started, finished, or have more bandwidth than needed. Unlike the other methods,
+        this check does not modify the tracker.
+
+        Args:
+            flows (list): List of flows in the topology.
+
+        Returns:
+            bool: Information of whether bandwidth shares may change in the next update.
+        """
+        if self.flows is not flows or self.known_flows != len(flows) or (len(flows) > 0 and flows[-1] is not self.last_known_flow):
+            return True
+
+        return any(self._has_changed(flow=flow, include_flows_wasting_bandwidth=True) for flow in self.active_flows)
+
+    def _has_changed(self, flow: object, include_flows_wasting_bandwidth: bool) -> bool:
+        """Checks whether a tracked flow either started or finished since the last update or has more bandwidth than needed.
+
+        Args:
+            flow (object): Network flow.
+            include_flows_wasting_bandwidth (bool): Whether to consider flows with more bandwidth than needed.
+
+        Returns:
+            bool: Information of whether the bandwidth shares of the links used by the flow must be recalculated.
+        """
+        if flow.status != "active":
+            return True
+
+        bandwidth = flow.bandwidth.values()
+        flow_just_started = None in bandwidth
+        flow_just_ended = flow.data_to_transfer == 0
+        flow_wasting_bandwidth = include_flows_wasting_bandwidth and not flow_just_started and any(flow.data_to_transfer < bw for bw in bandwidth)
+
+        return flow_just_started or flow_just_ended or flow_wasting_bandwidth
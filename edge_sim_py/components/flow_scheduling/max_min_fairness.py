@@ -1,89 +1,164 @@
-def get_overprovisioned_slices(demands: list, allocated: list) -> list:
-    """Calculates the leftover demand and finds items with satisfied bandwidth.
-    Args:
-        demands (list): List of demands (or the demand of services that will be migrated).
-        allocated (list): Allocated demand for each service within the list.
-    Returns:
-        list, int: Flows that were overprovisioned and their leftover bandwidth, respectively.
-    """
-    overprovisioned_slices = []
-    leftover_bandwidth = 0
-
-    for i in range(len(demands)):
-        if allocated[i] >= demands[i]:
-            leftover_bandwidth += allocated[i] - demands[i]
-            overprovisioned_slices.append(demands[i])
-
-    return overprovisioned_slices, leftover_bandwidth
+# EdgeSimPy components
+from edge_sim_py.components.flow_scheduling.flow_tracker import FlowTracker
 
 
 def max_min_fairness(topology: object, flows: list):
     """Manages the execution of the Max-Min Fairness algorithm for sharing the bandwidth of links among network flows.
 
+    Bandwidth shares are only recalculated for the links used by flows that either started or finished since the last
+    step or that have more bandwidth than needed. Only new and active flows are inspected at each step.
+
     Args:
         topology (object): Network topology object.
         flows (list): List of flows in the topology.
     """
     # Gathering the links of used by flows that either started or finished or that have more bandwidth than needed
-    links_to_recalculate_bandwidth = []
-    for flow in flows:
-        flow_just_started = len([bw for bw in flow.bandwidth.values() if bw == None]) > 0
-        flow_just_ended = flow.data_to_transfer == 0
-        flow_wasting_bandwidth = False if flow_just_started else any([flow.data_to_transfer < bw for bw in flow.bandwidth.values()])
-
-        if flow_just_started or flow_just_ended or flow_wasting_bandwidth:
-            for i in range(0, len(flow.path) - 1):
-                # Gathering link nodes
-                link = (flow.path[i], flow.path[i + 1])
-
-                # Checking if the link is not already included in "links_to_recalculate_bandwidth"
-                if link not in links_to_recalculate_bandwidth:
-                    links_to_recalculate_bandwidth.append(link)
+    flow_tracker = FlowTracker.get(topology=topology)
+    flow_tracker.update(topology=topology, flows=flows)
+    links_to_recalculate_bandwidth = flow_tracker.get_links_to_recalculate_bandwidth()
 
     # Calculating the bandwidth shares for the active flows
-    for link_nodes in links_to_recalculate_bandwidth:
-        link = topology[link_nodes[0]][link_nodes[1]]
-
+    for link in links_to_recalculate_bandwidth:
         # Recalculating bandwidth shares for the flows as some of them have changed
-        flow_demands = [f.data_to_transfer for f in link["active_flows"]]
+        flow_demands = [f.data_to_transfer for f in link.active_flows]
         if sum(flow_demands) > 0:
-            bw_shares = calculate_fair_allocation(capacity=link["bandwidth"], demands=flow_demands)
+            flow_weights = [f.count for f in link.active_flows]
+            bw_shares = calculate_fair_allocation(capacity=link.bandwidth, demands=flow_demands, weights=flow_weights)
 
-            for index, affected_flow in enumerate(link["active_flows"]):
-                affected_flow.bandwidth[link["id"]] = bw_shares[index]
+            for index, affected_flow in enumerate(link.active_flows):
+                affected_flow.bandwidth[link.id] = bw_shares[index]
 
 
-def calculate_fair_allocation(capacity: int, demands: list) -> list:
+def calculate_fair_allocation(capacity: int, demands: list, weights: list = None) -> list:
     """Calculates network shares using the Max-Min Fairness algorithm [1].
 
+    Demands are sorted once, so that each round of the progressive filling only inspects the items whose demands are
+    fulfilled by the new (increased) share of bandwidth given to the items that are not fulfilled yet.
+
     [1] Gebali, F. (2008). Scheduling Algorithms. In: Analysis of Computer and Communication
     Networks. Springer, Boston, MA. https://doi.org/10.1007/978-0-387-74437-7_12.
 
     Args:
         capacity (int): Network bandwidth to be shared.
         demands (list): List of demands (e.g.: list of demands of services that will be migrated).
+        weights (list, optional): Number of identical items represented by each item (e.g., flows that carry multiple data
+            packets at once), which receive the bandwidth those items would receive separately. Defaults to None (all items
+            represent a single item).
 
     Returns:
         list: Fair network allocation scheme.
     """
+    if weights is not None and any(weight != 1 for weight in weights):
+        return _calculate_weighted_fair_allocation(capacity=capacity, demands=demands, weights=weights)
+
+    sorted_items = sorted(range(len(demands)), key=lambda index: demands[index])
+
     # Giving an equal slice of bandwidth to each item in the demands list
-    allocated_bandwidth = [capacity / len(demands)] * len(demands)
+    share = capacity / len(demands)
 
-    # Calculating leftover demand and gathering items with satisfied bandwidth
-    fullfilled_items, leftover_bandwidth = get_overprovisioned_slices(demands=demands, allocated=allocated_bandwidth)
+    # Gathering items with satisfied bandwidth (a prefix of the sorted items) and calculating the leftover bandwidth
+    fullfilled_items = _count_fullfilled_items(demands=demands, sorted_items=sorted_items, start=0, share=share)
+    leftover_bandwidth = _get_leftover_bandwidth(demands=demands, items=sorted_items[:fullfilled_items], share=share)
 
-    while leftover_bandwidth > 0 and len(fullfilled_items) < len(demands):
-        bandwidth_to_share = leftover_bandwidth / (len(demands) - len(fullfilled_items))
+    # Items whose overprovisioned bandwidth was removed (i.e., that received exactly what they demand)
+    settled_items = 0
 
-        for index, demand in enumerate(demands):
-            if demand in fullfilled_items:
-                # Removing overprovisioned bandwidth
-                allocated_bandwidth[index] = demand
-            else:
-                # Giving a larger slice of bandwidth to items that are not fullfilled
-                allocated_bandwidth[index] += bandwidth_to_share
+    while leftover_bandwidth > 0 and fullfilled_items < len(demands):
+        # Removing overprovisioned bandwidth and giving a larger slice of bandwidth to items that are not fullfilled
+        share += leftover_bandwidth / (len(demands) - fullfilled_items)
+        settled_items = fullfilled_items
 
         # Recalculating leftover demand and gathering items with satisfied bandwidth
-        fullfilled_items, leftover_bandwidth = get_overprovisioned_slices(demands=demands, allocated=allocated_bandwidth)
+        fullfilled_items = _count_fullfilled_items(demands=demands, sorted_items=sorted_items, start=settled_items, share=share)
+        leftover_bandwidth = _get_leftover_bandwidth(
+            demands=demands,
+            items=sorted_items[settled_items:fullfilled_items],
+            share=share,
+        )
+
+    allocated_bandwidth = [share] * len(demands)
+    for index in sorted_items[:settled_items]:
+        allocated_bandwidth[index] = demands[index]
 
     return allocated_bandwidth
+
+
+def _calculate_weighted_fair_allocation(capacity: int, demands: list, weights: list) -> list:
+    """Calculates network shares using the Max-Min Fairness algorithm for items that represent multiple identical items. Each
+    item behaves as "weight" items whose demands are a fraction of its demand, and receives the sum of the shares of those items.
+
+    Args:
+        capacity (int): Network bandwidth to be shared.
+        demands (list): List of demands.
+        weights (list): Number of identical items represented by each item.
+
+    Returns:
+        list: Fair network allocation scheme.
+    """
+    unit_demands = [demand / weight for demand, weight in zip(demands, weights)]
+    sorted_items = sorted(range(len(demands)), key=lambda index: unit_demands[index])
+    total_weight = sum(weights)
+
+    # Giving an equal slice of bandwidth to each of the represented items
+    share = capacity / total_weight
+
+    # Gathering items with satisfied bandwidth (a prefix of the sorted items) and calculating the leftover bandwidth
+    fullfilled_items = _count_fullfilled_items(demands=unit_demands, sorted_items=sorted_items, start=0, share=share)
+    fullfilled_weight = sum(weights[index] for index in sorted_items[:fullfilled_items])
+    leftover_bandwidth = sum(weights[index] * share - demands[index] for index in sorted(sorted_items[:fullfilled_items]))
+
+    # Items whose overprovisioned bandwidth was removed (i.e., that received exactly what they demand)
+    settled_items = 0
+
+    while leftover_bandwidth > 0 and fullfilled_items < len(demands):
+        # Removing overprovisioned bandwidth and giving a larger slice of bandwidth to items that are not fullfilled
+        share += leftover_bandwidth / (total_weight - fullfilled_weight)
+        settled_items = fullfilled_items
+
+        # Recalculating leftover demand and gathering items with satisfied bandwidth
+        fullfilled_items = _count_fullfilled_items(demands=unit_demands, sorted_items=sorted_items, start=settled_items, share=share)
+        fullfilled_weight += sum(weights[index] for index in sorted_items[settled_items:fullfilled_items])
+        leftover_bandwidth = sum(weights[index] * share - demands[index] for index in sorted(sorted_items[settled_items:fullfilled_items]))
+
+    allocated_bandwidth = [weight * share for weight in weights]
+    for index in sorted_items[:settled_items]:
+        allocated_bandwidth[index] = demands[index]
+
+    return allocated_bandwidth
+
+
+def _count_fullfilled_items(demands: list, sorted_items: list, start: int, share: float) -> int:
+    """Counts the items whose demands are fulfilled by a given share of bandwidth.
+
+    Args:
+        demands (list): List of demands.
+        sorted_items (list): Indices of the demands list sorted by demand.
+        start (int): Number of sorted items known to be fulfilled.
+        share (float): Bandwidth given to each item.
+
+    Returns:
+        int: Number of fulfilled items.
+    """
+    while start < len(sorted_items) and share >= demands[sorted_items[start]]:
+        start += 1
+
+    return start
+
+
+def _get_leftover_bandwidth(demands: list, items: list, share: float) -> float:
+    """Calculates the bandwidth left over by items that were given more bandwidth than they demand.
+
+    Args:
+        demands (list): List of demands.
+        items (list): Indices of the overprovisioned items.
+        share (float): Bandwidth given to each item.
+
+    Returns:
+        float: Leftover bandwidth.
+    """
+    # Overprovisioned slices are summed in their original order so that results match item-by-item calculations
+    leftover_bandwidth = 0
+    for index in sorted(items):
+        leftover_bandwidth += share - demands[index]
+
+    return leftover_bandwidth
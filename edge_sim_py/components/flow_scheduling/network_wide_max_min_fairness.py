@@ -0,0 +1,121 @@
+# EdgeSimPy components
+from edge_sim_py.components.flow_scheduling.flow_tracker import FlowTracker
+
+# Python libraries
+import heapq
+
+
+def network_wide_max_min_fairness(topology: object, flows: list):
+    """Manages the execution of a network-wide Max-Min Fairness algorithm for sharing the bandwidth of links among network flows.
+
+    Unlike the per-link max_min_fairness algorithm, which shares the bandwidth of each link independently, this algorithm
+    considers the whole path of multi-hop flows, so that the bandwidth a flow cannot use because of a bottleneck in its path is
+    shared among the other flows of each link. Every link crossed by a flow is given the same share (i.e., the flow rate).
+    Allocations are only recalculated for the flows that share links (directly or indirectly) with flows that either started
+    or finished or that have more bandwidth than needed.
+
+    Args:
+        topology (object): Network topology object.
+        flows (list): List of flows in the topology.
+    """
+    flow_tracker = FlowTracker.get(topology=topology)
+    flow_tracker.update(topology=topology, flows=flows)
+    links_to_recalculate_bandwidth = flow_tracker.get_links_to_recalculate_bandwidth()
+
+    # Gathering the flows and links affected by the changes (i.e., those that share links with flows that have changed)
+    affected_flows = {}
+    affected_links = {id(link): link for link in links_to_recalculate_bandwidth}
+    links_to_visit = list(links_to_recalculate_bandwidth)
+    while len(links_to_visit) > 0:
+        link = links_to_visit.pop()
+        for flow in link.active_flows:
+            if flow not in affected_flows:
+                affected_flows[flow] = flow_tracker.active_flows[flow]
+                for flow_link in affected_flows[flow]:
+                    if id(flow_link) not in affected_links:
+                        affected_links[id(flow_link)] = flow_link
+                        links_to_visit.append(flow_link)
+
+    if len(affected_flows) == 0:
+        return
+
+    # Calculating the rate of each affected flow
+    link_indices = {link_id: index for index, link_id in enumerate(affected_links)}
+    rates = calculate_network_wide_allocation(
+        capacities=[link.bandwidth for link in affected_links.values()],
+        demands=[flow.data_to_transfer for flow in affected_flows],
+        paths=[[link_indices[id(link)] for link in links] for links in affected_flows.values()],
+    )
+
+    for rate, (flow, links) in zip(rates, affected_flows.items()):
+        for link in links:
+            flow.bandwidth[link.id] = rate
+
+
+def calculate_network_wide_allocation(capacities: list, demands: list, paths: list) -> list:
+    """Calculates the max-min fair rates of a set of flows that cross multiple links through progressive filling. The rates of
+    all flows are increased together until either a flow gets the bandwidth it demands or a link gets saturated, which freezes
+    the rates of the flows that cross it. Flows with no demand are only limited by the links they cross.
+
+    Args:
+        capacities (list): Bandwidth of each link.
+        demands (list): Demand of each flow.
+        paths (list): Indices of the links crossed by each flow.
+
+    Returns:
+        list: Rate of each flow.
+    """
+    rates = [None] * len(demands)
+
+    # Gathering the flows that cross each link, as well as the bandwidth each link has left for the flows whose rates are not frozen
+    link_flows = [[] for _ in capacities]
+    for flow, path in enumerate(paths):
+        for link in path:
+            link_flows[link].append(flow)
+    remaining_capacity = list(capacities)
+    unfrozen_flows = [len(flows) for flows in link_flows]
+
+    # Heap with the rate in which each link gets saturated (entries get outdated whenever a flow that crosses the link is frozen)
+    saturation_rates = [(capacities[link] / unfrozen_flows[link], link) for link in range(len(capacities)) if unfrozen_flows[link] > 0]
+    heapq.heapify(saturation_rates)
+
+    # Flows sorted by demand (flows without a path are not constrained by any link)
+    sorted_demands = sorted((demand, flow) for flow, demand in enumerate(demands) if demand > 0)
+    next_demand = 0
+
+    def freeze(flow: int, rate: float):
+        """Freezes the rate of a flow, updating the bandwidth left by the links it crosses."""
+        rates[flow] = rate
+        for link in paths[flow]:
+            remaining_capacity[link] = max(remaining_capacity[link] - rate, 0)
+            unfrozen_flows[link] -= 1
+            if unfrozen_flows[link] > 0:
+                heapq.heappush(saturation_rates, (remaining_capacity[link] / unfrozen_flows[link], link))
+
+    while True:
+        # Discarding outdated saturation rates and demands from flows that are already frozen
+        while len(saturation_rates) > 0:
+            rate, link = saturation_rates[0]
+            if unfrozen_flows[link] > 0 and rate == remaining_capacity[link] / unfrozen_flows[link]:
+                break
+            heapq.heappop(saturation_rates)
+        while next_demand < len(sorted_demands) and rates[sorted_demands[next_demand][1]] is not None:
+            next_demand += 1
+
+        if next_demand < len(sorted_demands) and (len(saturation_rates) == 0 or sorted_demands[next_demand][0] <= saturation_rates[0][0]):
+            # The flow with the smallest demand gets the bandwidth it demands
+            demand, flow = sorted_demands[next_demand]
+            freeze(flow=flow, rate=demand)
+
+        elif len(saturation_rates) > 0:
+            # The link that gets saturated first freezes the rates of its flows
+            rate, link = heapq.heappop(saturation_rates)
+            for flow in link_flows[link]:
+                if rates[flow] is None:
+                    freeze(flow=flow, rate=rate)
+
+        else:
+            break
+
+    # Flows that were not frozen neither cross links nor have a demand
+    return [0 if rate is None else rate for rate in rates]
@@ -0,0 +1,92 @@
+# EdgeSimPy components
+from edge_sim_py.components.flow_scheduling.flow_tracker import FlowTracker
+
+# Python libraries
+import numpy as np
+
+
+def vectorized_max_min_fairness(topology: object, flows: list):
+    """Manages the execution of a vectorized version of the Max-Min Fairness algorithm for sharing the bandwidth of links among
+    network flows. Bandwidth shares are recalculated for the same links as in the max_min_fairness algorithm. However, instead of
+    calculating the shares of each link separately, the shares of all links are calculated at once over NumPy arrays, which pays
+    off on scenarios with thousands of concurrent flows. Allocations match the ones from max_min_fairness up to floating-point
+    rounding.
+
+    Args:
+        topology (object): Network topology object.
+        flows (list): List of flows in the topology.
+    """
+    # Gathering the links of used by flows that either started or finished or that have more bandwidth than needed
+    flow_tracker = FlowTracker.get(topology=topology)
+    flow_tracker.update(topology=topology, flows=flows)
+    links_to_recalculate_bandwidth = flow_tracker.get_links_to_recalculate_bandwidth()
+
+    # Building a sparse flow-link incidence matrix (in coordinate format) with the demands of the flows crossing each link
+    capacities = []
+    entry_links = []
+    entry_flows = []
+    entry_demands = []
+    for link in links_to_recalculate_bandwidth:
+        flow_demands = [f.data_to_transfer for f in link.active_flows]
+        if sum(flow_demands) > 0:
+            entry_links.extend([len(capacities)] * len(flow_demands))
+            entry_flows.extend((link.id, f) for f in link.active_flows)
+            entry_demands.extend(flow_demands)
+            capacities.append(link.bandwidth)
+
+    if len(capacities) == 0:
+        return
+
+    # Calculating the bandwidth shares for the active flows
+    bw_shares = calculate_vectorized_fair_allocation(
+        capacities=np.array(capacities, dtype=float),
+        links=np.array(entry_links, dtype=np.intp),
+        demands=np.array(entry_demands, dtype=float),
+    )
+
+    for (link_id, affected_flow), bw_share in zip(entry_flows, bw_shares.tolist()):
+        affected_flow.bandwidth[link_id] = bw_share
+
+
+def calculate_vectorized_fair_allocation(capacities: np.ndarray, links: np.ndarray, demands: np.ndarray) -> np.ndarray:
+    """Calculates the Max-Min Fairness network shares of multiple links at once. Rounds of the progressive filling followed by
+    the calculate_fair_allocation function are executed in parallel for every link that has not converged yet.
+
+    Args:
+        capacities (np.ndarray): Bandwidth of each link.
+        links (np.ndarray): Index of the link related to each demand (i.e., the row of each entry of the flow-link incidence matrix).
+        demands (np.ndarray): List of demands (e.g.: list of demands of services that will be migrated).
+
+    Returns:
+        np.ndarray: Fair network allocation scheme.
+    """
+    number_of_links = len(capacities)
+    flows_per_link = np.bincount(links, minlength=number_of_links)
+
+    # Giving an equal slice of bandwidth to each item in the demands list
+    shares = capacities / flows_per_link
+
+    # Items whose overprovisioned bandwidth was removed (i.e., that receive exactly what they demand)
+    settled_items = np.zeros(len(demands), dtype=bool)
+
+    # Links whose shares are still being calculated
+    unfinished_links = np.ones(number_of_links, dtype=bool)
+
+    while True:
+        # Gathering items with satisfied bandwidth and checking whether they left over bandwidth to the other items of their links
+        item_shares = shares[links]
+        fullfilled_items = demands <= item_shares
+        overprovisioned_items = fullfilled_items & ~settled_items & (demands < item_shares)
+        unfinished_links &= np.bincount(links, weights=overprovisioned_items, minlength=number_of_links) > 0
+        unfinished_links &= np.bincount(links, weights=fullfilled_items, minlength=number_of_links) < flows_per_link
+
+        if not unfinished_links.any():
+            break
+
+        # Removing overprovisioned bandwidth and giving a larger slice of bandwidth to items that are not fullfilled
+        settled_items |= fullfilled_items & unfinished_links[links]
+        settled_demand = np.bincount(links, weights=np.where(settled_items, demands, 0), minlength=number_of_links)
+        settled_count = np.bincount(links, weights=settled_items, minlength=number_of_links)
+        shares = np.where(unfinished_links, (capacities - settled_demand) / (flows_per_link - settled_count), shares)
+
+    return np.where(settled_items, demands, shares[links])
@@ -0,0 +1,6 @@
+"""Automatic Python configuration file."""
+
+__version__ = "1.1.0"
+
+# Analytical latency models
+from .mm1_latency import mm1_latency
@@ -0,0 +1,121 @@
+# EdgeSimPy components
+from edge_sim_py.components.network_switch import NetworkSwitch
+
+
+def mm1_latency(topology: object, users: list):
+    """Computes the delays perceived by users when accessing their applications with a network of M/M/1 queues, which replaces
+    the simulation of data packets and network flows (no DataPacket or NetworkFlow agents are created).
+
+    Each user sends requests to each application at the long-run rate of its access pattern (users send one request per step
+    while accessing an application, so the rate is the mean access duration divided by the mean access period) and with the
+    mean size of its packet size strategy. Requests cross the links of each hop of the communication path and are processed by
+    each service of the application. Network links and services are modeled as M/M/1 queues loaded by the requests of all users:
+        - A request of size "s" spends "s / (bandwidth * (1 - utilization))" steps in a link, besides the link's propagation delay.
+        - A request spends "processing_time / (1 - utilization)" steps in a service.
+    Saturated links and services (i.e., whose utilization is greater than or equal to 1) lead to infinite delays.
+
+    Args:
+        topology (object): Network topology object.
+        users (list): List of users in the simulation.
+    """
+    # Gathering the load offered by each user to the links and services used by its applications
+    link_loads = {}
+    service_loads = {}
+    accesses = []
+    for user in users:
+        for app in user.applications:
+            # Users only load applications they have already connected to (i.e., that have communication paths)
+            if str(app.id) not in user.communication_paths:
+                continue
+
+            # Defining the delay as infinity if any of the application services is not available
+            if any(not service._available for service in app.services):
+                user.delays[str(app.id)] = float("inf")
+                continue
+
+            request_rate = get_request_rate(access_pattern=user.access_patterns.get(str(app.id)))
+            request_size = get_mean_packet_size(packet_size_strategy=user.packet_size_strategy)
+
+            hops = [[NetworkSwitch.find_by_id(i) for i in path] for path in user.communication_paths[str(app.id)]]
+            links = [topology._adj[hop[i]][hop[i + 1]] for hop in hops for i in range(len(hop) - 1)]
+
+            for link in links:
+                link_loads[id(link)] = link_loads.get(id(link), 0) + request_rate * request_size
+            for service in app.services:
+                service_loads[id(service)] = service_loads.get(id(service), 0) + request_rate
+
+            accesses.append((user, app, request_size, hops, links))
+
+    # Calculating the delay of each application based on the utilization of its links and services
+    for user, app, request_size, hops, links in accesses:
+        # Initializes the application's delay with the time it takes to communicate its client and his base station
+        delay = user.base_station.wireless_delay
+
+        # Adding the propagation delay of the communication path
+        for hop in hops:
+            delay += topology.calculate_path_delay(path=hop)
+
+        # Adding the time spent by requests in the links of the communication path (i.e., queue and transmission delays)
+        for link in links:
+            if link.bandwidth > 0:
+                delay += get_sojourn_time(service_time=request_size / link.bandwidth, utilization=link_loads[id(link)] / link.bandwidth)
+            else:
+                delay = float("inf")
+
+        # Adding the time spent by requests in the application services (i.e., queue and processing delays)
+        for service in app.services:
+            delay += get_sojourn_time(service_time=service.processing_time, utilization=service_loads[id(service)] * service.processing_time)
+
+        user.delays[str(app.id)] = delay
+
+
+def get_request_rate(access_pattern: object) -> float:
+    """Calculates the long-run rate (in requests per step) in which a user accesses an application based on its access pattern.
+
+    Args:
+        access_pattern (object): User access pattern.
+
+    Returns:
+        float: Mean number of requests per step.
+    """
+    if access_pattern is None or len(access_pattern.duration_values) == 0:
+        return 0
+
+    mean_duration = sum(access_pattern.duration_values) / len(access_pattern.duration_values)
+    mean_interval = sum(access_pattern.interval_values) / len(access_pattern.interval_values) if len(access_pattern.interval_values) > 0 else 0
+
+    return mean_duration / (mean_duration + mean_interval)
+
+
+def get_mean_packet_size(packet_size_strategy: dict) -> float:
+    """Calculates the mean size of the data packets generated by a user based on its packet size strategy.
+
+    Args:
+        packet_size_strategy (dict): User packet size strategy.
+
+    Returns:
+        float: Mean data packet size.
+    """
+    if packet_size_strategy["mode"] == "random":
+        return (packet_size_strategy["min"] + packet_size_strategy["max"]) / 2
+
+    return packet_size_strategy["size"]
+
+
+def get_sojourn_time(service_time: float, utilization: float) -> float:
+    """Calculates the mean time spent by requests in an M/M/1 queue (i.e., waiting in the queue and being served).
+
+    Args:
+        service_time (float): Mean service time.
+        utilization (float): Queue utilization (i.e., arrival rate multiplied by the mean service time).
+
+    Returns:
+        float: Mean sojourn time (infinity if the queue is saturated).
+    """
+    if service_time == 0:
+        return 0
+
+    if utilization >= 1:
+        return float("inf")
+
+    return service_time / (1 - utilization)
@@ -2,6 +2,9 @@
 
 __version__ = "1.1.0"
 
+# Compact representation of user mobility traces
+from .coordinates_trace import CoordinatesTrace
+
 # User mobility models
 from .pathway import pathway
 from .random_mobility import random_mobility
@@ -0,0 +1,211 @@
+"""Contains a compact representation of user mobility traces."""
+
+# Python libraries
+from bisect import bisect_right
+
+
+class CoordinatesTrace:
+    """List-like sequence of coordinates indexed by time step. As users usually stay at the same position for many consecutive steps
+    (especially when steps represent small time intervals), the trace is stored as runs of (coordinates, number of steps) instead of
+    one entry per step. Lookups of consecutive steps take amortized constant time, and runs already visited by the user can be
+    discarded without shifting the indexes of the remaining steps.
+
+    Example:
+        'trace.append((1, 2), repeats=60000)' adds a position visited by the user during 60000 steps.
+    """
+
+    def __init__(self, items: list = []) -> object:
+        """Creates a CoordinatesTrace object.
+
+        Args:
+            items (list, optional): Coordinates visited by the user at each time step. Defaults to [].
+
+        Returns:
+            object: Created CoordinatesTrace object.
+        """
+        # Coordinates of each run and the (exclusive) index of the step where each run ends
+        self._coordinates = []
+        self._ends = []
+
+        # Number of steps from discarded runs
+        self._discarded = 0
+
+        # Index of the last run accessed (used to speed up lookups of consecutive steps)
+        self._cursor = 0
+
+        self.extend(items)
+
+    def __len__(self) -> int:
+        """Gets the number of steps covered by the trace (including discarded steps).
+
+        Returns:
+            int: Number of steps.
+        """
+        return self._ends[-1] if len(self._ends) > 0 else self._discarded
+
+    def __getitem__(self, index: int) -> object:
+        """Gets the coordinates of a given time step.
+
+        Args:
+            index (int): Time step (negative values are counted from the end of the trace).
+
+        Returns:
+            object: Coordinates (or list of coordinates when a slice is given).
+        """
+        if type(index) is slice:
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return self._coordinates[self._find_run(index=index)]
+
+    def __iter__(self):
+        """Iterates over the coordinates of each step that was not discarded.
+
+        Returns:
+            Iterator: Coordinates of each step.
+        """
+        start = self._discarded
+        for coordinates, end in zip(self._coordinates, self._ends):
+            for _ in range(start, end):
+                yield coordinates
+            start = end
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the trace with another trace or with a list of coordinates.
+
+        Args:
+            other (object): Trace or list of coordinates.
+
+        Returns:
+            bool: Whether both sequences contain the same coordinates.
+        """
+        if isinstance(other, CoordinatesTrace):
+            return self._discarded == other._discarded and self._coordinates == other._coordinates and self._ends == other._ends
+
+        if isinstance(other, list):
+            return self._discarded == 0 and list(self) == other
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Defines how the object is represented inside print statements.
+
+        Returns:
+            str: Object representation.
+        """
+        return f"CoordinatesTrace({list(zip(self._coordinates, self.get_run_lengths()))})"
+
+    def _to_dict(self) -> dict:
+        """Method that overrides the way the object is formatted to JSON. Runs are exported along with the number of discarded
+        steps, so that the steps of the remaining runs keep their indexes once the trace is restored.
+
+        Returns:
+            dict: JSON-friendly representation of the object as a dictionary.
+        """
+        dictionary = {
+            "discarded": self._discarded,
+            "runs": [[coordinates, length] for coordinates, length in zip(self._coordinates, self.get_run_lengths())],
+        }
+        return dictionary
+
+    @classmethod
+    def _from_dict(cls, dictionary: dict) -> object:
+        """Method that creates a trace based on a dictionary specification (see "_to_dict()").
+
+        Args:
+            dictionary (dict): Object specification.
+
+        Returns:
+            object: Created CoordinatesTrace object.
+        """
+        trace = cls()
+        trace._discarded = dictionary["discarded"]
+
+        for coordinates, length in dictionary["runs"]:
+            trace.append(coordinates, repeats=length)
+
+        return trace
+
+    def append(self, coordinates: object, repeats: int = 1):
+        """Adds a position to the end of the trace.
+
+        Args:
+            coordinates (object): Coordinates.
+            repeats (int, optional): Number of consecutive steps spent at the position. Defaults to 1.
+        """
+        if repeats < 1:
+            return
+
+        if len(self._coordinates) > 0 and self._coordinates[-1] == coordinates:
+            self._ends[-1] += repeats
+        else:
+            self._coordinates.append(coordinates)
+            self._ends.append(len(self) + repeats)
+
+    def extend(self, items: list):
+        """Adds a sequence of positions (one per time step) to the end of the trace.
+
+        Args:
+            items (list): Coordinates visited at each time step.
+        """
+        for coordinates in items:
+            self.append(coordinates)
+
+    def get_run_end(self, index: int) -> int:
+        """Gets the first time step after a given step in which the user is at a different position (or the length of the trace if
+        the position does not change until its end).
+
+        Args:
+            index (int): Time step.
+
+        Returns:
+            int: Time step where the run containing the given step ends.
+        """
+        return self._ends[self._find_run(index=index)]
+
+    def get_run_lengths(self) -> list:
+        """Gets the number of steps of each run that was not discarded.
+
+        Returns:
+            list: Number of steps of each run.
+        """
+        return [end - start for start, end in zip([self._discarded] + self._ends[:-1], self._ends)]
+
+    def discard(self, until: int):
+        """Discards the runs that finish before a given time step. Steps from discarded runs can no longer be accessed, but the
+        indexes of the remaining steps remain the same.
+
+        Args:
+            until (int): First time step that must remain accessible.
+        """
+        runs = bisect_right(self._ends, until)
+        if runs > 0:
+            self._discarded = self._ends[runs - 1]
+            del self._coordinates[:runs]
+            del self._ends[:runs]
+            self._cursor = 0
+
+    def _find_run(self, index: int) -> int:
+        """Finds the run containing a given time step.
+
+        Args:
+            index (int): Time step.
+
+        Returns:
+            int: Run index.
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+
+        if index < self._discarded or index >= length:
+            raise IndexError(f"Step {index} is not available in the coordinates trace.")
+
+        # Checking the last accessed run and the run that follows it before searching the whole trace
+        cursor = self._cursor
+        for run in (cursor, cursor + 1):
+            if run < len(self._ends) and index < self._ends[run] and (run == 0 or index >= self._ends[run - 1]):
+                self._cursor = run
+                return run
+
+        self._cursor = bisect_right(self._ends, index)
+        return self._cursor
@@ -8,7 +8,6 @@ from edge_sim_py.components.base_station import BaseStation
 
 # Python libraries
 import random
-import networkx as nx
 
 
 def pathway(user: object):
@@ -26,8 +25,8 @@ def pathway(user: object):
     # Number of "mobility routines" added each time the method is called. Defaults to 1.
     n_paths = parameters["n_paths"] if "n_paths" in parameters else 1
 
-    # Gathering the BaseStation located in the current client's location
-    current_node = BaseStation.find_by(attribute_name="coordinates", attribute_value=user.coordinates)
+    # Gathering the BaseStation closest to the current client's location
+    current_node = BaseStation.find_nearest(coordinates=user.coordinates)
 
     # Defining the user's mobility path
     mobility_path = []
@@ -37,14 +36,14 @@ def pathway(user: object):
         target_node = random.choice([bs for bs in BaseStation.all() if bs != current_node])
 
         # Calculating the shortest mobility path according to the Pathway mobility model
-        path = nx.shortest_path(G=user.model.topology, source=current_node.network_switch, target=target_node.network_switch)
+        path = user.model.topology.get_shortest_path(source=current_node.network_switch, target=target_node.network_switch)
         mobility_path.extend([network_switch.base_station for network_switch in path])
 
         if i < n_paths - 1:
             current_node = mobility_path.pop(-1)
 
         # Removing repeated entries
-        user_base_station = BaseStation.find_by(attribute_name="coordinates", attribute_value=user.coordinates)
+        user_base_station = BaseStation.find_nearest(coordinates=user.coordinates)
         if user_base_station == mobility_path[0]:
             mobility_path.pop(0)
 
@@ -58,7 +57,6 @@ def pathway(user: object):
     seconds_to_move = parameters["seconds_to_move"] if "seconds_to_move" in parameters else 60
     seconds_to_move = max([1, int(seconds_to_move / user.model.tick_duration)])
 
-    mobility_path = [item for item in mobility_path for i in range(seconds_to_move)]
-
     # Adding the path that connects the current to the target location to the client's mobility trace
-    user.coordinates_trace.extend([bs.coordinates for bs in mobility_path])
+    for base_station in mobility_path:
+        user.coordinates_trace.append(base_station.coordinates, repeats=seconds_to_move)
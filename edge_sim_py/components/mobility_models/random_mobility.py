@@ -25,8 +25,8 @@ def random_mobility(user: object):
     # Number of "mobility routines" added each time the method is called. Defaults to 5.
     n_moves = parameters["n_moves"] if "n_moves" in parameters else 5
 
-    # Gathering the BaseStation located in the current client's location
-    current_node = BaseStation.find_by(attribute_name="coordinates", attribute_value=user.coordinates)
+    # Gathering the BaseStation closest to the current client's location
+    current_node = BaseStation.find_nearest(coordinates=user.coordinates)
 
     # Random mobility path
     mobility_path = []
@@ -47,7 +47,8 @@ def random_mobility(user: object):
     if "seconds_to_move" in parameters and type(parameters["seconds_to_move"]) == int and parameters["seconds_to_move"] < 1:
         raise Exception("The 'seconds_to_move' key passed inside the mobility model's 'parameters' attribute must be > 1.")
     seconds_to_move = parameters["seconds_to_move"] if "seconds_to_move" in parameters else 60
-    mobility_path = [item for item in mobility_path for i in range(int(seconds_to_move / user.model.tick_duration))]
+    seconds_to_move = int(seconds_to_move / user.model.tick_duration)
 
     # Adding the path that connects the current to the target location to the client's mobility trace
-    user.coordinates_trace.extend([bs.coordinates for bs in mobility_path])
+    for base_station in mobility_path:
+        user.coordinates_trace.append(base_station.coordinates, repeats=seconds_to_move)
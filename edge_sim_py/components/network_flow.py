@@ -7,6 +7,60 @@ from edge_sim_py.component_manager import ComponentManager
 # Mesa modules
 from mesa import Agent  # type: ignore
 
+# Python libraries
+import math
+
+
+def _repeat_addition(value: float, amount: float, steps: int = None) -> tuple:
+    """Adds an amount to a value a given number of times, producing the same result as adding the amount one step at a time (which
+    differs from multiplying the amount by the number of steps when floating-point rounding takes place). Between powers of two,
+    floats are multiples of the same unit, so each addition changes the value by the same multiple of that unit (from the second
+    addition on, as the rounding of ties depends on the parity of the value). Runs of additions within each of those intervals
+    are therefore computed with a single multiplication, while additions that cross the interval bounds are performed one by one.
+
+    Args:
+        value (float): Initial value.
+        amount (float): Amount added at each step.
+        steps (int, optional): Number of additions. Defaults to None (additions are performed until the value is not positive, which
+            requires a negative amount).
+
+    Returns:
+        tuple: Resulting value and number of additions performed.
+    """
+    # Integer additions are exact
+    if type(value) is int and type(amount) is int:
+        if steps is None:
+            steps = max(1, -(value // amount))
+
+        return value + amount * steps, steps
+
+    value, amount = float(value), float(amount)
+
+    limit = float("inf") if steps is None else steps
+    performed = 0
+    recent_values = [value]
+
+    while performed < limit and (steps is not None or performed == 0 or value > 0):
+        # Skipping runs of additions within the interval between powers of two that contains the last three values
+        if len(recent_values) == 3 and recent_values[0] > 0 and len(set(math.frexp(recent)[1] for recent in recent_values)) == 1:
+            lower_bound = math.ldexp(0.5, math.frexp(value)[1])
+            change = recent_values[2] - recent_values[1]
+            distance = value - lower_bound if change < 0 else 2 * lower_bound - value
+
+            run = min(int(distance // abs(change)) - 2, limit - performed)
+            if run > 0:
+                value += change * run
+                performed += run
+
+            recent_values = [value]
+            continue
+
+        value += amount
+        performed += 1
+        recent_values = recent_values[-2:] + [value]
+
+    return value, performed
+
 
 class NetworkFlow(ComponentManager, Agent):
     """Class that represents a network flow."""
@@ -15,6 +69,9 @@ class NetworkFlow(ComponentManager, Agent):
     _instances: list["NetworkFlow"] = []
     _object_count = 0
 
+    # Metrics kept in the compact records of archived flows (see the "archive" retention policy of the Simulator)
+    _archived_metrics = ("Instance ID", "Object Type", "Start", "End", "Source", "Target", "Status")
+
     def __init__(
         self,
         obj_id: int | None = None,
@@ -26,6 +83,7 @@ class NetworkFlow(ComponentManager, Agent):
         path: list = [],
         data_to_transfer: int = 0,
         metadata: dict = {},
+        count: int = 1,
     ):
         """Creates a NetworkFlow object.
 
@@ -39,6 +97,8 @@ class NetworkFlow(ComponentManager, Agent):
             path (list, optional): Network path used to pass the flow over the list of network nodes. Defaults to [].
             data_to_transfer (int, optional): Amount of data transferred by the self. Defaults to 0.
             metadata (dict, optional): Custom flow metadata. Defaults to {}.
+            count (int, optional): Number of identical transfers carried by the flow (e.g., data packets aggregated into a bulk
+                data packet), which receives the bandwidth those transfers would receive separately. Defaults to 1.
 
         Returns:
             object: Created NetworkFlow object.
@@ -66,25 +126,41 @@ class NetworkFlow(ComponentManager, Agent):
         # Network capacity available to the flow
         self.bandwidth: dict[int, float] = {}
         self.last_updated_bandwidth: dict[int, float] = {}
-        self._bandwidth_history: list[float] = []
+
+        # Bottleneck bandwidth (i.e., the smallest bandwidth share in the path) used by the flow since a given step, along with the
+        # step in which the flow will finish if that bandwidth does not change. The flow progress is calculated from these attributes
+        # rather than updated at each step
+        self._bottleneck_bandwidth: float | None = None
+        self._bottleneck_start: int | None = None
+        self._completion_step: int | None = None
+        self._last_step: int | None = None
+
+        # Running statistics of the bottleneck bandwidth over the steps in which the flow transferred data
+        self._min_bandwidth: float | None = None
+        self._max_bandwidth: float | None = None
+        self._bandwidth_sum: float = 0
+        self._transfer_steps = 0
 
         # Temporal information about the flow
         self.start = start
         self.end: int | None = None
 
-        # Amount of data transferred by the flow
-        self.data_to_transfer = data_to_transfer
+        # Amount of data the flow had to transfer when its bottleneck bandwidth was last changed
+        self._data_to_transfer = data_to_transfer
 
         # Custom flow metadata
         self.metadata = metadata
 
+        # Number of identical transfers carried by the flow (its amount of data to transfer comprises the data of all transfers)
+        self.count = count
+
         # Flow queue delay
         self._queue_delay = 0
 
         # Adding a reference to the flow inside the network links that comprehend the "path" attribute
         for i in range(0, len(path) - 1):
             link = self.topology[path[i]][path[i + 1]]
-            link["active_flows"].append(self)
+            link["active_flows"].add(self)
             self.bandwidth[link["id"]] = None
             self.last_updated_bandwidth[link["id"]] = None
 
@@ -111,9 +187,12 @@ class NetworkFlow(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Metrics to be collected (the others are not computed). Defaults to None (all metrics).
+
         Returns:
             metrics (dict): Object metrics.
         """
@@ -121,43 +200,86 @@ class NetworkFlow(ComponentManager, Agent):
         actual_bw = min(bw) if len([bw for bw in self.bandwidth.values() if bw is None]) == 0 else None
 
         if self.metadata["type"] == "layer":
-            object_being_transferred = f"{str(self.metadata['object'])} ({self.metadata['object'].instruction})"
+            object_being_transferred = lambda: f"{str(self.metadata['object'])} ({self.metadata['object'].instruction})"
         else:
-            object_being_transferred = str(self.metadata["object"])
+            object_being_transferred = lambda: str(self.metadata["object"])
 
-        metrics = {
-            "Instance ID": self.id,
+        metric_getters = {
+            "Instance ID": lambda: self.id,
             "Object being Transferred": object_being_transferred,
-            "Object Type": self.metadata["type"],
-            "Start": self.start,
-            "End": self.end,
-            "Source": self.source.id if self.source else None,
-            "Target": self.target.id if self.target else None,
-            "Path": [node.id for node in self.path],
-            "Links Bandwidth": bw,
-            "Actual Bandwidth": actual_bw,
-            "Status": self.status,
-            "Data to Transfer": self.data_to_transfer,
+            "Object Type": lambda: self.metadata["type"],
+            "Start": lambda: self.start,
+            "End": lambda: self.end,
+            "Source": lambda: self.source.id if self.source else None,
+            "Target": lambda: self.target.id if self.target else None,
+            "Path": lambda: [node.id for node in self.path],
+            "Links Bandwidth": lambda: bw,
+            "Actual Bandwidth": lambda: actual_bw,
+            "Status": lambda: self.status,
+            "Data to Transfer": lambda: self.data_to_transfer,
         }
+
+        metrics = {metric: getter() for metric, getter in metric_getters.items() if fields is None or metric in fields}
         return metrics
 
+    @property
+    def data_to_transfer(self) -> float:
+        """Amount of data the flow still has to transfer, calculated from its bottleneck bandwidth.
+
+        Returns:
+            float: Amount of data to transfer.
+        """
+        if not self._bottleneck_bandwidth or self.status != "active":
+            return self._data_to_transfer
+
+        # Flows that were already activated at the current step have already transferred data at that step
+        elapsed_steps = self.model.schedule.steps - self._bottleneck_start
+        if self._last_step == self.model.schedule.steps:
+            elapsed_steps += 1
+
+        return _repeat_addition(value=self._data_to_transfer, amount=-self._bottleneck_bandwidth, steps=elapsed_steps)[0]
+
+    @data_to_transfer.setter
+    def data_to_transfer(self, value: float):
+        """Overrides the amount of data the flow still has to transfer.
+
+        Args:
+            value (float): Amount of data to transfer.
+        """
+        self._data_to_transfer = value
+
+        # Discarding the progress projected from the previous amount of data (it is projected again once the flow is activated)
+        self._bottleneck_bandwidth = None
+        self._bottleneck_start = None
+        self._completion_step = None
+
+        if self.model is not None and hasattr(self.model.schedule, "wake"):
+            self.model.schedule.wake(agent=self)
+
     def step(self):
-        """Method that executes the events involving the object at each time step."""
+        """Method that executes the events involving the object at each time step. The flow progress is only updated when the
+        bottleneck bandwidth of the flow changes or when the flow finishes, as the amount of data transferred between such events is
+        calculated from the bottleneck bandwidth.
+        """
         if self.status == "active":
-            # Updating the flow progress according to the available bandwidth
-            if any([bw is None for bw in self.bandwidth.values()]):
+            # Flows only start once all the links in their path give them a bandwidth share
+            if None in self.bandwidth.values():
                 return
 
-            if min(self.bandwidth.values()) == 0:
-                self._queue_delay += 1
-                return
+            current_step = self.model.schedule.steps
+            bandwidth = min(self.bandwidth.values())
 
-            self.data_to_transfer -= min(self.bandwidth.values())
-            self._bandwidth_history.append(min(self.bandwidth.values()))
+            # Updating the flow progress according to the previous bottleneck bandwidth whenever it changes
+            if bandwidth != self._bottleneck_bandwidth or self._bottleneck_start is None:
+                self._update_progress(step=current_step)
+                self._set_bottleneck_bandwidth(bandwidth=bandwidth, step=current_step)
 
-            if self.data_to_transfer <= 0:
+            self._last_step = current_step
+
+            if self._completion_step == current_step:
                 # Updating the completed flow's properties
-                self.data_to_transfer = 0
+                self._update_progress(step=current_step + 1)
+                self._data_to_transfer = 0
 
                 # Storing the current step as when the flow ended
                 self.end = self.model.schedule.steps + 1
@@ -191,3 +313,43 @@ class NetworkFlow(ComponentManager, Agent):
                     data_packet._on_flow_finished(self)
 
                 self.model.schedule.remove(self)
+
+    def _update_progress(self, step: int):
+        """Updates the amount of data transferred by the flow (or the time it waited for bandwidth) until a given step according to
+        its current bottleneck bandwidth.
+
+        Args:
+            step (int): Time step until which the flow progress is updated (exclusive).
+        """
+        if self._bottleneck_start is None:
+            return
+
+        elapsed_steps = step - self._bottleneck_start
+
+        if self._bottleneck_bandwidth == 0:
+            self._queue_delay += elapsed_steps
+        else:
+            self._data_to_transfer = _repeat_addition(value=self._data_to_transfer, amount=-self._bottleneck_bandwidth, steps=elapsed_steps)[0]
+            self._bandwidth_sum = _repeat_addition(value=self._bandwidth_sum, amount=self._bottleneck_bandwidth, steps=elapsed_steps)[0]
+            self._transfer_steps += elapsed_steps
+
+        self._bottleneck_start = step
+
+    def _set_bottleneck_bandwidth(self, bandwidth: float, step: int):
+        """Defines the bottleneck bandwidth used by the flow from a given step on, projecting the step in which the flow will finish.
+
+        Args:
+            bandwidth (float): Bottleneck bandwidth.
+            step (int): Time step from which the bottleneck bandwidth is used.
+        """
+        self._bottleneck_bandwidth = bandwidth
+        self._bottleneck_start = step
+        self._completion_step = None
+
+        if bandwidth > 0:
+            self._min_bandwidth = bandwidth if self._min_bandwidth is None else min(self._min_bandwidth, bandwidth)
+            self._max_bandwidth = bandwidth if self._max_bandwidth is None else max(self._max_bandwidth, bandwidth)
+
+            # Finding the number of steps needed to transfer the remaining data when the bandwidth is subtracted at each step
+            _, steps = _repeat_addition(value=self._data_to_transfer, amount=-bandwidth)
+            self._completion_step = step + steps - 1
@@ -6,14 +6,122 @@ from edge_sim_py.component_manager import ComponentManager
 # Mesa modules
 from mesa import Agent
 
+# Python libraries
+from collections import Counter
+
+
+class OrderedSet:
+    """Set that keeps the order in which items were added (e.g., the order in which network flows started crossing a link), with
+    constant-time insertions, removals, and membership checks."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: object = ()):
+        """Creates an OrderedSet object.
+
+        Args:
+            items (object, optional): Initial items. Defaults to ().
+        """
+        self._items = dict.fromkeys(items)
+
+    def add(self, item: object):
+        """Adds an item to the set (items already in the set keep their position).
+
+        Args:
+            item (object): Item to be added.
+        """
+        self._items[item] = None
+
+    def remove(self, item: object):
+        """Removes an item from the set, raising KeyError if the item is not in the set.
+
+        Args:
+            item (object): Item to be removed.
+        """
+        del self._items[item]
+
+    def discard(self, item: object):
+        """Removes an item from the set if it is in the set.
+
+        Args:
+            item (object): Item to be removed.
+        """
+        self._items.pop(item, None)
+
+    def __contains__(self, item: object) -> bool:
+        """Checks whether an item is in the set.
+
+        Args:
+            item (object): Item.
+
+        Returns:
+            bool: Information of whether the item is in the set.
+        """
+        return item in self._items
+
+    def __iter__(self) -> object:
+        """Iterates over the items in the order they were added.
+
+        Returns:
+            object: Iterator over the items.
+        """
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        """Gets the number of items in the set.
+
+        Returns:
+            int: Number of items.
+        """
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the set with another OrderedSet or with a list of items (in both cases, the order of items is considered).
+
+        Args:
+            other (object): OrderedSet or list of items.
+
+        Returns:
+            bool: Information of whether both have the same items in the same order.
+        """
+        if isinstance(other, OrderedSet):
+            return list(self._items) == list(other._items)
+        return list(self._items) == other
+
+    def __repr__(self) -> str:
+        """Returns the representation of the set.
+
+        Returns:
+            str: Set representation.
+        """
+        return f"OrderedSet({list(self._items)})"
+
 
 class NetworkLink(dict, ComponentManager, Agent):
-    """Class that represents a network link."""
+    """Class that represents a network link.
+
+    Link properties are stored in slots, so that they can be read as attributes (e.g., "link.bandwidth") without the overhead of
+    dictionary-backed attribute lookups. Every property is also kept as a dictionary item, as NetworkX, custom algorithms, and
+    serializers (e.g., "json.dumps()") access links through the mapping interface (e.g., "link["bandwidth"]"). Properties not
+    declared below (e.g., user-defined ones) are stored in the object's namespace and can be accessed both ways as well.
+    """
 
     # Class attributes that allow this class to use helper methods from ComponentManager
     _instances = []
     _object_count = 0
 
+    # Link properties stored in slots (in the order they are listed by the mapping interface)
+    __slots__ = ("id", "topology", "nodes", "delay", "bandwidth", "bandwidth_demand", "applications", "active_flows", "active", "model", "unique_id")
+    _fields = frozenset(__slots__)
+
+    # Attributes that influence network routing and counter of changes to them (used to invalidate cached network paths)
+    _routing_attributes = ("delay", "bandwidth")
+    _routing_changes = 0
+
+    # Structures used to store the occupancy of links: network flows crossing the link and number of communication paths of each
+    # application that include the link (values of other types, such as lists loaded from datasets, are converted automatically)
+    _occupancy_attributes = {"active_flows": OrderedSet, "applications": Counter}
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates a NetworkLink object.
 
@@ -45,11 +153,11 @@ class NetworkLink(dict, ComponentManager, Agent):
         self["bandwidth"] = 0
         self["bandwidth_demand"] = 0
 
-        # List of applications using the link for routing data to their users
-        self["applications"] = []
+        # Applications using the link for routing data to their users (along with the number of communication paths that use it)
+        self["applications"] = Counter()
 
-        # List of network flows passing through the link
-        self["active_flows"] = []
+        # Network flows passing through the link
+        self["active_flows"] = OrderedSet()
 
         # Network link active status
         self["active"] = True
@@ -58,20 +166,6 @@ class NetworkLink(dict, ComponentManager, Agent):
         self["model"] = None
         self["unique_id"] = None
 
-    def __getattr__(self, attribute_name: str):
-        """Retrieves an object attribute by its name.
-
-        Args:
-            attribute_name (str): Name of the attribute to be retrieved.
-
-        Returns:
-            (any): Attribute value.
-        """
-        if attribute_name in self:
-            return self[attribute_name]
-        else:
-            raise AttributeError(f"Object {self} has no such attribute '{attribute_name}'.")
-
     def __setattr__(self, attribute_name: str, attribute_value: object):
         """Overrides the value of an object attribute.
 
@@ -92,12 +186,114 @@ class NetworkLink(dict, ComponentManager, Agent):
         else:
             raise AttributeError(f"Object {self} has no such attribute '{attribute_name}'.")
 
+    def __setitem__(self, key: str, value: object):
+        """Overrides the value of a link property, keeping track of changes to properties that influence network routing. The value
+        is stored both as a dictionary item and as an attribute (in slots for declared properties).
+
+        Args:
+            key (str): Property name.
+            value (object): Property value.
+        """
+        if key in NetworkLink._routing_attributes and self.get(key, value) != value:
+            NetworkLink._routing_changes += 1
+
+        occupancy_type = NetworkLink._occupancy_attributes.get(key)
+        if occupancy_type is not None and type(value) is not occupancy_type:
+            value = occupancy_type(value)
+
+        dict.__setitem__(self, key, value)
+
+        if key in NetworkLink._fields:
+            object.__setattr__(self, key, value)
+        else:
+            self.__dict__[key] = value
+
+    def __delitem__(self, key: str):
+        """Deletes a link property.
+
+        Args:
+            key (str): Property name.
+        """
+        dict.__delitem__(self, key)
+
+        if key in NetworkLink._fields:
+            object.__delattr__(self, key)
+        else:
+            del self.__dict__[key]
+
+    def update(self, *args, **kwargs):
+        """Overrides multiple link properties at once (e.g., when NetworkX updates the attributes of an existing edge).
+
+        Args:
+            *args: Dictionary or iterable of (property name, value) pairs.
+            **kwargs: Property values, indexed by their names.
+        """
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """Retrieves the value of a link property, defining it with a default value if the link does not have such property.
+
+        Args:
+            key (str): Property name.
+            default (object, optional): Default value. Defaults to None.
+
+        Returns:
+            object: Property value.
+        """
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default) -> object:
+        """Removes a link property and returns its value.
+
+        Args:
+            key (str): Property name.
+            *default: Value returned if the link does not have the property (a KeyError is raised if no value is given).
+
+        Returns:
+            object: Property value.
+        """
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> tuple:
+        """Removes the last link property defined and returns its name and value.
+
+        Returns:
+            tuple: Property name and value.
+        """
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def clear(self):
+        """Removes all link properties."""
+        for key in list(self):
+            del self[key]
+
+    def copy(self) -> dict:
+        """Creates a dictionary with the link properties.
+
+        Returns:
+            dict: Link properties.
+        """
+        return dict(self)
+
     def _to_dict(self) -> dict:
         """Method that overrides the way the object is formatted to JSON."
 
         Returns:
             dict: JSON-friendly representation of the object as a dictionary.
         """
+        # Applications are listed once for each of their communication paths that include the link, so that the number of paths
+        # of each application is restored when datasets are loaded
         dictionary = {
             "attributes": {
                 "id": self.id,
@@ -109,7 +305,7 @@ class NetworkLink(dict, ComponentManager, Agent):
             "relationships": {
                 "topology": {"class": "Topology", "id": self.topology.id},
                 "active_flows": [{"class": type(flow).__name__, "id": flow.id} for flow in self.active_flows],
-                "applications": [{"class": type(app).__name__, "id": app.id} for app in self.applications],
+                "applications": [{"class": type(app).__name__, "id": app.id} for app in self.applications.elements()],
                 "nodes": [{"class": type(node).__name__, "id": node.id} for node in self.nodes],
             },
         }
@@ -127,4 +323,4 @@ class NetworkLink(dict, ComponentManager, Agent):
     def step(self):
         """Method that executes the events involving the object at each time step."""
         # Updating the link's bandwidth demand based on the slice of bandwidth used by the active flows that cross it in the current step
-        self["bandwidth_demand"] = sum(flow.bandwidth[self.id] for flow in self["active_flows"])
+        self["bandwidth_demand"] = sum(flow.bandwidth[self.id] for flow in self.active_flows)
@@ -10,9 +10,6 @@ from edge_sim_py.components.network_flow import NetworkFlow
 # Mesa modules
 from mesa import Agent  # type: ignore
 
-# Python libraries
-import networkx as nx  # type: ignore
-
 if TYPE_CHECKING:
     from edge_sim_py.components.data_packet import DataPacket
     from edge_sim_py.components.user import User
@@ -216,8 +213,7 @@ class Service(ComponentManager, Agent):
                     self._available = False
 
                     # Selecting the path that will be used to transfer the service state
-                    path = nx.shortest_path(
-                        G=self.model.topology,
+                    path = self.model.topology.get_shortest_path(
                         source=self.server.base_station.network_switch,
                         target=migration["target"].base_station.network_switch,
                     )
@@ -329,6 +325,11 @@ class Service(ComponentManager, Agent):
             }
         )
 
+        # Waking up the agents involved in the provisioning process in case the scheduler only activates agents with pending work
+        if hasattr(self.model.schedule, "wake"):
+            self.model.schedule.wake(agent=self)
+            self.model.schedule.wake(agent=target_server)
+
     def _start_processing(self, data_packet: "DataPacket"):
         """Starts processing a data packet.
 
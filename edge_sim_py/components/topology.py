@@ -3,6 +3,7 @@
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
 from edge_sim_py.components.network_flow import NetworkFlow
+from edge_sim_py.components.network_link import NetworkLink
 
 # Mesa modules
 from mesa import Agent  # type: ignore
@@ -37,6 +38,12 @@ class Topology(ComponentManager, nx.Graph, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Cache of shortest paths (indexed by source, target, and weight) and path delays. Both are invalidated whenever nodes or
+        # links are added or removed or whenever the properties of network links that influence routing change
+        self._shortest_paths: dict = {}
+        self._path_delays: dict = {}
+        self._cached_routing_changes = NetworkLink._routing_changes
+
         # Initializing the NetworkX topology
         if existing_graph is None:
             nx.Graph.__init__(self)
@@ -95,13 +102,160 @@ class Topology(ComponentManager, nx.Graph, Agent):
         Returns:
             path_delay (int): Network path delay.
         """
-        path_delay = 0
+        self._validate_routing_cache()
+
+        path_key = tuple(path)
+        path_delay = self._path_delays.get(path_key)
 
-        # Calculates the communication delay based on the delay property of each network link in the path
-        path_delay = nx.classes.function.path_weight(G=self, path=path, weight="delay")
+        if path_delay is None:
+            # Calculates the communication delay based on the delay property of each network link in the path (links are accessed
+            # directly through the adjacency structure, which avoids creating NetworkX views for every hop)
+            try:
+                path_delay = sum(self._adj[path[i]][path[i + 1]].delay for i in range(len(path) - 1))
+            except KeyError:
+                raise nx.NetworkXNoPath("path does not exist") from None
+            self._path_delays[path_key] = path_delay
 
         return path_delay
 
+    def get_shortest_path(self, source: object, target: object, weight: str = None) -> list:
+        """Gets the shortest network path between two nodes. Paths are calculated with NetworkX's "shortest_path" method the first
+        time they are requested and cached, so that repeated routing queries are served from memory.
+
+        Args:
+            source (object): Node where the path starts.
+            target (object): Node where the path ends.
+            weight (str, optional): Link property used as weight (unweighted paths are calculated if None). Defaults to None.
+
+        Returns:
+            list: Shortest network path.
+        """
+        self._validate_routing_cache()
+
+        path_key = (source, target, weight)
+        path = self._shortest_paths.get(path_key)
+
+        if path is None:
+            path = nx.shortest_path(G=self, source=source, target=target, weight=weight)
+            self._shortest_paths[path_key] = path
+
+        return list(path)
+
+    def precompute_shortest_paths(self, weight: str = "delay"):
+        """Fills the shortest path cache with the paths between all pairs of nodes using Dijkstra's algorithm.
+
+        Args:
+            weight (str, optional): Link property used as weight. Defaults to "delay".
+        """
+        self._validate_routing_cache()
+
+        if weight is None:
+            # Unweighted paths are calculated one by one so that they match the ones found by NetworkX's bidirectional search
+            for source in self.nodes:
+                for target in self.nodes:
+                    self.get_shortest_path(source=source, target=target)
+        else:
+            for source, paths in nx.all_pairs_dijkstra_path(G=self, weight=weight):
+                for target, path in paths.items():
+                    self._shortest_paths[(source, target, weight)] = path
+
+    def _validate_routing_cache(self):
+        """Clears the cached paths and path delays if network link properties that influence routing have changed."""
+        if self._cached_routing_changes != NetworkLink._routing_changes:
+            self._clear_routing_cache()
+
+    def _clear_routing_cache(self):
+        """Clears the cached paths and path delays."""
+        # Caches might not exist yet when NetworkX fills the graph while the topology is being created
+        if "_shortest_paths" in self.__dict__:
+            self._shortest_paths.clear()
+            self._path_delays.clear()
+            self._cached_routing_changes = NetworkLink._routing_changes
+
+    def add_node(self, node_for_adding: object, **attr):
+        """Adds a node to the topology, invalidating cached paths.
+
+        Args:
+            node_for_adding (object): Node to be added.
+        """
+        nx.Graph.add_node(self, node_for_adding, **attr)
+        self._clear_routing_cache()
+
+    def add_nodes_from(self, nodes_for_adding: list, **attr):
+        """Adds multiple nodes to the topology, invalidating cached paths.
+
+        Args:
+            nodes_for_adding (list): Nodes to be added.
+        """
+        nx.Graph.add_nodes_from(self, nodes_for_adding, **attr)
+        self._clear_routing_cache()
+
+    def remove_node(self, n: object):
+        """Removes a node from the topology, invalidating cached paths.
+
+        Args:
+            n (object): Node to be removed.
+        """
+        nx.Graph.remove_node(self, n)
+        self._clear_routing_cache()
+
+    def remove_nodes_from(self, nodes: list):
+        """Removes multiple nodes from the topology, invalidating cached paths.
+
+        Args:
+            nodes (list): Nodes to be removed.
+        """
+        nx.Graph.remove_nodes_from(self, nodes)
+        self._clear_routing_cache()
+
+    def add_edge(self, u_of_edge: object, v_of_edge: object, **attr):
+        """Adds a link to the topology, invalidating cached paths.
+
+        Args:
+            u_of_edge (object): First node connected by the link.
+            v_of_edge (object): Second node connected by the link.
+        """
+        nx.Graph.add_edge(self, u_of_edge, v_of_edge, **attr)
+        self._clear_routing_cache()
+
+    def add_edges_from(self, ebunch_to_add: list, **attr):
+        """Adds multiple links to the topology, invalidating cached paths.
+
+        Args:
+            ebunch_to_add (list): Links to be added.
+        """
+        nx.Graph.add_edges_from(self, ebunch_to_add, **attr)
+        self._clear_routing_cache()
+
+    def remove_edge(self, u: object, v: object):
+        """Removes a link from the topology, invalidating cached paths.
+
+        Args:
+            u (object): First node connected by the link.
+            v (object): Second node connected by the link.
+        """
+        nx.Graph.remove_edge(self, u, v)
+        self._clear_routing_cache()
+
+    def remove_edges_from(self, ebunch: list):
+        """Removes multiple links from the topology, invalidating cached paths.
+
+        Args:
+            ebunch (list): Links to be removed.
+        """
+        nx.Graph.remove_edges_from(self, ebunch)
+        self._clear_routing_cache()
+
+    def clear(self):
+        """Removes all nodes and links from the topology, invalidating cached paths."""
+        nx.Graph.clear(self)
+        self._clear_routing_cache()
+
+    def clear_edges(self):
+        """Removes all links from the topology, invalidating cached paths."""
+        nx.Graph.clear_edges(self)
+        self._clear_routing_cache()
+
     def _allocate_communication_path(self, communication_path: list, app: object):
         """Adds the demand of a given application to a set of links that comprehend a communication path.
 
@@ -117,8 +271,7 @@ class Topology(ComponentManager, nx.Graph, Agent):
 
                     link = self[node1][node2]
 
-                    if app not in link["applications"]:
-                        link["applications"].append(app)
+                    link["applications"][app] += 1
 
     def _release_communication_path(self, communication_path: list, app: object):
         """Releases the demand of a given application from a set of links that comprehend a communication path.
@@ -134,5 +287,8 @@ class Topology(ComponentManager, nx.Graph, Agent):
                     node2 = path[i + 1]
                     link = self[node1][node2]
 
+                    # Applications stop being associated with the link once none of their communication paths include it
                     if app in link["applications"]:
-                        link["applications"].remove(app)
+                        link["applications"][app] -= 1
+                        if link["applications"][app] <= 0:
+                            del link["applications"][app]
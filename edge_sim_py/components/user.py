@@ -6,14 +6,15 @@ from edge_sim_py.component_manager import ComponentManager
 from edge_sim_py.components.topology import Topology
 from edge_sim_py.components.base_station import BaseStation
 from edge_sim_py.components.network_switch import NetworkSwitch
+from edge_sim_py.components.mobility_models.coordinates_trace import CoordinatesTrace
 
 # Mesa modules
 from mesa import Agent  # type: ignore
 
 # Python libraries
 import copy
-import networkx as nx  # type: ignore
 import random
+from bisect import bisect_right
 
 if TYPE_CHECKING:
     from edge_sim_py.components.application import Application
@@ -45,9 +46,11 @@ class User(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
-        # User coordinates
-        self.coordinates_trace = []
+        # User coordinates. Positions of the trace already visited by the user can be discarded to save memory, at the cost of
+        # exporting only the remaining part of the trace (along with the number of discarded steps)
+        self.coordinates_trace = CoordinatesTrace()
         self.coordinates = None
+        self.discard_visited_coordinates = False
 
         # List of applications accessed by the user
         self.applications: list["Application"] = []
@@ -55,9 +58,10 @@ class User(ComponentManager, Agent):
         # Reference to the base station the user is connected to
         self.base_station: "BaseStation" | None = None
 
-        # User access metadata
-        self.making_requests = {}
+        # User access metadata (the steps in which the user makes requests are derived from the history of its access patterns and
+        # from the steps marked as requested in datasets, which are stored as sorted lists of [start, end] intervals per application)
         self.access_patterns = {}
+        self._loaded_requests = {}
 
         # User mobility model
         self.mobility_model = None
@@ -95,11 +99,11 @@ class User(ComponentManager, Agent):
             "attributes": {
                 "id": self.id,
                 "coordinates": self.coordinates,
-                "coordinates_trace": self.coordinates_trace,
+                "coordinates_trace": self.coordinates_trace._to_dict(),
                 "delays": copy.deepcopy(self.delays),
                 "delay_slas": copy.deepcopy(self.delay_slas),
                 "communication_paths": copy.deepcopy(self.communication_paths),
-                "making_requests": copy.deepcopy(self.making_requests),
+                "making_requests": self.making_requests,
                 "mobility_model_parameters": copy.deepcopy(self.mobility_model_parameters) if self.mobility_model_parameters else {},
                 "packet_size_strategy": copy.deepcopy(self.packet_size_strategy),
             },
@@ -112,25 +116,49 @@ class User(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    @property
+    def coordinates_trace(self) -> CoordinatesTrace:
+        """Coordinates of the user at each time step.
+
+        Returns:
+            CoordinatesTrace: User mobility trace.
+        """
+        return self._coordinates_trace
+
+    @coordinates_trace.setter
+    def coordinates_trace(self, value: object):
+        """Defines the coordinates of the user at each time step, converting lists of coordinates (one per step) and exported runs
+        of coordinates (see "CoordinatesTrace._to_dict()") into a compact trace.
+
+        Args:
+            value (object): User mobility trace.
+        """
+        if isinstance(value, CoordinatesTrace):
+            self._coordinates_trace = value
+        elif isinstance(value, dict):
+            self._coordinates_trace = CoordinatesTrace._from_dict(dictionary=value)
+        else:
+            self._coordinates_trace = CoordinatesTrace(items=value)
+
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Metrics to be collected (the others are not computed). Defaults to None (all metrics).
+
         Returns:
             metrics (dict): Object metrics.
         """
-        access_history = {}
-        for app in self.applications:
-            access_history[str(app.id)] = self.access_patterns[str(app.id)].history
-
-        metrics = {
-            "Instance ID": self.id,
-            "Coordinates": self.coordinates,
-            "Base Station": f"{self.base_station} ({self.base_station.coordinates})" if self.base_station else None,
-            "Delays": copy.deepcopy(self.delays),
-            "Communication Paths": copy.deepcopy(self.communication_paths),
-            "Making Requests": copy.deepcopy(self.making_requests),
-            "Access History": copy.deepcopy(access_history),
+        metric_getters = {
+            "Instance ID": lambda: self.id,
+            "Coordinates": lambda: self.coordinates,
+            "Base Station": lambda: f"{self.base_station} ({self.base_station.coordinates})" if self.base_station else None,
+            "Delays": lambda: copy.deepcopy(self.delays),
+            "Communication Paths": lambda: copy.deepcopy(self.communication_paths),
+            "Access History": lambda: {str(app.id): copy.deepcopy(self.access_patterns[str(app.id)].history) for app in self.applications},
         }
+
+        metrics = {metric: getter() for metric, getter in metric_getters.items() if fields is None or metric in fields}
         return metrics
 
     def step(self):
@@ -144,22 +172,19 @@ class User(ComponentManager, Agent):
             # his application to be provisioned. Access time represents the period in which the user is successfully accessing
             # his application, meaning his application is available. We assume that an application is only available when all its
             # services are available.
-            if self.making_requests[str(app.id)][str(current_step)]:
+            if self._is_making_requests(app=app, step=current_step):
                 if len([s for s in app.services if s._available]) == len(app.services):
-                    self._start_flow(app=app)
+                    # Requests are transferred as data packets unless their delays are computed by an analytical latency model
+                    if getattr(self.model, "latency_model", None) is None:
+                        self._start_flow(app=app)
+                    elif str(app.id) not in self.communication_paths:
+                        self.set_communication_path(app=app)
                     last_access["access_time"] += 1
                 else:
                     last_access["waiting_time"] += 1
 
-            # Updating user's making requests attribute for the next time step
-            if current_step + 1 >= last_access["start"] and current_step + 1 <= last_access["end"]:
-                self.making_requests[str(app.id)][str(current_step + 1)] = True
-            else:
-                self.making_requests[str(app.id)][str(current_step + 1)] = False
-
             # Creating new access request if needed
             if current_step + 1 == last_access["next_access"]:
-                self.making_requests[str(app.id)][str(current_step + 1)] = True
                 self.access_patterns[str(app.id)].get_next_access(start=current_step + 1)
 
         # Re-executing user's mobility model in case no future mobility track is known by the simulator
@@ -167,11 +192,14 @@ class User(ComponentManager, Agent):
             self.mobility_model(self)
 
         # Updating user's location
+        if self.discard_visited_coordinates:
+            self.coordinates_trace.discard(until=self.model.schedule.steps)
+
         if self.coordinates != self.coordinates_trace[self.model.schedule.steps]:
             self.coordinates = self.coordinates_trace[self.model.schedule.steps]
 
             # Connecting the user to the closest base station
-            self.base_station = BaseStation.find_by(attribute_name="coordinates", attribute_value=self.coordinates)
+            self.base_station = BaseStation.find_nearest(coordinates=self.coordinates)
 
             for application in self.applications:
                 # Only updates the routing path of apps available (i.e., whose services are available)
@@ -180,9 +208,90 @@ class User(ComponentManager, Agent):
                     # Recomputing user communication paths
                     self.set_communication_path(app=application)
                 else:
+                    # Releasing the links of the previous communication path before discarding it
+                    if str(application.id) in self.communication_paths:
+                        path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(application.id)]]
+                        Topology.first()._release_communication_path(communication_path=path, app=application)
+
                     self.communication_paths[str(application.id)] = []
                     self._compute_delay(app=application)
 
+    @property
+    def making_requests(self) -> dict:
+        """Legacy view of the time steps in which the user makes requests to each application, formatted as
+        {app_id: {step: bool}} for every step from 1 up to the next simulation step. This view is built from the history of the
+        user's access patterns each time it is accessed, so it should only be used to export data (use "_is_making_requests"
+        to check whether the user makes requests at a given step).
+
+        Returns:
+            dict: Time steps in which the user makes requests to each application.
+        """
+        current_step = self.model.schedule.steps if self.model else 0
+
+        making_requests = {}
+        for app_id in dict.fromkeys([*self.access_patterns.keys(), *self._loaded_requests.keys()]):
+            history = self.access_patterns[app_id].history if app_id in self.access_patterns else []
+            intervals = [[access["start"], max(access["start"], access["end"])] for access in history]
+            last_step = max(history[0]["start"], current_step + 1) if len(history) > 0 else 0
+
+            # Steps marked as requested in datasets are covered by the view even if they are ahead of the simulation
+            loaded_intervals = self._loaded_requests.get(app_id, [])
+            if len(loaded_intervals) > 0:
+                last_step = max(last_step, loaded_intervals[-1][1])
+
+            requests = dict.fromkeys((str(step) for step in range(1, last_step + 1)), False)
+            for start, end in intervals + loaded_intervals:
+                for step in range(start, min(end, last_step) + 1):
+                    requests[str(step)] = True
+
+            making_requests[app_id] = requests
+
+        return making_requests
+
+    @making_requests.setter
+    def making_requests(self, value: dict):
+        """Defines the steps in which the user makes requests from the legacy making requests view (e.g., when loading datasets).
+        Each run of consecutive requested steps is stored as a [start, end] interval, and the user makes requests at the steps
+        covered by those intervals in addition to the steps covered by the history of its access patterns.
+
+        Args:
+            value (dict): Time steps in which the user makes requests to each application.
+        """
+        self._loaded_requests = {}
+
+        for app_id, requests in value.items():
+            intervals = []
+            for step in sorted(int(step) for step, requested in requests.items() if requested):
+                if len(intervals) > 0 and intervals[-1][1] == step - 1:
+                    intervals[-1][1] = step
+                else:
+                    intervals.append([step, step])
+
+            if len(intervals) > 0:
+                self._loaded_requests[str(app_id)] = intervals
+
+    def _is_making_requests(self, app: "Application", step: int) -> bool:
+        """Checks whether the user makes requests to an application at a given time step. Accesses are sorted by their start
+        steps in the access pattern history (as are the intervals loaded from datasets), so the access that could cover the step
+        is found with a binary search.
+
+        Args:
+            app (Application): Application accessed by the user.
+            step (int): Time step.
+
+        Returns:
+            bool: Whether the user makes requests to the application at the given step.
+        """
+        history = self.access_patterns[str(app.id)].history
+        index = bisect_right(history, step, key=lambda access: access["start"]) - 1
+        if index >= 0 and step <= max(history[index]["start"], history[index]["end"]):
+            return True
+
+        intervals = self._loaded_requests.get(str(app.id), [])
+        index = bisect_right(intervals, step, key=lambda interval: interval[0]) - 1
+
+        return index >= 0 and step <= intervals[index][1]
+
     def _compute_delay(self, app: "Application", metric: str = "latency") -> int:
         """Computes the delay of an application accessed by the user.
 
@@ -229,7 +338,7 @@ class User(ComponentManager, Agent):
         topology: Topology = Topology.first()  # type: ignore
 
         # Releasing links used in the past to connect the user with its application
-        if app in self.communication_paths:
+        if str(app.id) in self.communication_paths:
             path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
             topology._release_communication_path(communication_path=path, app=app)
 
@@ -253,20 +362,14 @@ class User(ComponentManager, Agent):
                 if origin == target:
                     path = [origin.network_switch]
                 else:
-                    path = nx.shortest_path(
-                        G=topology,
-                        source=origin.network_switch,
-                        target=target.network_switch,
-                        weight="delay",
-                        method="dijkstra",
-                    )
+                    path = topology.get_shortest_path(source=origin.network_switch, target=target.network_switch, weight="delay")
 
                 # Adding the best path found to the communication path
                 self.communication_paths[str(app.id)].append([network_switch.id for network_switch in path])
 
-                # Computing the new demand of chosen links
-                path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
-                topology._allocate_communication_path(communication_path=path, app=app)
+        # Computing the new demand of chosen links
+        path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
+        topology._allocate_communication_path(communication_path=path, app=app)
 
         # Computing application's delay
         self._compute_delay(app=app, metric="latency")
@@ -292,7 +395,7 @@ class User(ComponentManager, Agent):
         self.delays[str(app.id)] = None
 
     def _set_initial_position(self, coordinates: list, number_of_replicates: int = 0):
-        """Defines the initial coordinates for the user, automatically connecting to a base station in that position.
+        """Defines the initial coordinates for the user, automatically connecting to the base station closest to that position.
 
         Args:
             coordinates (list): Initial user coordinates.
@@ -305,11 +408,11 @@ class User(ComponentManager, Agent):
         self.coordinates = coordinates
         self.coordinates_trace = [coordinates for _ in range(number_of_replicates - 1)]
 
-        # Connecting the user to the base station that shares his initial position
-        base_station: BaseStation = BaseStation.find_by(attribute_name="coordinates", attribute_value=self.coordinates)  # type: ignore
+        # Connecting the user to the base station closest to his initial position
+        base_station: BaseStation = BaseStation.find_nearest(coordinates=self.coordinates)  # type: ignore
 
         if base_station is None:
-            raise Exception(f"No base station was found at coordinates {coordinates} to connect to user {self}.")
+            raise Exception(f"No base station was found near coordinates {coordinates} to connect to user {self}.")
 
         self.base_station = base_station
         base_station.users.append(self)
@@ -330,11 +433,13 @@ class User(ComponentManager, Agent):
             "max": max,
         }
 
-    def _generate_datapacket(self, app: "Application") -> "DataPacket":
+    def _generate_datapacket(self, app: "Application", aggregation_key: tuple = None) -> "DataPacket":
         """Generates a data packet for the user.
 
         Args:
             app (Application): Application accessed by the user.
+            aggregation_key (tuple, optional): Key used to merge the data packet into a bulk data packet with identical data packets
+                generated at the same step. Defaults to None (the data packet is not aggregated).
 
         Returns:
             DataPacket: Generated data packet.
@@ -348,7 +453,7 @@ class User(ComponentManager, Agent):
         elif mode == "random":
             size = random.randint(self.packet_size_strategy["min"], self.packet_size_strategy["max"])
 
-        dp = app._register_datapacket(user=self, size=size)
+        dp = app._register_datapacket(user=self, size=size, aggregation_key=aggregation_key)
         return dp
 
     def _start_flow(self, app: "Application"):
@@ -357,12 +462,21 @@ class User(ComponentManager, Agent):
         Args:
             app (Application): Application accessed by the user.
         """
-        # Generating data packet requested by the user
-        dp = self._generate_datapacket(app=app)
-
         # Defining communication path
         if str(app.id) not in self.communication_paths:
             self.set_communication_path(app=app)
+
+        # Generating data packet requested by the user (identical data packets that follow the same communication path
+        # are merged into a single bulk data packet when data packet aggregation is enabled)
+        aggregation_key = None
+        if getattr(self.model, "data_packet_aggregation", False) is True:
+            aggregation_key = tuple(tuple(p) for p in self.communication_paths[str(app.id)])
+        dp = self._generate_datapacket(app=app, aggregation_key=aggregation_key)
+
+        # Bulk data packets are initialized by the first user that generates them
+        if dp.count > 1:
+            return
+
         dp._total_path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
 
         # Initializing DataPacket agent
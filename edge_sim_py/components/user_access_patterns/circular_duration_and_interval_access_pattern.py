@@ -3,9 +3,6 @@
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
 
-# Python libraries
-from itertools import cycle
-
 
 class CircularDurationAndIntervalAccessPattern(ComponentManager):
     """Class responsible for simulating circular access patterns functionality."""
@@ -52,16 +49,13 @@ class CircularDurationAndIntervalAccessPattern(ComponentManager):
         self.duration_values = duration_values
         self.interval_values = interval_values
 
-        # History of user accesses
+        # History of user accesses and number of accesses generated by the access pattern
         self.history = []
+        self._generated_accesses = 0
 
-        # Updating the user "making_request" for the steps prior to user's first access based on the "start" attribute
+        # Attaching the access pattern to the user, whose requests are derived from the access pattern history
         if self.user:
             self.user.access_patterns[str(app.id)] = self
-            self.user.making_requests[str(app.id)] = {}
-            for step in range(1, start):
-                self.user.making_requests[str(app.id)][str(step)] = False
-            self.user.making_requests[str(app.id)][str(start)] = True
 
             # Generating the initial user request
             self.get_next_access(start=start)
@@ -99,17 +93,12 @@ class CircularDurationAndIntervalAccessPattern(ComponentManager):
         Returns:
             access (dict): Next access pattern.
         """
-        # As this type of access patterns needs a never-ending circular reference to the duration and interval attributes, we need
-        # to create generators from these attributes (initially defined as lists). However, as we also want to keep track of the
-        # duration and interval values that are cycled in the generator, we create new generator attributes representing duration
-        # and interval rather than simply transforming the original list attributes into generators
-        if not hasattr(self, "duration_generator"):
-            self.duration_generator = cycle(self.duration_values)
-        if not hasattr(self, "interval_generator"):
-            self.interval_generator = cycle(self.interval_values)
-
-        duration = next(self.duration_generator)
-        interval = next(self.interval_generator)
+        # As this type of access patterns needs a never-ending circular reference to the duration and interval attributes, values
+        # are picked in a round-robin fashion based on the number of accesses generated so far. Unlike generators, that counter
+        # can be stored in simulation checkpoints
+        duration = self.duration_values[self._generated_accesses % len(self.duration_values)]
+        interval = self.interval_values[self._generated_accesses % len(self.interval_values)]
+        self._generated_accesses += 1
 
         access = {
             "start": start,
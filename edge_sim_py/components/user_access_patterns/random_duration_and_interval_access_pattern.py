@@ -56,13 +56,9 @@ class RandomDurationAndIntervalAccessPattern(ComponentManager):
         # History of user accesses
         self.history = []
 
-        # Updating the user "making_request" for the steps prior to user's first access based on the "start" attribute
+        # Attaching the access pattern to the user, whose requests are derived from the access pattern history
         if self.user:
             self.user.access_patterns[str(app.id)] = self
-            self.user.making_requests[str(app.id)] = {}
-            for step in range(1, start):
-                self.user.making_requests[str(app.id)][str(step)] = False
-            self.user.making_requests[str(app.id)][str(start)] = True
 
             # Generating the initial user request
             self.get_next_access(start=start)
@@ -0,0 +1,203 @@
+"""Contains the functionality used to read and write dataset files.
+
+Besides the JSON format, in which datasets are dictionaries that group the specification of components by class, datasets can be
+stored as streams of records (one record per component, formatted as {"class": ..., "attributes": ..., "relationships": ...}). Such
+streams can be stored as newline-delimited JSON (".ndjson" or ".jsonl") or as sequences of msgpack objects (".msgpack"), and are
+parsed one record at a time. Files of any format can also be compressed with gzip (e.g., "dataset.msgpack.gz").
+
+Example:
+    'for class_name, specification in read_dataset("dataset.ndjson"): ...' iterates over the components of a dataset file.
+    'ComponentManager.export_scenario(save_to_file=True, file_name="dataset", file_format="msgpack", compress=True)' exports the
+    current scenario to "datasets/dataset.msgpack.gz".
+"""
+
+# Python libraries
+import os
+import gzip
+import json
+import msgpack
+from typing import Iterator
+from urllib.parse import urlparse
+from urllib.request import urlopen
+
+# File extensions of the dataset formats composed of streams of records
+NDJSON_EXTENSIONS = [".ndjson", ".jsonl"]
+MSGPACK_EXTENSIONS = [".msgpack"]
+
+
+def read_dataset(input_file: object) -> Iterator[tuple]:
+    """Lazily iterates over the components specified in a dataset.
+
+    Args:
+        input_file (object): Dataset (Python dictionary, URL for external JSON file, or path for local JSON, NDJSON, or msgpack file).
+
+    Returns:
+        Iterator[tuple]: Class name and specification (i.e., attributes and relationships) of each component.
+    """
+    # If "input_file" is a Python dictionary, no additional parsing is needed
+    if type(input_file) is dict:
+        yield from _read_dictionary(data=input_file)
+        return
+
+    # If "input_file" represents a valid URL, parses its response
+    if type(input_file) is str and all([urlparse(input_file).scheme, urlparse(input_file).netloc]):
+        yield from _read_dictionary(data=json.loads(urlopen(input_file).read()))
+        return
+
+    # If "input_file" points to the local filesystem, checks if the file exists and parses it according to its extension
+    file_path = None
+    if type(input_file) is str:
+        if os.path.exists(input_file):
+            file_path = input_file
+        elif os.path.exists(f"{os.getcwd()}/{input_file}"):
+            file_path = f"{os.getcwd()}/{input_file}"
+
+    if file_path is None:
+        raise TypeError("EdgeSimPy could not load the dataset based on the specified arguments.")
+
+    compressed = file_path.endswith(".gz")
+    extension = os.path.splitext(file_path[:-3] if compressed else file_path)[1].lower()
+    open_file = gzip.open if compressed else open
+
+    if extension in NDJSON_EXTENSIONS:
+        with open_file(file_path, "rt", encoding="UTF-8") as read_file:
+            for line in read_file:
+                if line.strip() != "":
+                    yield _parse_record(record=json.loads(line))
+
+    elif extension in MSGPACK_EXTENSIONS:
+        with open_file(file_path, "rb") as read_file:
+            for record in msgpack.Unpacker(read_file, strict_map_key=False):
+                yield _parse_record(record=record)
+
+    else:
+        with open_file(file_path, "rt", encoding="UTF-8") as read_file:
+            data = json.load(read_file)
+
+        if type(data) is not dict:
+            raise TypeError("EdgeSimPy could not load the dataset based on the specified arguments.")
+
+        yield from _read_dictionary(data=data)
+
+
+def _read_dictionary(data: dict) -> Iterator[tuple]:
+    """Iterates over the components specified in a dataset dictionary, which groups the specification of components by class.
+
+    Args:
+        data (dict): Dataset.
+
+    Returns:
+        Iterator[tuple]: Class name and specification (i.e., attributes and relationships) of each component.
+    """
+    for class_name, components in data.items():
+        for specification in components:
+            yield class_name, specification
+
+
+def _parse_record(record: dict) -> tuple:
+    """Parses a record from a stream of dataset records.
+
+    Args:
+        record (dict): Dataset record, formatted as {"class": ..., "attributes": ..., "relationships": ...}.
+
+    Returns:
+        tuple: Class name and specification (i.e., attributes and relationships) of the component.
+    """
+    if type(record) is not dict or "class" not in record:
+        raise Exception(f"Invalid dataset record: {record}. Records must be formatted as {{'class': ..., 'attributes': ..., 'relationships': ...}}.")
+
+    return record["class"], {"attributes": record.get("attributes", {}), "relationships": record.get("relationships", {})}
+
+
+class DatasetWriter:
+    """Class that writes dataset files one component at a time. The format of the file is defined by its extension: JSON files
+    (".json") group components by class, whereas NDJSON (".ndjson" or ".jsonl") and msgpack (".msgpack") files store one record per
+    component. Files whose names end with ".gz" are compressed with gzip.
+
+    Example:
+        'with DatasetWriter(file_path="dataset.msgpack.gz") as writer: writer.write(class_name="User", specification=user._to_dict())'
+    """
+
+    def __init__(self, file_path: str) -> object:
+        """Creates a DatasetWriter object.
+
+        Args:
+            file_path (str): Dataset file path.
+
+        Returns:
+            object: Created DatasetWriter object.
+        """
+        self.file_path = file_path
+
+        compressed = file_path.endswith(".gz")
+        extension = os.path.splitext(file_path[:-3] if compressed else file_path)[1].lower()
+        self.file_format = "ndjson" if extension in NDJSON_EXTENSIONS else "msgpack" if extension in MSGPACK_EXTENSIONS else "json"
+
+        directory = os.path.dirname(file_path)
+        if directory != "" and not os.path.exists(f"{directory}/"):
+            os.makedirs(directory)
+
+        open_file = gzip.open if compressed else open
+        if self.file_format == "msgpack":
+            self._file = open_file(file_path, "wb")
+        else:
+            self._file = open_file(file_path, "wt", encoding="UTF-8")
+
+        # Classes whose components were written to the file (JSON files group components by class, so each class has one section)
+        self._classes = []
+        self._components_in_section = 0
+
+        if self.file_format == "json":
+            self._file.write("{")
+
+    def __enter__(self) -> object:
+        """Allows the writer to be used as a context manager.
+
+        Returns:
+            object: DatasetWriter object.
+        """
+        return self
+
+    def __exit__(self, exception_type: type, exception: Exception, traceback: object):
+        """Closes the file when leaving the context manager."""
+        self.close()
+
+    def write(self, class_name: str, specification: dict = None):
+        """Writes a component to the dataset file.
+
+        Args:
+            class_name (str): Component class name.
+            specification (dict, optional): Component specification (i.e., its attributes and relationships). Defaults to None, which
+                only starts a (possibly empty) section for the class in JSON files.
+        """
+        if self.file_format == "json":
+            # Starting a new section when the components of a new class are written
+            if len(self._classes) == 0 or self._classes[-1] != class_name:
+                if class_name in self._classes:
+                    raise Exception(f"Components of class {class_name} must be written consecutively to JSON dataset files.")
+
+                self._file.write(f"{'],' if len(self._classes) > 0 else ''}\n{json.dumps(class_name)}: [")
+                self._classes.append(class_name)
+                self._components_in_section = 0
+
+            if specification is not None:
+                self._file.write(f"{',' if self._components_in_section > 0 else ''}\n{json.dumps(specification)}")
+                self._components_in_section += 1
+
+        elif specification is not None:
+            record = {"class": class_name, **specification}
+
+            if self.file_format == "ndjson":
+                self._file.write(f"{json.dumps(record)}\n")
+            else:
+                self._file.write(msgpack.packb(record))
+
+    def close(self):
+        """Finishes writing the dataset file."""
+        if self._file.closed:
+            return
+
+        if self.file_format == "json":
+            self._file.write("]\n}\n" if len(self._classes) > 0 else "}\n")
+
+        self._file.close()
@@ -0,0 +1,468 @@
+"""Contains the functionality used to store simulation metrics on disk and to read them back.
+
+Metrics are stored as streams of length-prefixed msgpack records (one file per component class). Each record is preceded by a
+4-byte big-endian unsigned integer holding its size, so that new records can be appended to the files without rewriting them
+and records can be read one by one without loading whole files into memory.
+
+Alternatively, metrics can be stored in columnar formats (Parquet or Arrow IPC streams) through the ParquetMetricsWriter and
+ArrowMetricsWriter classes, which require the optional "pyarrow" package. Those writers derive the schema of each component class
+from the metrics they receive and write each dump as a new row group (or record batch). When new fields (or new value types)
+appear, the schema is extended and the records already written are copied to a file with the extended schema.
+
+Example:
+    'for metrics in read_metrics("logs/EdgeServer.msgpack"): ...' iterates over the metrics collected from edge servers.
+    'Simulator(metrics_writer=ParquetMetricsWriter)' stores simulation metrics in Parquet files.
+"""
+
+# Python libraries
+import os
+from abc import ABC, abstractmethod
+import json
+import struct
+import msgpack
+from typing import Iterator
+
+# Format of the size prefix that precedes each record
+RECORD_PREFIX = struct.Struct(">I")
+
+
+class MetricsWriter:
+    """Class that appends simulation metrics to length-prefixed msgpack files."""
+
+    def __init__(self, logs_directory: str = "logs") -> object:
+        """Creates a MetricsWriter object.
+
+        Args:
+            logs_directory (str, optional): Name of the directory where the metrics will be stored. Defaults to "logs".
+
+        Returns:
+            object: Created MetricsWriter object.
+        """
+        self.logs_directory = logs_directory
+
+        # Files written by the writer (files from previous simulations are overwritten the first time they are written)
+        self._files = set()
+
+    def get_file_path(self, key: str) -> str:
+        """Gets the path of the file that stores the metrics of a given key (e.g., a component class name).
+
+        Args:
+            key (str): Metrics key.
+
+        Returns:
+            str: File path.
+        """
+        return f"{self.logs_directory}/{key}.msgpack"
+
+    def close(self):
+        """Finishes writing metrics. Records are written as soon as they are received, so there is nothing left to write."""
+        ...
+
+    def write(self, key: str, records: list):
+        """Appends a list of records to the file of a given key.
+
+        Args:
+            key (str): Metrics key.
+            records (list): Records to be appended.
+        """
+        if len(records) == 0:
+            return
+
+        if not os.path.exists(f"{self.logs_directory}/"):
+            os.makedirs(f"{self.logs_directory}")
+
+        file_path = self.get_file_path(key=key)
+        mode = "ab" if file_path in self._files else "wb"
+        self._files.add(file_path)
+
+        chunks = []
+        for record in records:
+            payload = msgpack.packb(record)
+            chunks.append(RECORD_PREFIX.pack(len(payload)))
+            chunks.append(payload)
+
+        with open(file_path, mode) as output_file:
+            output_file.write(b"".join(chunks))
+
+
+class ColumnarMetricsWriter(MetricsWriter, ABC):
+    """Base class for writers that store metrics in columnar formats through the optional "pyarrow" package. The schema of each
+    metrics key is derived from the records received: booleans, integers, floats, and strings are stored in typed columns, whereas
+    other values (e.g., lists and dictionaries) are stored as JSON-encoded strings. Schemas evolve as records are received: fields
+    that first appear in later records are added to the schema, integer columns that receive floats become float columns, and
+    columns that receive values of incompatible types become JSON-encoded columns. Whenever the schema of a file changes (or
+    a file closed by "close()" receives new records), its records are streamed to a new file with the updated schema.
+    """
+
+    # File extension used by the writer
+    extension = ""
+
+    def __init__(self, logs_directory: str = "logs") -> object:
+        """Creates a ColumnarMetricsWriter object.
+
+        Args:
+            logs_directory (str, optional): Name of the directory where the metrics will be stored. Defaults to "logs".
+
+        Returns:
+            object: Created ColumnarMetricsWriter object.
+        """
+        MetricsWriter.__init__(self, logs_directory=logs_directory)
+        self.pyarrow = _import_pyarrow()
+
+        # Schemas and open file writers of each metrics key
+        self._schemas = {}
+        self._writers = {}
+
+    def get_file_path(self, key: str) -> str:
+        """Gets the path of the file that stores the metrics of a given key (e.g., a component class name).
+
+        Args:
+            key (str): Metrics key.
+
+        Returns:
+            str: File path.
+        """
+        return f"{self.logs_directory}/{key}.{self.extension}"
+
+    def close(self):
+        """Closes the open files, finishing writing metrics. Records written afterwards are appended to the existing files."""
+        for writer in self._writers.values():
+            writer.close()
+
+        self._writers = {}
+
+    def write(self, key: str, records: list):
+        """Appends a list of records to the file of a given key.
+
+        Args:
+            key (str): Metrics key.
+            records (list): Records to be appended.
+        """
+        if len(records) == 0:
+            return
+
+        if not os.path.exists(f"{self.logs_directory}/"):
+            os.makedirs(f"{self.logs_directory}")
+
+        schema = self._merge_schemas(schema=self._schemas.get(key), new_schema=self._get_schema(records=records))
+
+        if key not in self._writers or not schema.equals(self._schemas[key], check_metadata=True):
+            self._open(key=key, schema=schema)
+
+        self._write_table(writer=self._writers[key], table=self._build_table(records=records, schema=schema))
+
+    def _open(self, key: str, schema: object):
+        """Opens the file of a given key with a given schema. Files already written by the writer have their records streamed from a
+        copy of the previous file to the new one, converting them to the new schema.
+
+        Args:
+            key (str): Metrics key.
+            schema (object): Arrow schema.
+        """
+        if key in self._writers:
+            self._writers.pop(key).close()
+
+        file_path = self.get_file_path(key=key)
+        previous_file_path = None
+        if file_path in self._files and os.path.exists(file_path):
+            previous_file_path = f"{self.logs_directory}/{key}.previous.{self.extension}"
+            os.replace(file_path, previous_file_path)
+
+        self._schemas[key] = schema
+        self._writers[key] = self._open_writer(file_path=file_path, schema=schema)
+        self._files.add(file_path)
+
+        if previous_file_path is not None:
+            _, batches = _read_columnar_batches(file_path=previous_file_path)
+            for batch in batches:
+                table = self.pyarrow.Table.from_batches([batch])
+                self._write_table(writer=self._writers[key], table=self._convert_table(table=table, schema=schema))
+
+            os.remove(previous_file_path)
+
+    def _build_table(self, records: list, schema: object) -> object:
+        """Builds a table of metrics with a given schema.
+
+        Args:
+            records (list): Metrics records.
+            schema (object): Arrow schema.
+
+        Returns:
+            object: Arrow table.
+        """
+        columns = []
+        for field in schema:
+            values = [record.get(field.name) for record in records]
+            if _is_json_field(field=field):
+                values = [None if value is None else json.dumps(value, default=str) for value in values]
+
+            columns.append(self.pyarrow.array(values, type=field.type))
+
+        return self.pyarrow.Table.from_arrays(columns, schema=schema)
+
+    def _convert_table(self, table: object, schema: object) -> object:
+        """Converts a table of metrics written with a previous schema to a new schema.
+
+        Args:
+            table (object): Arrow table.
+            schema (object): Arrow schema.
+
+        Returns:
+            object: Converted Arrow table.
+        """
+        columns = []
+        for field in schema:
+            if field.name not in table.schema.names:
+                columns.append(self.pyarrow.nulls(len(table), type=field.type))
+                continue
+
+            column = table.column(field.name)
+            previous_field = table.schema.field(field.name)
+
+            # Values of columns that became JSON-encoded are encoded (values that were already JSON-encoded are kept as they are)
+            if _is_json_field(field=field) and not _is_json_field(field=previous_field):
+                values = [None if value is None else json.dumps(value, default=str) for value in column.to_pylist()]
+                column = self.pyarrow.array(values, type=field.type)
+            elif column.type != field.type:
+                column = column.cast(field.type)
+
+            columns.append(column)
+
+        return self.pyarrow.Table.from_arrays(columns, schema=schema)
+
+    def _get_schema(self, records: list) -> object:
+        """Derives the schema of a list of records.
+
+        Args:
+            records (list): Metrics records.
+
+        Returns:
+            object: Arrow schema.
+        """
+        pa = self.pyarrow
+
+        fields = []
+        for name in dict.fromkeys(name for record in records for name in record):
+            value_types = set(type(record[name]) for record in records if record.get(name) is not None)
+
+            # Fields whose values are all None have their types defined once values are received
+            if len(value_types) == 0:
+                fields.append(pa.field(name, pa.null()))
+            elif value_types == {bool}:
+                fields.append(pa.field(name, pa.bool_()))
+            elif value_types == {int}:
+                fields.append(pa.field(name, pa.int64()))
+            elif value_types.issubset({int, float}):
+                fields.append(pa.field(name, pa.float64()))
+            elif value_types == {str}:
+                fields.append(pa.field(name, pa.string()))
+            else:
+                fields.append(pa.field(name, pa.string(), metadata={"encoding": "json"}))
+
+        return pa.schema(fields)
+
+    def _merge_schemas(self, schema: object, new_schema: object) -> object:
+        """Merges the schema of a metrics key with the schema of new records. New fields are appended to the schema, and fields whose
+        types differ are given a type that holds the values of both (e.g., integer and float fields are merged into float fields).
+
+        Args:
+            schema (object): Schema of the metrics key (None if no records were written so far).
+            new_schema (object): Schema of the new records.
+
+        Returns:
+            object: Merged schema.
+        """
+        if schema is None:
+            return new_schema
+
+        pa = self.pyarrow
+
+        fields = {field.name: field for field in schema}
+        for new_field in new_schema:
+            field = fields.get(new_field.name)
+
+            if field is None or field.type == pa.null():
+                fields[new_field.name] = new_field
+            elif new_field.type == pa.null() or field.equals(new_field, check_metadata=True):
+                continue
+            elif {field.type, new_field.type} == {pa.int64(), pa.float64()}:
+                fields[new_field.name] = pa.field(new_field.name, pa.float64())
+            else:
+                fields[new_field.name] = pa.field(new_field.name, pa.string(), metadata={"encoding": "json"})
+
+        return pa.schema(list(fields.values()))
+
+    @abstractmethod
+    def _open_writer(self, file_path: str, schema: object) -> object:
+        """Opens a file writer.
+
+        Args:
+            file_path (str): File path.
+            schema (object): Arrow schema.
+
+        Returns:
+            object: File writer.
+        """
+
+    @abstractmethod
+    def _write_table(self, writer: object, table: object):
+        """Writes a table of metrics with a file writer.
+
+        Args:
+            writer (object): File writer.
+            table (object): Arrow table.
+        """
+
+
+class ParquetMetricsWriter(ColumnarMetricsWriter):
+    """Class that stores simulation metrics in Parquet files (one row group per dump)."""
+
+    extension = "parquet"
+
+    def _open_writer(self, file_path: str, schema: object) -> object:
+        """Opens a Parquet file writer.
+
+        Args:
+            file_path (str): File path.
+            schema (object): Arrow schema.
+
+        Returns:
+            object: File writer.
+        """
+        import pyarrow.parquet
+
+        return pyarrow.parquet.ParquetWriter(file_path, schema)
+
+    def _write_table(self, writer: object, table: object):
+        """Writes a table of metrics as a new row group.
+
+        Args:
+            writer (object): File writer.
+            table (object): Arrow table.
+        """
+        writer.write_table(table)
+
+
+class ArrowMetricsWriter(ColumnarMetricsWriter):
+    """Class that stores simulation metrics in Arrow IPC stream files (one record batch per dump)."""
+
+    extension = "arrow"
+
+    def _open_writer(self, file_path: str, schema: object) -> object:
+        """Opens an Arrow IPC stream writer.
+
+        Args:
+            file_path (str): File path.
+            schema (object): Arrow schema.
+
+        Returns:
+            object: File writer.
+        """
+        return self.pyarrow.ipc.new_stream(file_path, schema)
+
+    def _write_table(self, writer: object, table: object):
+        """Writes a table of metrics as new record batches.
+
+        Args:
+            writer (object): File writer.
+            table (object): Arrow table.
+        """
+        writer.write_table(table)
+
+
+def _import_pyarrow() -> object:
+    """Imports the optional "pyarrow" package, which is required by columnar metrics writers and readers.
+
+    Returns:
+        object: The "pyarrow" module.
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError as error:
+        raise ImportError("Columnar metrics formats require the 'pyarrow' package. Please install it with 'pip install pyarrow'.") from error
+
+    return pyarrow
+
+
+def read_metrics(file_path: str) -> Iterator[dict]:
+    """Lazily iterates over the records stored in a metrics file. Incomplete records at the end of msgpack files (e.g., from a
+    simulation that was interrupted while writing to disk) are ignored. Parquet (".parquet") and Arrow (".arrow") files are read one
+    row group (or record batch) at a time, decoding JSON-encoded values.
+
+    Args:
+        file_path (str): Metrics file path.
+
+    Returns:
+        Iterator[dict]: Metrics records.
+    """
+    if file_path.endswith(".parquet") or file_path.endswith(".arrow"):
+        yield from _read_columnar_metrics(file_path=file_path)
+        return
+
+    with open(file_path, "rb") as input_file:
+        while True:
+            prefix = input_file.read(RECORD_PREFIX.size)
+            if len(prefix) < RECORD_PREFIX.size:
+                break
+
+            (size,) = RECORD_PREFIX.unpack(prefix)
+            payload = input_file.read(size)
+            if len(payload) < size:
+                break
+
+            yield msgpack.unpackb(payload, strict_map_key=False)
+
+
+def _is_json_field(field: object) -> bool:
+    """Checks whether a column of a columnar metrics file stores JSON-encoded values.
+
+    Args:
+        field (object): Arrow field.
+
+    Returns:
+        bool: Information of whether the field stores JSON-encoded values.
+    """
+    return field.metadata is not None and field.metadata.get(b"encoding") == b"json"
+
+
+def _read_columnar_batches(file_path: str) -> tuple:
+    """Lazily reads the row groups (or record batches) of a Parquet or Arrow IPC stream metrics file.
+
+    Args:
+        file_path (str): Metrics file path.
+
+    Returns:
+        tuple: Arrow schema and iterator over the record batches of the file.
+    """
+    pyarrow = _import_pyarrow()
+
+    if file_path.endswith(".parquet"):
+        import pyarrow.parquet
+
+        parquet_file = pyarrow.parquet.ParquetFile(file_path)
+        return parquet_file.schema_arrow, parquet_file.iter_batches()
+
+    reader = pyarrow.ipc.open_stream(pyarrow.memory_map(file_path, "r"))
+    return reader.schema, reader
+
+
+def _read_columnar_metrics(file_path: str) -> Iterator[dict]:
+    """Lazily iterates over the records stored in a Parquet or Arrow IPC stream metrics file.
+
+    Args:
+        file_path (str): Metrics file path.
+
+    Returns:
+        Iterator[dict]: Metrics records.
+    """
+    schema, batches = _read_columnar_batches(file_path=file_path)
+    json_fields = [field.name for field in schema if _is_json_field(field=field)]
+
+    for batch in batches:
+        for record in batch.to_pylist():
+            for name in json_fields:
+                if record[name] is not None:
+                    record[name] = json.loads(record[name])
+
+            yield record
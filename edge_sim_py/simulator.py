@@ -2,22 +2,39 @@
 
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.metrics import MetricsWriter
+from edge_sim_py.checkpoint import save_checkpoint, load_checkpoint
+from edge_sim_py.dataset_io import read_dataset
 from edge_sim_py.components import *
+from edge_sim_py.components.data_packet import DataPacket
 from edge_sim_py.activation_schedulers import *
 
 # Mesa modules
 from mesa import Model, Agent
 
 # Python libraries
-import os
-import json
-import msgpack
+import inspect
+import functools
 from typing import Callable
 from datetime import timedelta
-from urllib.parse import urlparse
-from urllib.request import urlopen
 
 SUPPORTED_TIME_UNITS = ["seconds", "microseconds", "milliseconds", "minutes"]
+SUPPORTED_RETENTION_POLICIES = ["keep", "archive"]
+SUPPORTED_TIME_ADVANCE_MODES = ["tick", "next_event"]
+SUPPORTED_PACKET_SWITCHING_MODES = ["store_and_forward", "cut_through"]
+
+
+@functools.lru_cache(maxsize=None)
+def _collect_accepts_fields(component_class: type) -> bool:
+    """Checks whether the "collect()" method of a component class accepts the list of metrics to be collected.
+
+    Args:
+        component_class (type): Component class.
+
+    Returns:
+        bool: Whether "collect()" has a "fields" parameter.
+    """
+    return "fields" in inspect.signature(component_class.collect).parameters
 
 
 class Simulator(ComponentManager, Model):
@@ -40,6 +57,12 @@ class Simulator(ComponentManager, Model):
         scheduler: Callable = DefaultScheduler,
         dump_interval: int = 100,
         logs_directory: str = "logs",
+        retention_policy: str = "keep",
+        metrics_writer: Callable = MetricsWriter,
+        time_advance: str = "tick",
+        packet_switching: str = "store_and_forward",
+        data_packet_aggregation: bool = False,
+        latency_model: Callable = None,
     ) -> object:
         """Creates a Simulator object.
 
@@ -48,11 +71,38 @@ class Simulator(ComponentManager, Model):
             resource_management_algorithm (Callable, optional): Main resource management algorithm executed at each step of the simulation. Defaults to None.
             resource_management_algorithm_parameters (dict, optional): User-defined parameters. Defaults to {}.
             user_defined_functions (list, optional): List of user-defined functions.
-            network_flow_scheduling_algorithm (Callable, optional): Bandwidth sharing algorithm. Defaults to equal_share.
+            network_flow_scheduling_algorithm (Callable, optional): Bandwidth sharing algorithm (e.g., max_min_fairness, network_wide_max_min_fairness,
+                vectorized_max_min_fairness, or equal_share). Defaults to max_min_fairness.
             obj_id (int, optional): Object identifier. Defaults to None.
             scheduler (Callable, optional): Agent activation scheduler regime.
             dump_interval (int, optional): Interval (in time steps) between each time EdgeSimPy dumps simulation data to disk.
             logs_directory (str, optional): Name of the directory where the simulation logs will be stored.
+            retention_policy (str, optional): What happens to finished network flows and finished or dropped data packets once their
+                final metrics are collected. Valid options: "keep" (they are kept as objects) and "archive" (they are replaced by
+                compact records stored in the "archived_components" attribute, see "get_archived_records()"). Defaults to "keep".
+            metrics_writer (Callable, optional): Class that writes simulation metrics to the disk (e.g., MetricsWriter for msgpack
+                files, or ParquetMetricsWriter and ArrowMetricsWriter for columnar files). Defaults to MetricsWriter.
+            time_advance (str, optional): How the simulation time advances. Valid options: "tick" (the simulation advances one step
+                at a time) and "next_event" (the simulation jumps over steps in which no agent has work whose outcome is unknown in
+                advance, updating the progress of network flows and data packets analytically). Jumps end at the next event (see
+                "EventDrivenScheduler.get_skippable_steps()"), at the next step in which metrics are collected or dumped to disk,
+                or at the step in which the stopping criterion is met. The resource management algorithm runs before each jump and
+                is not called at skipped steps, so jumps only span more than one step once the algorithm declares the next step in
+                which it must be called by setting parameters["next_call_step"] (e.g., float("inf") if it only reacts to events),
+                which must be declared again at each call. Monitoring produces the same metrics as in the "tick" mode (classes
+                without monitoring settings are monitored at every step, so jumps require monitoring intervals for every monitored
+                class). The "next_event" mode requires the EventDrivenScheduler. Defaults to "tick".
+            packet_switching (str, optional): How data packets cross the network switches of each hop of their paths. Valid options:
+                "store_and_forward" (one network flow is created for each link) and "cut_through" (a single network flow spans all
+                links of the hop, moving data at the rate of the most constrained link). Defaults to "store_and_forward".
+            data_packet_aggregation (bool, optional): Whether data packets with the same application, size, and communication path
+                created at the same step are merged into a bulk data packet that shares network flows and processing countdowns, and
+                whose metrics are expanded into the metrics (and identifiers) of each data packet when collected. Flows of bulk data
+                packets receive the bandwidth their data packets would receive separately, which is only supported by the
+                max_min_fairness and equal_share algorithms. As each user creates at most one data packet per application at each
+                step, only data packets from different users are aggregated. Defaults to False.
+            latency_model (Callable, optional): Analytical model that computes the delays perceived by users at each step instead of
+                simulating data packets and network flows (e.g., mm1_latency). Defaults to None (data packets are simulated).
 
         Returns:
             object: Created Simulator object.
@@ -80,10 +130,52 @@ class Simulator(ComponentManager, Model):
 
         self.tick_duration = timedelta(seconds=seconds, microseconds=microseconds, milliseconds=milliseconds, minutes=minutes).total_seconds()
 
+        # Defining what happens to components that reached a terminal state (e.g., finished network flows)
+        if retention_policy not in SUPPORTED_RETENTION_POLICIES:
+            raise Exception(f"Unsupported retention policy {retention_policy}. Supported retention policies are {SUPPORTED_RETENTION_POLICIES}.")
+
+        self.retention_policy = retention_policy
+
+        # Defining how the simulation time advances
+        if time_advance not in SUPPORTED_TIME_ADVANCE_MODES:
+            raise Exception(f"Unsupported time advance mode {time_advance}. Supported time advance modes are {SUPPORTED_TIME_ADVANCE_MODES}.")
+
+        if time_advance == "next_event" and not issubclass(scheduler, EventDrivenScheduler):
+            raise Exception("The 'next_event' time advance mode requires the EventDrivenScheduler.")
+
+        self.time_advance = time_advance
+
+        # Defining how data packets cross network switches
+        if packet_switching not in SUPPORTED_PACKET_SWITCHING_MODES:
+            raise Exception(
+                f"Unsupported packet switching mode {packet_switching}. Supported packet switching modes are {SUPPORTED_PACKET_SWITCHING_MODES}."
+            )
+
+        self.packet_switching = packet_switching
+
+        # Defining whether identical data packets are aggregated into bulk data packets (only the flow scheduling algorithms that give
+        # flows of bulk data packets the bandwidth of their data packets, which is defined by the "count" attribute of flows, are allowed)
+        if data_packet_aggregation and network_flow_scheduling_algorithm not in [max_min_fairness, equal_share]:
+            raise Exception(f"Data packet aggregation is not supported by the {network_flow_scheduling_algorithm.__name__} algorithm.")
+
+        self.data_packet_aggregation = data_packet_aggregation
+
+        # Number of steps skipped by the "next_event" time advance mode
+        self.skipped_steps = 0
+
         # Simulation metrics
         self.model_metrics = {}
         self.agent_metrics = {}
 
+        # Monitoring settings of each component class (classes without settings have all their metrics collected at every step) and
+        # last metrics sampled from the components of classes that only have their changed metrics stored
+        self.monitoring_settings = {}
+        self._last_metrics = {}
+
+        # Final metrics of archived components (i.e., finished network flows and finished or dropped data packets), grouped by class and
+        # formatted as {"fields": [...], "records": [(...), ...]}
+        self.archived_components = {}
+
         # Defining the model schedule
         self.schedule = scheduler(self)
 
@@ -103,11 +195,19 @@ class Simulator(ComponentManager, Model):
         # Function that manages how network bandwidth is shared among concurrent flows
         self.network_flow_scheduling_algorithm = network_flow_scheduling_algorithm
 
+        # Function that computes the delays perceived by users analytically (no data packets are created when it is defined)
+        self.latency_model = latency_model
+
         # Attributes that EdgeSimPy uses to know when to dump simulation metrics into the disk
         self.last_dump = 0
         self.dump_interval = dump_interval
         self.logs_directory = logs_directory
 
+        # Object that writes metrics to the disk and number of metrics of each class kept in memory that were already written
+        self.metrics_writer = metrics_writer
+        self._metrics_writer = None
+        self._dumped_metrics = {}
+
         # Attribute that stores the network topology used during the simulation
         self.topology = None
 
@@ -121,43 +221,20 @@ class Simulator(ComponentManager, Model):
         """Sets up the initial values for state variables, which includes, e.g., loading components from a dataset file.
 
         Args:
-            input_file (str): Dataset file (URL for external JSON file, path for local JSON file, Python dictionary).
+            input_file (str): Dataset file (URL for external JSON file, path for local JSON, NDJSON, or msgpack file, Python dictionary).
         """
         # Resetting the list of instances of EdgeSimPy's component classes
         for component_class in ComponentManager.__subclasses__():
             if component_class.__name__ != "Simulator":
                 component_class._object_count = 0
                 component_class._instances = []
+                component_class._reset_indexes()
 
-        # Declaring an empty variable that will receive the dataset metadata (if user passes valid information)
-        data = None
-
-        # If "input_file" is a Python dictionary, no additional parsing is needed before starting loading the dataset
+        # Validating the component classes of datasets specified as Python dictionaries before creating any component
         if type(input_file) is dict:
-            data = input_file
-
-        # If "input_file" represents a valid URL, parses its response
-        elif all([urlparse(input_file).scheme, urlparse(input_file).netloc]):
-            data = json.loads(urlopen(input_file).read())
-
-        # If "input_file" points to the local filesystem, checks if the file exists and parses it
-        else:
-            if os.path.exists(input_file):
-                with open(input_file, "r", encoding="UTF-8") as read_file:
-                    data = json.load(read_file)
-
-            elif os.path.exists(f"{os.getcwd()}/{input_file}"):
-                with open(f"{os.getcwd()}/{input_file}", "r", encoding="UTF-8") as read_file:
-                    data = json.load(read_file)
-
-        # Raising exception if the dataset could not be loaded based on the specified arguments
-        if type(data) is not dict:
-            raise TypeError("EdgeSimPy could not load the dataset based on the specified arguments.")
-
-        # Creating simulator components based on the specified input data
-        missing_keys = [key for key in data.keys() if key not in globals()]
-        if len(missing_keys) > 0:
-            raise Exception(f"\n\nCould not find component classes named: {missing_keys}. Please check your input file.\n\n")
+            missing_keys = [key for key in input_file.keys() if key not in globals()]
+            if len(missing_keys) > 0:
+                raise Exception(f"\n\nCould not find component classes named: {missing_keys}. Please check your input file.\n\n")
 
         # Creating a list that will store all the relationships among components
         components = []
@@ -166,17 +243,26 @@ class Simulator(ComponentManager, Model):
         topology = self.initialize_agent(agent=Topology())
         self.topology = topology
 
-        # Creating simulator components
-        for key in data.keys():
-            if key != "Simulator" and key != "Topology":
-                for object_metadata in data[key]:
-                    new_component = globals()[key]._from_dict(dictionary=object_metadata["attributes"])
-                    new_component.relationships = object_metadata["relationships"]
+        # Mapping the IDs of the created components of each class to the components themselves, so that relationships are
+        # resolved in constant time (the first component created with a given ID is kept, as in "find_by_id()")
+        components_by_id = {"Topology": {topology.id: topology}}
+
+        # Creating simulator components (datasets are read one component at a time, see the "edge_sim_py.dataset_io" module)
+        for key, object_metadata in read_dataset(input_file=input_file):
+            if key == "Simulator" or key == "Topology":
+                continue
 
-                    if hasattr(new_component, "model") and hasattr(new_component, "unique_id"):
-                        self.initialize_agent(agent=new_component)
+            if key not in globals():
+                raise Exception(f"\n\nCould not find component classes named: {[key]}. Please check your input file.\n\n")
 
-                    components.append(new_component)
+            new_component = globals()[key]._from_dict(dictionary=object_metadata["attributes"])
+            new_component.relationships = object_metadata["relationships"]
+
+            if hasattr(new_component, "model") and hasattr(new_component, "unique_id"):
+                self.initialize_agent(agent=new_component)
+
+            components.append(new_component)
+            components_by_id.setdefault(key, {}).setdefault(new_component.id, new_component)
 
         # Defining relationships between components
         for component in components:
@@ -189,9 +275,9 @@ class Simulator(ComponentManager, Model):
                 elif type(value) == list:
                     attribute_values = []
                     for item in value:
-                        obj = globals()[item["class"]].find_by_id(item["id"]) if type(item) == dict and "class" in item and item["class"] in globals() else None
+                        obj = self._find_component(reference=item, components_by_id=components_by_id)
 
-                        if obj == None:
+                        if obj is None:
                             raise Exception(f"List relationship '{key}' of component {component} has an invalid item: {item}.")
 
                         attribute_values.append(obj)
@@ -200,11 +286,9 @@ class Simulator(ComponentManager, Model):
 
                 # Defining attributes that reference a single component (e.g., an edge server, an user, etc.)
                 elif type(value) == dict and "class" in value and "id" in value:
-                    obj = (
-                        globals()[value["class"]].find_by_id(value["id"]) if type(value) == dict and "class" in value and value["class"] in globals() else None
-                    )
+                    obj = self._find_component(reference=value, components_by_id=components_by_id)
 
-                    if obj == None:
+                    if obj is None:
                         raise Exception(f"Relationship '{key}' of component {component} references an invalid object: {value}.")
 
                     setattr(component, f"{key}", obj)
@@ -213,8 +297,8 @@ class Simulator(ComponentManager, Model):
                 elif type(value) == dict and all(type(entry) == dict and "class" in entry and "id" in entry for entry in value.values()):
                     attribute = {}
                     for k, v in value.items():
-                        obj = globals()[v["class"]].find_by_id(v["id"]) if "class" in v and v["class"] in globals() else None
-                        if obj == None:
+                        obj = self._find_component(reference=v, components_by_id=components_by_id)
+                        if obj is None:
                             raise Exception(f"Relationship '{key}' of component {component} references an invalid object: {value}.")
                         attribute[k] = obj
 
@@ -238,6 +322,25 @@ class Simulator(ComponentManager, Model):
             topology._adj[link.nodes[0]][link.nodes[1]] = link
             topology._adj[link.nodes[1]][link.nodes[0]] = link
 
+    def _find_component(self, reference: object, components_by_id: dict) -> object:
+        """Finds the component referenced by a relationship from a dataset.
+
+        Args:
+            reference (object): Reference to the component, formatted as {"class": ..., "id": ...}.
+            components_by_id (dict): Components created from the dataset, grouped by class and indexed by ID.
+
+        Returns:
+            object: Referenced component (None if the reference is invalid).
+        """
+        if type(reference) != dict or "class" not in reference or reference["class"] not in globals():
+            return None
+
+        class_components = components_by_id.get(reference["class"])
+        if class_components is not None and reference.get("id") in class_components:
+            return class_components[reference["id"]]
+
+        return globals()[reference["class"]].find_by_id(reference.get("id"))
+
     def run_model(self):
         """Executes the simulation."""
         if self.stopping_criterion == None:
@@ -246,8 +349,10 @@ class Simulator(ComponentManager, Model):
         if self.resource_management_algorithm == None:
             raise Exception("Please assign the 'resource_management_algorithm' attribute before starting the simulation.")
 
-        # Calls the method that collects monitoring data about the agents
-        self.monitor()
+        # Calls the method that collects monitoring data about the agents (simulations restored from checkpoints taken after the
+        # first step were already monitored at the current step)
+        if self.schedule.steps == 0:
+            self.monitor()
 
         while self.running:
             # Calls the method that advances the simulation time
@@ -262,17 +367,88 @@ class Simulator(ComponentManager, Model):
         # Dumps simulation data to the disk to make sure no metrics are discarded
         self.dump_data_to_disk()
 
+        if self._metrics_writer is not None:
+            self._metrics_writer.close()
+
+    def checkpoint(self, file_path: str):
+        """Saves the state of the simulation to a checkpoint file (see the "edge_sim_py.checkpoint" module), so that it can be resumed
+        later through the "restore()" method. Checkpoints must be taken between simulation steps (e.g., after "run_model()" returns).
+
+        Args:
+            file_path (str): Checkpoint file path.
+        """
+        save_checkpoint(simulator=self, file_path=file_path)
+
+    def restore(self, file_path: str):
+        """Restores the state of a simulation from a checkpoint file, replacing the components of the current simulation. The
+        Simulator keeps its own settings (e.g., its stopping criterion, resource management algorithm, and logs directory), so
+        calling "run_model()" afterwards continues the simulation from the checkpoint until the stopping criterion is met.
+
+        Args:
+            file_path (str): Checkpoint file path.
+        """
+        load_checkpoint(simulator=self, file_path=file_path)
+
     def step(self):
         """Advances the model's system in one step."""
         # Running resource management algorithm
         self.resource_management_algorithm(parameters=self.resource_management_algorithm_parameters)
 
-        # Activating agents
-        self.schedule.step()
+        # Activating agents (steps whose outcome is known in advance are skipped in the "next_event" time advance mode)
+        skippable_steps = self.schedule.get_skippable_steps() if self.time_advance == "next_event" else 0
+        if skippable_steps > 0:
+            # Jumps end before the next step in which the resource management algorithm must be called (by default, the next step)
+            next_call_step = self.resource_management_algorithm_parameters.pop("next_call_step", self.schedule.steps + 2)
+            skippable_steps = min(skippable_steps, max(1, next_call_step - self.schedule.steps - 1))
+
+            self._skip_steps(steps=min(skippable_steps, self._get_next_monitoring_step() - self.schedule.steps))
+        else:
+            self.schedule.step()
+
+        # Updating the delays perceived by users according to the analytical latency model
+        if self.latency_model is not None:
+            self.latency_model(topology=self.topology, users=User.all())
 
         # Updating the "current_step" attribute inside the resource management algorithm's parameters
         self.resource_management_algorithm_parameters["current_step"] = self.schedule.steps + 1
 
+    def _skip_steps(self, steps: int):
+        """Skips a number of steps in the "next_event" time advance mode. Steps are skipped one at a time so that the simulation stops
+        at the step in which the stopping criterion is met (skipping a step only costs updating the data packets being processed).
+
+        Args:
+            steps (int): Maximum number of steps to skip.
+        """
+        skipped_steps = 0
+        while skipped_steps < steps:
+            self.schedule.skip_steps(steps=1)
+            skipped_steps += 1
+
+            if self.stopping_criterion is None or self.stopping_criterion(self):
+                break
+
+        self.skipped_steps += skipped_steps
+
+    def _get_next_monitoring_step(self) -> int:
+        """Gets the next step in which metrics are collected from any component or dumped to disk, according to the monitoring settings
+        of the component classes added to the schedule (classes without monitoring settings are monitored at every step).
+
+        Returns:
+            int: Next monitoring step.
+        """
+        next_step = self.schedule.steps + 1
+        monitoring_step = self.last_dump + self.dump_interval
+
+        for agent_class in self.schedule._agent_groups:
+            settings = self.monitoring_settings.get(agent_class.__name__)
+            if settings is None:
+                return next_step
+
+            if settings["enabled"]:
+                monitoring_step = min(monitoring_step, (self.schedule.steps // settings["interval"] + 1) * settings["interval"])
+
+        return max(next_step, monitoring_step)
+
     def collect(self) -> dict:
         """Method that collects a set of model-level metrics.
 
@@ -289,35 +465,198 @@ class Simulator(ComponentManager, Model):
 
         # Collecting agent-level metrics
         for agent in self.schedule._agents.values():
-            metrics = agent.collect()
+            settings = self.monitoring_settings.get(agent.__class__.__name__)
+
+            # Skipping components that are not monitored at the current step according to the monitoring settings of their class
+            if settings is not None and (not settings["enabled"] or self.schedule.steps % settings["interval"] != 0):
+                continue
+
+            # Components whose "collect()" method accepts a list of fields only compute the metrics selected by the monitoring settings
+            fields = settings["fields"] if settings is not None else None
+            if fields is not None and _collect_accepts_fields(component_class=agent.__class__):
+                metrics = agent.collect(fields=fields)
+            else:
+                metrics = agent.collect()
+
+            # Components that represent multiple entities (e.g., bulk data packets) have the metrics of each entity selected separately
+            # (entities keep their own "Object" identifier, if any)
+            if fields is not None:
+                if type(metrics) is list:
+                    metrics = [{field: entity[field] for field in ["Object", *fields] if field in entity} for entity in metrics]
+                else:
+                    metrics = {field: metrics[field] for field in fields if field in metrics}
+
+            if settings is not None and settings["changed_only"] and metrics != {}:
+                metrics = self._filter_metrics(agent=agent, metrics=metrics)
 
-            if metrics != {}:
-                if f"{agent.__class__.__name__}" not in self.agent_metrics:
-                    self.agent_metrics[f"{agent.__class__.__name__}"] = []
+            # Components that represent multiple entities (e.g., bulk data packets) provide a list with the metrics of each entity
+            for entity_metrics in metrics if type(metrics) is list else [metrics]:
+                if entity_metrics != {}:
+                    if f"{agent.__class__.__name__}" not in self.agent_metrics:
+                        self.agent_metrics[f"{agent.__class__.__name__}"] = []
 
-                metrics = {**{"Object": f"{agent}", "Time Step": self.schedule.steps}, **metrics}
-                self.agent_metrics[f"{agent.__class__.__name__}"].append(metrics)
+                    entity_metrics = {**{"Object": f"{agent}", "Time Step": self.schedule.steps}, **entity_metrics}
+                    self.agent_metrics[f"{agent.__class__.__name__}"].append(entity_metrics)
+
+        # Archiving components whose final metrics have just been collected
+        if self.retention_policy == "archive":
+            self.archive_finished_components()
 
         if self.schedule.steps == self.last_dump + self.dump_interval:
             self.dump_data_to_disk()
             self.last_dump = self.schedule.steps
 
+    def configure_monitoring(
+        self, component_class: object, enabled: bool = True, fields: list = None, interval: int = 1, changed_only: bool = False
+    ) -> None:
+        """Defines which metrics are collected from the components of a given class and how often they are collected. Components of
+        classes without monitoring settings have all their metrics collected at every step.
+
+        Args:
+            component_class (object): Component class (or its name).
+            enabled (bool, optional): Whether metrics are collected from the components of the class. Defaults to True.
+            fields (list, optional): Metrics to be collected (e.g., ["Coordinates", "Base Station"]). Defaults to None (all metrics).
+            interval (int, optional): Interval (in time steps) between each metrics collection. Defaults to 1.
+            changed_only (bool, optional): Whether only the metrics that changed since the last collection are stored (components
+                whose metrics did not change are not stored at all). Defaults to False.
+        """
+        if type(interval) is not int or interval < 1:
+            raise Exception(f"Invalid monitoring interval {interval}. The monitoring interval must be a positive integer.")
+
+        class_name = component_class if type(component_class) is str else component_class.__name__
+
+        self.monitoring_settings[class_name] = {
+            "enabled": enabled,
+            "fields": None if fields is None else list(fields),
+            "interval": interval,
+            "changed_only": changed_only,
+        }
+
+        # Discarding metrics sampled under the previous monitoring settings of the class
+        self._last_metrics = {agent: metrics for agent, metrics in self._last_metrics.items() if agent.__class__.__name__ != class_name}
+
+    def _filter_metrics(self, agent: object, metrics: object) -> object:
+        """Filters the metrics collected from a component whose class is monitored with the "changed_only" setting, keeping only the
+        metrics that changed since the last collection.
+
+        Args:
+            agent (object): Monitored component.
+            metrics (object): Metrics collected from the component (or list with the metrics of each entity it represents).
+
+        Returns:
+            object: Filtered metrics (or list with the filtered metrics of each entity).
+        """
+        # Components that represent multiple entities (e.g., bulk data packets) have the metrics of each entity filtered separately
+        entities_metrics = metrics if type(metrics) is list else [metrics]
+
+        last_metrics = self._last_metrics.get(agent)
+        self._last_metrics[agent] = entities_metrics
+
+        if last_metrics is not None:
+            changed_metrics = []
+            for index, entity in enumerate(entities_metrics):
+                changes = {
+                    field: value
+                    for field, value in entity.items()
+                    if index >= len(last_metrics) or field not in last_metrics[index] or last_metrics[index][field] != value
+                }
+
+                # Entities that changed keep their own "Object" identifier (e.g., data packets represented by bulk data packets)
+                if changes != {} and "Object" in entity:
+                    changes = {"Object": entity["Object"], **changes}
+                changed_metrics.append(changes)
+
+            entities_metrics = changed_metrics
+
+        return entities_metrics if type(metrics) is list else entities_metrics[0]
+
+    def archive_finished_components(self):
+        """Archives finished network flows and finished or dropped data packets, replacing them with compact records of their final
+        metrics (tuples holding the values of the metrics listed in the "_archived_metrics" attribute of their classes). Archived
+        components are removed from the list of instances of their classes (through their "remove()" method), from the model schedule,
+        and from the list of data packets of their applications. This way, memory usage and the cost of each step depend on the number
+        of live components rather than on the whole simulation history.
+        """
+        finished_flows = [flow for flow in NetworkFlow.all() if flow.status == "finished"]
+        finished_data_packets = [
+            data_packet for data_packet in DataPacket.all() if data_packet._status in ["finished", "dropped"] and data_packet._current_flow is None
+        ]
+
+        for component_class, components in [(NetworkFlow, finished_flows), (DataPacket, finished_data_packets)]:
+            if len(components) == 0:
+                continue
+
+            # Storing the final metrics of the archived components
+            if component_class.__name__ not in self.archived_components:
+                self.archived_components[component_class.__name__] = {"fields": ["Time Step", *component_class._archived_metrics], "records": []}
+            records = self.archived_components[component_class.__name__]["records"]
+
+            for component in components:
+                if _collect_accepts_fields(component_class=component.__class__):
+                    metrics = component.collect(fields=component_class._archived_metrics)
+                else:
+                    metrics = component.collect()
+                for entity_metrics in metrics if type(metrics) is list else [metrics]:
+                    records.append((self.schedule.steps, *(entity_metrics.get(field) for field in component_class._archived_metrics)))
+
+                if self.schedule._agents.get(component.unique_id) is component:
+                    self.schedule.remove(component)
+
+                self._last_metrics.pop(component, None)
+
+            # Removing the archived components from the list of instances of their class (the flow tracker of the topology is kept
+            # in sync, so that the remaining flows are not inspected again)
+            flow_tracker = getattr(self.topology, "_flow_tracker", None)
+            if component_class is NetworkFlow and flow_tracker is not None:
+                flow_tracker.remove_flows(flows=NetworkFlow.all(), removed_flows=components)
+            else:
+                for component in components:
+                    component_class.remove(component)
+
+        # Removing archived data packets from the list of data packets of their applications
+        archived_data_packets = set(finished_data_packets)
+        for application in set(data_packet.application for data_packet in finished_data_packets):
+            for user_id, data_packets in application._user_data_packets.items():
+                application._user_data_packets[user_id] = [data_packet for data_packet in data_packets if data_packet not in archived_data_packets]
+
+    def get_archived_records(self, class_name: str) -> list:
+        """Gets the records of the components of a given class archived by the "archive" retention policy, formatted as dictionaries.
+
+        Args:
+            class_name (str): Component class name (e.g., "NetworkFlow" or "DataPacket").
+
+        Returns:
+            list: Final metrics of the archived components.
+        """
+        archive = self.archived_components.get(class_name)
+        if archive is None:
+            return []
+
+        return [dict(zip(archive["fields"], record)) for record in archive["records"]]
+
     def dump_data_to_disk(self, clean_data_in_memory: bool = True) -> None:
-        """Dumps simulation metrics to the disk.
+        """Dumps simulation metrics to the disk. Metrics collected since the last dump are appended to the files of their classes
+        (see the "edge_sim_py.metrics" module), so that the cost of each dump is proportional to the amount of new data.
 
         Args:
             clean_data_in_memory (bool, optional): Purges the list of metrics stored in the memory. Defaults to True.
         """
         if self.dump_interval != float("inf"):
-            if not os.path.exists(f"{self.logs_directory}/"):
-                os.makedirs(f"{self.logs_directory}")
+            if self._metrics_writer is None or self._metrics_writer.logs_directory != self.logs_directory:
+                if self._metrics_writer is not None:
+                    self._metrics_writer.close()
+                self._metrics_writer = self.metrics_writer(logs_directory=self.logs_directory)
 
             for key, value in self.agent_metrics.items():
-                with open(f"{self.logs_directory}/{key}.msgpack", "wb") as output_file:
-                    output_file.write(msgpack.packb(value))
+                # Metrics kept in memory after previous dumps are not written again
+                dumped_metrics = self._dumped_metrics.get(key, 0)
+                self._metrics_writer.write(key=key, records=value[dumped_metrics:])
 
                 if clean_data_in_memory:
-                    value = []
+                    self.agent_metrics[key] = []
+                    self._dumped_metrics[key] = 0
+                else:
+                    self._dumped_metrics[key] = len(value)
 
     def initialize_agent(self, agent: object) -> object:
         """Initializes an agent object.
@@ -0,0 +1,164 @@
+"""Contains the functionality used to run multiple simulations (e.g., replications with different seeds or parameter sweeps) in
+parallel.
+
+As EdgeSimPy components are stored in class attributes, only one simulation can run at a time in each Python process. Therefore,
+the sweep runner executes each simulation in a separate worker process. Each simulation stores its logs in its own directory,
+alongside a "summary.json" file written once the simulation finishes, which allows interrupted sweeps to be resumed.
+
+Example:
+    'run_sweep(input_file="dataset.json", simulator_parameters={"tick_duration": [1, 2]}, seeds=[1, 2, 3], ...)' runs 6 simulations.
+"""
+
+# EdgeSimPy components
+from edge_sim_py.simulator import Simulator
+
+# Python libraries
+import os
+import copy
+import json
+import time
+import random
+import itertools
+from typing import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def run_sweep(
+    input_file: object,
+    simulator_parameters: dict = {},
+    seeds: list = [1],
+    logs_directory: str = "sweep",
+    summary_function: Callable = None,
+    max_workers: int = None,
+) -> list:
+    """Runs one simulation for each combination of simulator parameters and seeds using a pool of worker processes. Simulations
+    whose summaries were stored by a previous call with the same parameters are not executed again.
+
+    Args:
+        input_file (object): Dataset file (URL for external JSON file, path for local JSON file, Python dictionary).
+        simulator_parameters (dict, optional): Lists of values for Simulator parameters (e.g., {"tick_duration": [1, 2]}). Simulations
+            are executed for every combination of values. Functions and classes passed as values must be defined at module level, so
+            that they can be sent to the worker processes. Defaults to {}.
+        seeds (list, optional): Seeds of the random number generator used in each combination of parameters. Defaults to [1].
+        logs_directory (str, optional): Directory where the logs of each simulation are stored (in "run_<index>" subdirectories).
+            Defaults to "sweep".
+        summary_function (Callable, optional): Function that receives the Simulator object once a simulation finishes and returns a
+            dictionary of metrics to be included in its summary. Defaults to None.
+        max_workers (int, optional): Number of worker processes. Defaults to None (number of processors of the machine).
+
+    Returns:
+        list: Summaries of the simulations, in the order of the combinations of parameters and seeds.
+    """
+    # Defining the simulations to be executed
+    runs = []
+    parameter_names = list(simulator_parameters.keys())
+    for values in itertools.product(*simulator_parameters.values()):
+        for seed in seeds:
+            index = len(runs)
+            runs.append(
+                {
+                    "index": index,
+                    "seed": seed,
+                    "parameters": dict(zip(parameter_names, values)),
+                    "logs_directory": f"{logs_directory}/run_{index}",
+                }
+            )
+
+    # Loading the summaries of simulations executed by previous calls with the same parameters
+    summaries = [_load_summary(run=run) for run in runs]
+    pending_runs = [run for run, summary in zip(runs, summaries) if summary is None]
+
+    if len(pending_runs) > 0:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_run_simulation, input_file, run, summary_function): run for run in pending_runs}
+            for future in as_completed(futures):
+                summaries[futures[future]["index"]] = future.result()
+
+    return summaries
+
+
+def _run_simulation(input_file: object, run: dict, summary_function: Callable = None) -> dict:
+    """Executes a single simulation of a sweep inside a worker process and stores its summary.
+
+    Args:
+        input_file (object): Dataset file (URL for external JSON file, path for local JSON file, Python dictionary).
+        run (dict): Simulation specification (index, seed, Simulator parameters, and logs directory).
+        summary_function (Callable, optional): Function that gathers custom metrics from the Simulator object. Defaults to None.
+
+    Returns:
+        dict: Simulation summary.
+    """
+    # Discarding Simulator objects from previous simulations executed by the worker process
+    Simulator._instances = []
+
+    random.seed(run["seed"])
+    started_at = time.perf_counter()
+
+    # Each simulation receives its own copy of the parameters of the resource management algorithm, as values stored in the
+    # dictionary by the algorithm (or the dictionary shared by default by Simulator objects) would leak into later simulations
+    simulator = Simulator(
+        **{
+            **run["parameters"],
+            "resource_management_algorithm_parameters": copy.deepcopy(run["parameters"].get("resource_management_algorithm_parameters", {})),
+            "logs_directory": run["logs_directory"],
+        }
+    )
+    simulator.initialize(input_file=input_file)
+    simulator.run_model()
+
+    summary = {
+        "Run": run["index"],
+        "Seed": run["seed"],
+        "Parameters": _describe_parameters(parameters=run["parameters"]),
+        "Logs Directory": run["logs_directory"],
+        "Time Steps": simulator.schedule.steps,
+        "Execution Time": time.perf_counter() - started_at,
+    }
+    if summary_function is not None:
+        summary.update(summary_function(simulator))
+
+    # Storing the summary through a temporary file, so that summaries of interrupted simulations are never left incomplete
+    if not os.path.exists(f"{run['logs_directory']}/"):
+        os.makedirs(f"{run['logs_directory']}")
+
+    summary_file = f"{run['logs_directory']}/summary.json"
+    with open(f"{summary_file}.tmp", "w", encoding="UTF-8") as output_file:
+        json.dump(summary, output_file, indent=4, default=str)
+    os.replace(f"{summary_file}.tmp", summary_file)
+
+    return summary
+
+
+def _load_summary(run: dict) -> dict:
+    """Loads the summary stored by a previous execution of a simulation, provided it was executed with the same seed and parameters.
+
+    Args:
+        run (dict): Simulation specification (index, seed, Simulator parameters, and logs directory).
+
+    Returns:
+        dict: Simulation summary (None if the simulation must be executed).
+    """
+    summary_file = f"{run['logs_directory']}/summary.json"
+    if not os.path.exists(summary_file):
+        return None
+
+    with open(summary_file, "r", encoding="UTF-8") as input_file:
+        summary = json.load(input_file)
+
+    if summary.get("Seed") != run["seed"] or summary.get("Parameters") != _describe_parameters(parameters=run["parameters"]):
+        return None
+
+    return summary
+
+
+def _describe_parameters(parameters: dict) -> dict:
+    """Creates a JSON-friendly description of Simulator parameters, replacing functions and classes with their names.
+
+    Args:
+        parameters (dict): Simulator parameters.
+
+    Returns:
+        dict: Description of the parameters.
+    """
+    description = json.dumps(parameters, default=lambda value: getattr(value, "__name__", str(value)), sort_keys=True)
+    return json.loads(description)
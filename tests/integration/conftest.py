@@ -1,5 +1,8 @@
+import random
+
 import pytest
 
+from edge_sim_py.simulator import Simulator
 from edge_sim_py.components.application import Application
 from edge_sim_py.components.base_station import BaseStation
 from edge_sim_py.components.container_image import ContainerImage
@@ -14,6 +17,7 @@ from edge_sim_py.components.network_switch import NetworkSwitch
 from edge_sim_py.components.service import Service
 from edge_sim_py.components.topology import Topology
 from edge_sim_py.components.user import User
+from edge_sim_py.components.user_access_patterns import CircularDurationAndIntervalAccessPattern
 from edge_sim_py.dataset_generator.edge_servers import jetson_tx2
 from edge_sim_py.dataset_generator.map import hexagonal_grid
 from edge_sim_py.dataset_generator.network_switches import sample_switch
@@ -67,6 +71,10 @@ def dummy_model():
 
 @pytest.fixture
 def basic_topology():
+    return _basic_topology()
+
+
+def _basic_topology():
 
     reset_components()
 
@@ -198,6 +206,12 @@ def _services_processing(number_of_services: int):
     return Service.all()
 
 
+def _alternating_mobility(user):
+    positions = user.mobility_model_parameters["positions"]
+    next_position = positions[1] if user.coordinates_trace[-1] == positions[0] else positions[0]
+    user.coordinates_trace.extend([next_position] * 4)
+
+
 def _static_dummy_mobility(user):
     user.coordinates_trace.append(user.coordinates)
 
@@ -306,3 +320,70 @@ def provisioning_algorithm():
                     service.provision(target_server=edge_server)
 
                     break
+
+
+def build_simulator(**simulator_parameters) -> Simulator:
+    """Builds a simulator with 2 mobile users, 2 apps and 4 services, in which
+    service 2 (stateful) migrates to another server at step 10.
+
+    data packet size = 20
+    requests start = 1, duration = 3, interval = 6
+    users move back and forth between base stations with no edge servers
+    """
+    random.seed(1)
+
+    _basic_topology()
+    CircularDurationAndIntervalAccessPattern._instances = []
+    CircularDurationAndIntervalAccessPattern._object_count = 0
+
+    def migrate_service(parameters):
+        if parameters["current_step"] == 10:
+            Service.find_by_id(2).provision(target_server=EdgeServer.find_by_id(3))
+
+    simulator = Simulator(
+        resource_management_algorithm=migrate_service,
+        stopping_criterion=lambda model: model.schedule.steps == 40,
+        dump_interval=float("inf"),
+        **simulator_parameters,
+    )
+
+    servers = _servers_base_station(number_of_servers=4)
+    services = _services_processing(number_of_services=4)
+    Service.find_by_id(2).state = 30
+
+    image = ContainerImage(name="alpine", digest=services[0].image_digest, layers=["sha256:df9b9388f04ad6279a7410b85cedfdcb2208c0a003da7ab5613af71079148139"])
+    layer = ContainerLayer(digest=image.layers_digests[0], size=20, instruction="ADD file:5d673d25da3a14ce1f6cf")
+    registry = ContainerRegistry(cpu_demand=1, memory_demand=1024)
+    image.server, layer.server, registry.server = servers[0], servers[0], servers[0]
+    servers[0].container_images.append(image)
+    servers[0].container_layers.append(layer)
+    servers[0].container_registries.append(registry)
+
+    for index, service in enumerate(services):
+        service.server = servers[index % 2]
+        service.server.services.append(service)
+        service._available = True
+
+    apps = [Application(), Application()]
+    for service in sorted(services, key=lambda s: s.id):
+        apps[0].connect_to_service(service=service)
+    for service in sorted(services, key=lambda s: s.id, reverse=True):
+        apps[1].connect_to_service(service=service)
+
+    free_base_stations = [base_station for base_station in BaseStation.all() if len(base_station.edge_servers) == 0]
+    for index, app in enumerate(apps):
+        user = User()
+        user.set_packet_size_strategy(mode="fixed", size=20)
+        user._set_initial_position(coordinates=free_base_stations[index].coordinates, number_of_replicates=3)
+        user.mobility_model = _alternating_mobility
+        user.mobility_model_parameters = {"positions": [free_base_stations[index].coordinates, free_base_stations[index + 2].coordinates]}
+        user._connect_to_application(app=app, delay_sla=10)
+        CircularDurationAndIntervalAccessPattern(user=user, app=app, start=1, duration_values=[3], interval_values=[6])
+
+    topology = Topology.first()
+    simulator.topology = simulator.initialize_agent(agent=topology)
+    for component_class in [NetworkSwitch, NetworkLink, BaseStation, EdgeServer, ContainerRegistry, ContainerImage, ContainerLayer, Service, User, Application]:
+        for component in component_class.all():
+            simulator.initialize_agent(agent=component)
+
+    return simulator
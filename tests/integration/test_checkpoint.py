@@ -0,0 +1,50 @@
+from edge_sim_py.activation_schedulers import DefaultScheduler, EventDrivenScheduler
+from edge_sim_py.components.data_packet import DataPacket
+from edge_sim_py.components.network_flow import NetworkFlow
+from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.components.service import Service
+from edge_sim_py.components.topology import Topology
+from tests.integration.conftest import build_simulator
+
+import pytest
+
+
+@pytest.mark.parametrize("scheduler", [DefaultScheduler, EventDrivenScheduler])
+def test_checkpoint_and_restore(tmp_path, scheduler):
+
+    simulator = build_simulator(scheduler=scheduler)
+    simulator.run_model()
+    metrics = simulator.agent_metrics
+    packets = [packet.collect() for packet in DataPacket.all()]
+    flows = [flow.collect() for flow in NetworkFlow.all()]
+
+    # Stopping the simulation in the middle of the migration of service 2 (which starts at step 10)
+    simulator = build_simulator(scheduler=scheduler)
+    simulator.stopping_criterion = lambda model: model.schedule.steps == 12
+    simulator.run_model()
+    simulator.checkpoint(file_path=f"{tmp_path}/checkpoint.msgpack")
+
+    restored_simulator = build_simulator(scheduler=scheduler)
+    restored_simulator.restore(file_path=f"{tmp_path}/checkpoint.msgpack")
+
+    assert restored_simulator.schedule.steps == 12
+    assert Service.find_by_id(2)._Service__migrations[-1]["end"] is None
+    assert restored_simulator.topology is Topology.first()
+    assert all(agent.model is restored_simulator for agent in restored_simulator.schedule.agents)
+
+    # Active flows are restored along with the topology links they cross
+    active_flows = [flow for flow in NetworkFlow.all() if flow.status == "active"]
+    assert len(active_flows) > 0
+    for flow in active_flows:
+        for source, target in zip(flow.path, flow.path[1:]):
+            assert flow in Topology.first()[source][target]["active_flows"]
+
+    # Link properties are restored both into slots and as dictionary items
+    assert all(dict.__getitem__(link, field) == getattr(link, field) for link in NetworkLink.all() for field in NetworkLink.__slots__)
+    assert all(dict.__getitem__(link, "active_flows") is link.active_flows for link in NetworkLink.all())
+
+    restored_simulator.run_model()
+
+    assert restored_simulator.agent_metrics == metrics
+    assert [packet.collect() for packet in DataPacket.all()] == packets
+    assert [flow.collect() for flow in NetworkFlow.all()] == flows
@@ -0,0 +1,72 @@
+import gzip
+import json
+
+import msgpack
+import pytest
+
+from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.simulator import Simulator
+from edge_sim_py.components.user import User
+from tests.integration.conftest import _alternating_mobility, build_simulator
+
+
+def _export():
+
+    ignore_list = ["Simulator", "Topology", "NetworkFlow", "DataPacket"]
+    return {
+        component_class.__name__: [component._to_dict() for component in component_class.all()]
+        for component_class in ComponentManager.__subclasses__()
+        if component_class.__name__ not in ignore_list
+    }
+
+
+def test_dataset_formats(tmp_path):
+
+    build_simulator()
+    dataset = json.loads(json.dumps(_export()))
+    records = [{"class": key, **specification} for key, specifications in dataset.items() for specification in specifications]
+
+    with open(f"{tmp_path}/dataset.json", "w", encoding="UTF-8") as output_file:
+        json.dump(dataset, output_file)
+    with open(f"{tmp_path}/dataset.ndjson", "w", encoding="UTF-8") as output_file:
+        output_file.writelines(f"{json.dumps(record)}\n" for record in records)
+    with gzip.open(f"{tmp_path}/dataset.msgpack.gz", "wb") as output_file:
+        output_file.writelines(msgpack.packb(record) for record in records)
+
+    for input_file in [dataset, f"{tmp_path}/dataset.json", f"{tmp_path}/dataset.ndjson", f"{tmp_path}/dataset.msgpack.gz"]:
+        simulator = Simulator(user_defined_functions=[_alternating_mobility])
+        simulator.initialize(input_file=input_file)
+
+        assert json.loads(json.dumps(_export())) == dataset
+        assert all(user.base_station.users.count(user) == 1 for user in User.all())
+        assert simulator.topology.number_of_edges() > 0
+
+
+def test_dataset_with_invalid_references():
+
+    build_simulator()
+    dataset = _export()
+    dataset["User"][0]["relationships"]["base_station"]["id"] = 999
+
+    simulator = Simulator(user_defined_functions=[_alternating_mobility])
+    with pytest.raises(Exception, match="invalid object"):
+        simulator.initialize(input_file=dataset)
+
+    with pytest.raises(Exception, match="Could not find component classes"):
+        simulator.initialize(input_file={"UnknownComponent": []})
+
+
+@pytest.mark.parametrize("file_format,compress", [("json", False), ("json", True), ("ndjson", False), ("msgpack", True)])
+def test_export_scenario_round_trip(tmp_path, monkeypatch, file_format, compress):
+
+    monkeypatch.chdir(tmp_path)
+    build_simulator()
+
+    scenario = json.loads(json.dumps(ComponentManager.export_scenario()))
+    exported = ComponentManager.export_scenario(save_to_file=True, file_format=file_format, compress=compress, keep_in_memory=False)
+    assert exported == {}
+
+    simulator = Simulator(user_defined_functions=[_alternating_mobility])
+    simulator.initialize(input_file=f"datasets/dataset.{file_format}{'.gz' if compress else ''}")
+
+    assert json.loads(json.dumps(ComponentManager.export_scenario())) == scenario
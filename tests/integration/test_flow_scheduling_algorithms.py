@@ -0,0 +1,47 @@
+from edge_sim_py.components.data_packet import DataPacket
+from edge_sim_py.components.flow_scheduling import max_min_fairness, network_wide_max_min_fairness, vectorized_max_min_fairness
+from edge_sim_py.components.network_flow import NetworkFlow
+from edge_sim_py.components.network_link import NetworkLink
+from tests.integration.conftest import build_simulator
+
+
+def _run(network_flow_scheduling_algorithm):
+
+    simulator = build_simulator(network_flow_scheduling_algorithm=network_flow_scheduling_algorithm)
+    simulator.run_model()
+
+    return simulator
+
+
+def _round(value):
+
+    # Allocations calculated by different algorithms may differ in floating-point rounding
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, dict):
+        return {key: _round(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_round(item) for item in value]
+    return value
+
+
+def test_vectorized_max_min_fairness_matches_max_min_fairness():
+
+    simulator = _run(max_min_fairness)
+    packets = [packet.collect() for packet in DataPacket.all()]
+
+    vectorized_simulator = _run(vectorized_max_min_fairness)
+    vectorized_packets = [packet.collect() for packet in DataPacket.all()]
+
+    assert len(packets) > 0
+    assert _round(packets) == _round(vectorized_packets)
+    assert _round(simulator.agent_metrics) == _round(vectorized_simulator.agent_metrics)
+
+
+def test_network_wide_max_min_fairness_respects_link_capacities():
+
+    _run(network_wide_max_min_fairness)
+
+    assert any(flow.status == "finished" for flow in NetworkFlow.all())
+    for link in NetworkLink.all():
+        assert sum(flow.bandwidth[link["id"]] for flow in link["active_flows"]) <= link["bandwidth"] + 1e-9
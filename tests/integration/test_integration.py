@@ -1,3 +1,5 @@
+import pytest
+
 from edge_sim_py.components.application import Application
 from edge_sim_py.components.base_station import BaseStation
 from edge_sim_py.components.container_image import ContainerImage
@@ -5,6 +7,7 @@ from edge_sim_py.components.container_layer import ContainerLayer
 from edge_sim_py.components.container_registry import ContainerRegistry
 from edge_sim_py.components.data_packet import DataPacket, LinkHop
 from edge_sim_py.components.edge_server import EdgeServer
+from edge_sim_py.components.latency_models import mm1_latency
 from edge_sim_py.components.network_flow import NetworkFlow
 from edge_sim_py.components.network_link import NetworkLink
 from edge_sim_py.components.network_switch import NetworkSwitch
@@ -12,7 +15,8 @@ from edge_sim_py.components.service import Service
 from edge_sim_py.components.topology import Topology
 from edge_sim_py.components.user import User
 from edge_sim_py.components.user_access_patterns.circular_duration_and_interval_access_pattern import CircularDurationAndIntervalAccessPattern
-from tests.integration.conftest import _dynamic_dummy_mobility, provisioning_algorithm
+from edge_sim_py.simulator import Simulator
+from tests.integration.conftest import _dynamic_dummy_mobility, build_simulator, provisioning_algorithm
 
 
 def test_integration_start_flows(small_app_2_user_4_services):
@@ -486,3 +490,121 @@ def test_integration_migration(small_app_2_user_4_services_provision):
         assert data._status == "dropped"
         assert data._is_processing is False
         assert len(data.get_hops()) == 2
+
+
+def test_links_only_store_applications_of_current_communication_paths():
+
+    simulator = build_simulator()
+    simulator.run_model()
+
+    # Users move between base stations, so links used by previous communication paths must have been released
+    expected_applications = {}
+    for user in User.all():
+        for app in user.applications:
+            for path in user.communication_paths[str(app.id)]:
+                for i in range(len(path) - 1):
+                    link = simulator.topology[NetworkSwitch.find_by_id(path[i])][NetworkSwitch.find_by_id(path[i + 1])]
+                    expected_applications.setdefault(link["id"], set()).add(app)
+
+    for link in NetworkLink.all():
+        assert set(link["applications"]) == expected_applications.get(link["id"], set())
+
+
+def test_cut_through_packet_switching():
+
+    simulator = build_simulator(packet_switching="cut_through")
+    simulator.run_model()
+
+    # Each network flow transfers a data packet through all the remaining links of a hop of its path
+    data_packet_flows = [flow for flow in NetworkFlow.all() if flow.metadata["type"] == "data_packet"]
+    assert any(len(flow.path) > 2 for flow in data_packet_flows)
+    for flow in data_packet_flows:
+        data_packet = flow.metadata["object"]
+        assert flow.path == data_packet._total_path[flow.metadata["index_hop"]][flow.metadata["index_link"] :]
+
+    # Link hops are still recorded for each link, and flows that cross multiple links only count their transfer time once
+    for data_packet in DataPacket.all():
+        hops = data_packet.get_hops()
+        for hop in hops:
+            path = data_packet._total_path[hop.hop_index]
+            assert (hop.source, hop.target) == (path[hop.link_index].id, path[min(hop.link_index + 1, len(path) - 1)].id)
+
+        assert data_packet.propagation_delay_total == sum(hop.propagation_delay for hop in hops)
+        assert data_packet.transmission_delay_total == sum(hop.transmission_delay for hop in hops if hop.link_index == 0)
+
+
+def test_cut_through_packet_switching_delays():
+
+    simulator = build_simulator(packet_switching="cut_through")
+    simulator.stopping_criterion = lambda model: model.schedule.steps == 15
+
+    # Only the second user sends a single data packet (size 20) through links with bandwidth 10 and delay 1, crossing two links to
+    # reach its first service (processing time 5, output 24) and one link to reach its second service (processing time 4)
+    first_user, second_user = User.all()
+    CircularDurationAndIntervalAccessPattern(user=first_user, app=first_user.applications[0], start=100, duration_values=[1], interval_values=[100])
+    CircularDurationAndIntervalAccessPattern(user=second_user, app=second_user.applications[0], start=1, duration_values=[1], interval_values=[100])
+
+    simulator.run_model()
+
+    # Fields: (source, target, start time, end time, queue delay, transmission delay, processing delay, propagation delay, average bandwidth)
+    hops = [
+        (hop.source, hop.target, hop.start_time, hop.end_time, hop.queue_delay, hop.transmission_delay, hop.processing_delay, hop.propagation_delay, hop.avg_bandwidth)
+        for hop in DataPacket.first().get_hops()
+    ]
+    assert hops == [(3, 2, 1, 3, 0, 2, 0, 1, 10), (2, 4, 1, 8, 0, 0, 5, 1, 10), (4, 2, 8, 15, 0, 3, 4, 1, 10)]
+    assert [(flow.start, flow.end) for flow in NetworkFlow.all() if flow.metadata["type"] == "data_packet"] == [(1, 3), (8, 11)]
+
+
+def test_data_packet_aggregation():
+
+    metrics = {}
+    for data_packet_aggregation in [False, True]:
+        simulator = build_simulator(data_packet_aggregation=data_packet_aggregation)
+
+        # Adding a second user that follows the same trajectory and access pattern of each user, so that both generate identical data packets
+        for user in list(User.all()):
+            app = user.applications[0]
+            twin = User()
+            twin.set_packet_size_strategy(mode="fixed", size=20)
+            twin._set_initial_position(coordinates=user.coordinates, number_of_replicates=3)
+            twin.mobility_model = user.mobility_model
+            twin.mobility_model_parameters = user.mobility_model_parameters
+            twin._connect_to_application(app=app, delay_sla=10)
+            CircularDurationAndIntervalAccessPattern(user=twin, app=app, start=1, duration_values=[3], interval_values=[6])
+            simulator.initialize_agent(agent=twin)
+
+        simulator.run_model()
+
+        metrics[data_packet_aggregation] = {
+            "DataPacket": sorted(str(record) for record in simulator.agent_metrics["DataPacket"]),
+            "Application": simulator.agent_metrics["Application"],
+        }
+
+        if data_packet_aggregation:
+            assert all(data_packet.count == 2 for data_packet in DataPacket.all())
+            assert all(flow.count == 2 for flow in NetworkFlow.all() if flow.metadata["type"] == "data_packet")
+
+    # Bulk data packets report the metrics (and identifiers) of each of their data packets, which match those of individual data packets
+    assert metrics[True] == metrics[False]
+
+    # Flow scheduling algorithms that ignore the number of data packets carried by each flow cannot be used with data packet aggregation
+    def custom_flow_scheduling(topology: object, flows: list):
+        pass
+
+    with pytest.raises(Exception, match="not supported by the custom_flow_scheduling algorithm"):
+        Simulator(data_packet_aggregation=True, network_flow_scheduling_algorithm=custom_flow_scheduling)
+
+
+def test_mm1_latency_model():
+
+    simulator = build_simulator(latency_model=mm1_latency)
+    simulator.run_model()
+
+    # User delays are computed analytically, so no data packets (nor their network flows) are created
+    assert len(DataPacket.all()) == 0
+    assert all(flow.metadata["type"] != "data_packet" for flow in NetworkFlow.all())
+
+    for user in User.all():
+        for app in user.applications:
+            assert user.access_patterns[str(app.id)].history[0]["access_time"] > 0
+            assert user.delays[str(app.id)] is not None
@@ -0,0 +1,22 @@
+import msgpack
+
+from edge_sim_py.metrics import read_metrics
+from tests.integration.conftest import build_simulator
+
+
+def test_dumped_metrics_match_metrics_kept_in_memory(tmp_path):
+
+    simulator = build_simulator()
+    simulator.run_model()
+    agent_metrics = simulator.agent_metrics
+
+    dumping_simulator = build_simulator(logs_directory=str(tmp_path))
+    dumping_simulator.dump_interval = 5
+    dumping_simulator.run_model()
+
+    # Metrics are released from memory once written to the disk
+    assert all(len(metrics) == 0 for metrics in dumping_simulator.agent_metrics.values())
+
+    # Tuples (e.g., coordinates) are stored as lists
+    for key, metrics in agent_metrics.items():
+        assert list(read_metrics(f"{tmp_path}/{key}.msgpack")) == msgpack.unpackb(msgpack.packb(metrics), strict_map_key=False)
@@ -0,0 +1,68 @@
+import pytest
+
+from edge_sim_py.components.data_packet import DataPacket
+from edge_sim_py.components.edge_server import EdgeServer
+from edge_sim_py.components.user import User
+from tests.integration.conftest import build_simulator
+
+
+def test_monitoring_settings():
+
+    simulator = build_simulator()
+    simulator.run_model()
+    metrics = simulator.agent_metrics
+
+    sampled_simulator = build_simulator()
+    sampled_simulator.configure_monitoring(component_class="NetworkSwitch", enabled=False)
+    sampled_simulator.configure_monitoring(component_class=User, fields=["Coordinates", "Base Station"], interval=5)
+    sampled_simulator.configure_monitoring(component_class="EdgeServer", changed_only=True)
+    sampled_simulator.run_model()
+    sampled_metrics = sampled_simulator.agent_metrics
+
+    # Disabled classes are not monitored
+    assert "NetworkSwitch" in metrics and "NetworkSwitch" not in sampled_metrics
+
+    # Sampled classes only have the selected fields collected at the specified interval
+    expected_user_metrics = [
+        {key: value for key, value in record.items() if key in ["Object", "Time Step", "Coordinates", "Base Station"]}
+        for record in metrics["User"]
+        if record["Time Step"] % 5 == 0
+    ]
+    assert sampled_metrics["User"] == expected_user_metrics
+
+    # Applying the changes stored for each edge server rebuilds its full metrics history
+    states = {}
+    for record in sampled_metrics["EdgeServer"]:
+        states[record["Object"]] = {**states.get(record["Object"], {}), **record}
+        assert states[record["Object"]] in metrics["EdgeServer"]
+
+    assert len(sampled_metrics["EdgeServer"]) < len(metrics["EdgeServer"])
+
+    # Classes without monitoring settings are monitored as usual
+    assert sampled_metrics["Service"] == metrics["Service"]
+
+
+def test_monitoring_fields_are_not_computed_unless_selected(monkeypatch):
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Unselected metric computed.")
+
+    # Metrics left out of the selected fields are never computed (e.g., the power consumption of edge servers or the hops of data packets)
+    monkeypatch.setattr(EdgeServer, "get_power_consumption", fail)
+    monkeypatch.setattr(DataPacket, "_get_hop_dictionaries", fail)
+
+    simulator = build_simulator()
+    simulator.configure_monitoring(component_class=EdgeServer, fields=["CPU", "Services"])
+    simulator.configure_monitoring(component_class=DataPacket, fields=["Id", "User", "Status", "Total Delay"])
+    simulator.run_model()
+
+    assert all(list(record.keys()) == ["Object", "Time Step", "CPU", "Services"] for record in simulator.agent_metrics["EdgeServer"])
+    assert all(list(record.keys()) == ["Object", "Time Step", "Id", "User", "Status", "Total Delay"] for record in simulator.agent_metrics["DataPacket"])
+    assert any(record["Status"] == "dropped" for record in simulator.agent_metrics["DataPacket"])
+
+
+def test_invalid_monitoring_interval():
+
+    simulator = build_simulator()
+    with pytest.raises(Exception):
+        simulator.configure_monitoring(component_class=User, interval=0)
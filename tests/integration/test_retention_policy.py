@@ -0,0 +1,39 @@
+from edge_sim_py.components.data_packet import DataPacket
+from edge_sim_py.components.network_flow import NetworkFlow
+from tests.integration.conftest import build_simulator
+
+
+def _run(retention_policy):
+
+    simulator = build_simulator(retention_policy=retention_policy)
+    simulator.run_model()
+
+    return simulator
+
+
+def test_archive_retention_policy_keeps_results():
+
+    simulator = _run("keep")
+    packets = {packet.id: packet.collect() for packet in DataPacket.all()}
+    flows = len(NetworkFlow.all())
+
+    archive_simulator = _run("archive")
+    archived_packets = archive_simulator.get_archived_records(class_name="DataPacket")
+    archived_flows = archive_simulator.get_archived_records(class_name="NetworkFlow")
+
+    # Only live components are kept as objects
+    assert len(archived_packets) > 0 and len(archived_flows) > 0
+    assert all(packet._status not in ["finished", "dropped"] for packet in DataPacket.all())
+    assert all(flow.status == "active" for flow in NetworkFlow.all())
+    assert all(agent in DataPacket.all() for agent in archive_simulator.schedule.agents if isinstance(agent, DataPacket))
+
+    # Archived records hold the final metrics of the components, and only the metrics listed by their classes are kept
+    assert all(len(record) == len(archive_simulator.archived_components["DataPacket"]["fields"]) for record in archive_simulator.archived_components["DataPacket"]["records"])
+    archived_packets = {record["Id"]: {key: value for key, value in record.items() if key != "Time Step"} for record in archived_packets}
+    live_packets = {packet.id: {field: packet.collect()[field] for field in DataPacket._archived_metrics} for packet in DataPacket.all()}
+    assert {**archived_packets, **live_packets} == {packet_id: {field: metrics[field] for field in DataPacket._archived_metrics} for packet_id, metrics in packets.items()}
+    assert len(archived_flows) + len(NetworkFlow.all()) == flows
+
+    # Archiving components does not change the simulation results
+    for key in ["NetworkSwitch", "EdgeServer", "ContainerRegistry", "Service", "User"]:
+        assert simulator.agent_metrics[key] == archive_simulator.agent_metrics[key]
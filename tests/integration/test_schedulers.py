@@ -0,0 +1,96 @@
+import pytest
+
+from edge_sim_py.activation_schedulers import DefaultScheduler, EventDrivenScheduler
+from edge_sim_py.components.data_packet import DataPacket
+from edge_sim_py.components.network_flow import NetworkFlow
+from edge_sim_py.components.service import Service
+from edge_sim_py.components.user import User
+from edge_sim_py.components.user_access_patterns import CircularDurationAndIntervalAccessPattern
+from tests.integration.conftest import build_simulator
+
+
+def _run(scheduler):
+
+    simulator = build_simulator(scheduler=scheduler)
+    simulator.run_model()
+
+    return simulator
+
+
+def test_event_driven_scheduler_matches_default_scheduler():
+
+    default_simulator = _run(DefaultScheduler)
+    default_packets = [packet.collect() for packet in DataPacket.all()]
+    default_flows = len(NetworkFlow.all())
+
+    event_driven_simulator = _run(EventDrivenScheduler)
+    event_driven_packets = [packet.collect() for packet in DataPacket.all()]
+
+    assert len(default_packets) > 0
+    assert Service.find_by_id(2).server.id == 3
+    assert default_flows == len(NetworkFlow.all())
+    assert default_packets == event_driven_packets
+    assert default_simulator.agent_metrics == event_driven_simulator.agent_metrics
+
+
+def test_event_driven_scheduler_skips_idle_agents():
+
+    simulator = build_simulator(scheduler=EventDrivenScheduler)
+    simulator.run_model()
+
+    active_agents = [agent for agents in simulator.schedule._active_agents.values() for agent in agents.values()]
+
+    assert len(active_agents) < len(simulator.schedule.agents)
+    assert all(packet.unique_id not in simulator.schedule._active_agents[DataPacket] for packet in DataPacket.all() if packet._status == "finished")
+
+
+def _run_sparse(scheduler, time_advance):
+
+    simulator = build_simulator(scheduler=scheduler, time_advance=time_advance)
+    simulator.stopping_criterion = lambda model: model.schedule.steps == 121
+
+    # The resource management algorithm declares the next step in which it must be called, so that it is not called at skipped steps
+    algorithm = simulator.resource_management_algorithm
+    simulator.algorithm_calls = 0
+
+    def resource_management_algorithm(parameters):
+        simulator.algorithm_calls += 1
+        parameters["next_call_step"] = 10 if parameters["current_step"] < 10 else float("inf")
+        algorithm(parameters=parameters)
+
+    simulator.resource_management_algorithm = resource_management_algorithm
+
+    # Metrics are collected every 10 steps, so that the "next_event" mode can jump over the steps between collections
+    for component_class in {type(agent) for agent in simulator.schedule.agents} | {DataPacket, NetworkFlow}:
+        simulator.configure_monitoring(component_class=component_class, interval=10)
+
+    # Users only make short accesses separated by long intervals
+    for user in User.all():
+        for app in user.applications:
+            CircularDurationAndIntervalAccessPattern(user=user, app=app, start=1, duration_values=[2], interval_values=[40])
+
+    simulator.run_model()
+
+    return simulator
+
+
+def test_next_event_time_advance_matches_tick_time_advance():
+
+    tick_simulator = _run_sparse(scheduler=DefaultScheduler, time_advance="tick")
+    tick_packets = [packet.collect() for packet in DataPacket.all()]
+    tick_flows = [flow.collect() for flow in NetworkFlow.all()]
+
+    next_event_simulator = _run_sparse(scheduler=EventDrivenScheduler, time_advance="next_event")
+
+    assert next_event_simulator.skipped_steps > 0
+    assert next_event_simulator.algorithm_calls < tick_simulator.algorithm_calls == tick_simulator.schedule.steps
+    assert next_event_simulator.schedule.steps == tick_simulator.schedule.steps
+    assert tick_packets == [packet.collect() for packet in DataPacket.all()]
+    assert tick_flows == [flow.collect() for flow in NetworkFlow.all()]
+    assert tick_simulator.agent_metrics == next_event_simulator.agent_metrics
+
+
+def test_next_event_time_advance_requires_event_driven_scheduler():
+
+    with pytest.raises(Exception):
+        build_simulator(scheduler=DefaultScheduler, time_advance="next_event")
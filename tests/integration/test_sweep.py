@@ -0,0 +1,83 @@
+import os
+
+from edge_sim_py.components.data_packet import DataPacket
+from edge_sim_py.sweep import run_sweep
+from tests.integration.conftest import _alternating_mobility, build_simulator
+
+
+def _stopping_criterion(model):
+    return model.schedule.steps == 20
+
+
+def _resource_management_algorithm(parameters):
+    ...
+
+
+def _counting_algorithm(parameters):
+    parameters["calls"] = parameters.get("calls", 0) + 1
+
+
+def _count_data_packets(simulator):
+    return {"Data Packets": len(DataPacket.all())}
+
+
+def _count_algorithm_calls(simulator):
+    return {"Data Packets": len(DataPacket.all()), "Calls": simulator.resource_management_algorithm_parameters["calls"]}
+
+
+def test_run_sweep(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    dataset = build_simulator().export_scenario()
+
+    parameters = {
+        "stopping_criterion": [_stopping_criterion],
+        "resource_management_algorithm": [_resource_management_algorithm],
+        "user_defined_functions": [[_alternating_mobility]],
+        "dump_interval": [10],
+        "tick_duration": [1, 2],
+    }
+    sweep = {"input_file": dataset, "simulator_parameters": parameters, "seeds": [1, 2], "summary_function": _count_data_packets, "max_workers": 2}
+
+    summaries = run_sweep(**sweep)
+
+    assert [summary["Run"] for summary in summaries] == [0, 1, 2, 3]
+    assert [(summary["Parameters"]["tick_duration"], summary["Seed"]) for summary in summaries] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+    assert all(summary["Time Steps"] == 20 and summary["Data Packets"] > 0 for summary in summaries)
+    assert all(os.path.exists(f"sweep/run_{index}/User.msgpack") for index in range(4))
+
+    # Resuming the sweep only executes the simulations without stored summaries
+    os.remove("sweep/run_2/summary.json")
+    modification_times = [os.path.getmtime(f"sweep/run_{index}/summary.json") for index in [0, 1, 3]]
+
+    resumed_summaries = run_sweep(**sweep)
+
+    assert [os.path.getmtime(f"sweep/run_{index}/summary.json") for index in [0, 1, 3]] == modification_times
+    assert resumed_summaries[:2] + resumed_summaries[3:] == summaries[:2] + summaries[3:]
+    assert resumed_summaries[2]["Data Packets"] == summaries[2]["Data Packets"]
+
+
+def test_run_sweep_isolates_simulations_in_shared_workers(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    dataset = build_simulator().export_scenario()
+
+    parameters = {
+        "stopping_criterion": [_stopping_criterion],
+        "resource_management_algorithm": [_counting_algorithm],
+        "user_defined_functions": [[_alternating_mobility]],
+        "dump_interval": [float("inf")],
+    }
+    sweep = {"input_file": dataset, "simulator_parameters": parameters, "summary_function": _count_algorithm_calls}
+
+    # Simulations executed one after another by the same worker process
+    summaries = run_sweep(**sweep, seeds=[1, 2, 3], logs_directory="shared", max_workers=1)
+
+    # Each simulation executed by a fresh worker process
+    fresh_summaries = [run_sweep(**sweep, seeds=[seed], logs_directory=f"fresh_{seed}", max_workers=1)[0] for seed in [1, 2, 3]]
+
+    def describe(summary):
+        return {key: value for key, value in summary.items() if key not in ["Run", "Logs Directory", "Execution Time"]}
+
+    assert all(summary["Calls"] == 20 for summary in summaries)
+    assert [describe(summary) for summary in summaries] == [describe(summary) for summary in fresh_summaries]
@@ -0,0 +1,81 @@
+from mesa import Agent, Model
+
+from edge_sim_py.activation_schedulers import BaseScheduler, RandomScheduler
+from edge_sim_py.activation_schedulers.event_driven_scheduler import is_passive
+from edge_sim_py.components.base_station import BaseStation
+from edge_sim_py.components.network_switch import NetworkSwitch
+from edge_sim_py.components.user import User
+
+
+class SpawningAgent(Agent):
+    def __init__(self, unique_id, model, activations, spawn=False, remove=None):
+        Agent.__init__(self, unique_id=unique_id, model=model)
+        self.activations = activations
+        self.spawn = spawn
+        self.remove = remove
+
+    def step(self):
+        self.activations.append(self.unique_id)
+
+        if self.spawn:
+            self.spawn = False
+            self.model.schedule.add(SpawningAgent(unique_id=self.model.next_id(), model=self.model, activations=self.activations))
+
+        if self.remove:
+            self.model.schedule.remove(self.remove)
+            self.remove = None
+
+
+def _build_model(scheduler_class):
+    model = Model()
+    model.schedule = scheduler_class(model)
+    activations = []
+
+    agents = [SpawningAgent(unique_id=model.next_id(), model=model, activations=activations) for _ in range(4)]
+    agents[0].spawn = True
+    agents[1].remove = agents[3]
+    for agent in agents:
+        model.schedule.add(agent)
+
+    return model, activations
+
+
+def test_base_scheduler_activation_order():
+
+    model, activations = _build_model(BaseScheduler)
+
+    model.schedule.step()
+
+    # Agent 4 is removed by agent 2, whereas agent 5 is created by agent 1
+    assert activations == [1, 2, 3, 5]
+    assert model.schedule.steps == 1
+
+    activations.clear()
+    model.schedule.step()
+
+    assert activations == [1, 2, 3, 5]
+
+
+def test_random_scheduler_activates_each_agent_once():
+
+    model, activations = _build_model(RandomScheduler)
+
+    model.schedule.step()
+
+    assert sorted(activations) == [1, 2, 3, 5] or sorted(activations) == [1, 2, 3, 4, 5]
+    assert len(activations) == len(set(activations))
+    assert model.schedule.steps == 1
+
+
+def test_is_passive():
+
+    class CustomNetworkSwitch(NetworkSwitch):
+        def step(self):
+            self.activated = True
+
+    class InheritedNetworkSwitch(NetworkSwitch):
+        pass
+
+    assert is_passive(NetworkSwitch) and is_passive(BaseStation) and is_passive(InheritedNetworkSwitch)
+    assert not is_passive(CustomNetworkSwitch)
+    assert not is_passive(User)
@@ -33,7 +33,7 @@ def test_collect():
     app.users = [u]
 
     data_packet = MagicMock(spec=DataPacket)
-    data_packet.id = 3
+    data_packet._get_packet_id.return_value = 3
 
     app._user_data_packets = {str(u.id): [data_packet]}
 
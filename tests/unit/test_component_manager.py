@@ -0,0 +1,111 @@
+from edge_sim_py.components.base_station import BaseStation
+from edge_sim_py.components.container_layer import ContainerLayer
+from edge_sim_py.components.network_switch import NetworkSwitch
+
+
+def test_find_by_id_index():
+
+    NetworkSwitch._instances = []
+    NetworkSwitch._object_count = 0
+
+    switches = [NetworkSwitch() for _ in range(5)]
+
+    assert NetworkSwitch.find_by_id(3) == switches[2]
+    assert NetworkSwitch.find_by_id(10) is None
+
+    # Instances created after the index was built are also found
+    new_switch = NetworkSwitch(obj_id=10)
+    assert NetworkSwitch.find_by_id(10) == new_switch
+
+    # Ids reassigned after the index was built are still honored
+    switches[0].id = 20
+    assert NetworkSwitch.find_by_id(20) == switches[0]
+    assert NetworkSwitch.find_by_id(1) is None
+
+
+def test_find_by_id_index_after_remove_and_reset():
+
+    NetworkSwitch._instances = []
+    NetworkSwitch._object_count = 0
+
+    switch1 = NetworkSwitch(obj_id=1)
+    switch2 = NetworkSwitch(obj_id=1)
+
+    assert NetworkSwitch.find_by_id(1) == switch1
+
+    NetworkSwitch.remove(switch1)
+    assert NetworkSwitch.find_by_id(1) == switch2
+
+    NetworkSwitch._instances = []
+    assert NetworkSwitch.find_by_id(1) is None
+
+
+def test_find_by_secondary_index():
+
+    BaseStation._instances = []
+    BaseStation._object_count = 0
+    ContainerLayer._instances = []
+    ContainerLayer._object_count = 0
+
+    base_station1 = BaseStation()
+    base_station1.coordinates = (0, 0)
+    base_station2 = BaseStation()
+    base_station2.coordinates = [2, 0]
+
+    assert BaseStation.find_by(attribute_name="coordinates", attribute_value=(0, 0)) == base_station1
+    assert BaseStation.find_by(attribute_name="coordinates", attribute_value=[2, 0]) == base_station2
+    assert BaseStation.find_by(attribute_name="coordinates", attribute_value=(2, 0)) is None
+
+    # Coordinates updated after the index was built are still honored
+    base_station1.coordinates = (4, 0)
+    assert BaseStation.find_by(attribute_name="coordinates", attribute_value=(4, 0)) == base_station1
+    assert BaseStation.find_by(attribute_name="coordinates", attribute_value=(0, 0)) is None
+
+    # Lookups return the first instance that holds a given value
+    template_layer = ContainerLayer(digest="sha256:1")
+    ContainerLayer(digest="sha256:1")
+    assert ContainerLayer.find_by(attribute_name="digest", attribute_value="sha256:1") == template_layer
+
+
+def test_base_station_spatial_index():
+
+    BaseStation._instances = []
+    BaseStation._object_count = 0
+    BaseStation._reset_indexes()
+
+    base_stations = []
+    for coordinates in [(0, 0), (2, 0), (4, 0), (1, 2), (3, 2), (2, 0)]:
+        base_station = BaseStation()
+        base_station.coordinates = coordinates
+        base_stations.append(base_station)
+
+    # Exact and nearest lookups (ties are broken by the creation order of base stations)
+    assert BaseStation.find_nearest(coordinates=(2, 0)) == base_stations[1]
+    assert BaseStation.find_nearest(coordinates=(2.2, 0.4)) == base_stations[1]
+    assert BaseStation.find_nearest(coordinates=(0.5, 1)) == base_stations[0]
+    assert BaseStation.find_nearest(coordinates=(100, 100)) == base_stations[4]
+
+    assert BaseStation.find_within_radius(coordinates=(1, 0.5), radius=1.5) == [base_stations[0], base_stations[1], base_stations[5], base_stations[3]]
+    assert BaseStation.find_within_radius(coordinates=(10, 10), radius=1) == []
+
+    # Base stations moved, created, or removed after the index was built are honored
+    base_stations[0].coordinates = (50, 50)
+    assert BaseStation.find_nearest(coordinates=(40, 40)) == base_stations[0]
+
+    # Base stations created after the index was built are added to it instead of rebuilding it
+    spatial_index = BaseStation._get_spatial_index()
+    new_base_station = BaseStation()
+    new_base_station.coordinates = (-10, 0)
+    assert BaseStation.find_nearest(coordinates=(-8, 0)) == new_base_station
+    assert BaseStation._spatial_index is spatial_index
+
+    # Queries far away from the base stations only inspect the cells that hold base stations
+    assert BaseStation.find_nearest(coordinates=(-1e9, 1)) == new_base_station
+    assert BaseStation.find_nearest(coordinates=(1e9, 1e9)) == base_stations[0]
+
+    new_base_station.coordinates = (-20, 0)
+    assert BaseStation._spatial_index is None
+    assert BaseStation.find_nearest(coordinates=(-15.5, 0)) == new_base_station
+
+    BaseStation.remove(new_base_station)
+    assert BaseStation.find_nearest(coordinates=(-8, 0)) == base_stations[3]
@@ -0,0 +1,60 @@
+import pytest
+
+from edge_sim_py.components.mobility_models import CoordinatesTrace
+from edge_sim_py.components.user import User
+
+
+def test_coordinates_trace_runs():
+
+    trace = CoordinatesTrace(items=[(0, 0), (0, 0)])
+    trace.append((0, 0), repeats=3)
+    trace.append((1, 0), repeats=1000)
+    trace.extend([(0, 0)])
+
+    assert len(trace) == 1006
+    assert trace.get_run_lengths() == [5, 1000, 1]
+    assert [trace[step] for step in [0, 4, 5, 1004, -1]] == [(0, 0), (0, 0), (1, 0), (1, 0), (0, 0)]
+    assert trace.get_run_end(index=5) == 1005
+    assert trace[3:7] == [(0, 0), (0, 0), (1, 0), (1, 0)]
+
+
+def test_coordinates_trace_discard():
+
+    trace = CoordinatesTrace()
+    trace.append((0, 0), repeats=5)
+    trace.append((1, 0), repeats=5)
+    trace.discard(until=7)
+
+    # Indexes of the remaining steps are kept, whereas discarded steps can no longer be accessed
+    assert len(trace) == 10
+    assert trace[7] == (1, 0)
+    assert list(trace) == [(1, 0)] * 5
+    with pytest.raises(IndexError):
+        trace[4]
+
+
+def test_user_coordinates_trace_conversion():
+
+    user = User()
+    user.coordinates_trace = [(0, 0), (0, 0), (1, 0)]
+
+    assert isinstance(user.coordinates_trace, CoordinatesTrace)
+    assert user.coordinates_trace == [(0, 0), (0, 0), (1, 0)]
+    assert user.coordinates_trace.get_run_lengths() == [2, 1]
+
+
+def test_user_coordinates_trace_export():
+
+    user = User()
+    user.coordinates_trace.append((0, 0), repeats=5)
+    user.coordinates_trace.append((1, 0), repeats=5)
+    user.coordinates_trace.discard(until=7)
+
+    # Exported traces keep their runs and the number of discarded steps, so restored steps keep their indexes
+    exported_trace = user.coordinates_trace._to_dict()
+    assert exported_trace == {"discarded": 5, "runs": [[(1, 0), 5]]}
+
+    user.coordinates_trace = exported_trace
+    assert user.coordinates_trace._discarded == 5
+    assert len(user.coordinates_trace) == 10
+    assert user.coordinates_trace[7] == (1, 0)
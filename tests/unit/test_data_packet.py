@@ -1,4 +1,4 @@
-from dataclasses import asdict
+from dataclasses import asdict, astuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -54,6 +54,7 @@ def test_launch_next_flow():
                 "index_hop": 0,
                 "index_link": 1,
             },
+            count=1,
         )
 
         assert dp._status == "active"
@@ -216,7 +217,10 @@ def test_add_link_hop_intermediate_node():
     flow.path = [switch1, switch2]
     flow.topology = {switch1: {switch2: {"delay": 8}}}
 
-    flow._bandwidth_history = [10, 20, 30]
+    flow._min_bandwidth = 10
+    flow._max_bandwidth = 30
+    flow._bandwidth_sum = 60
+    flow._transfer_steps = 3
 
     link_hop = LinkHop(
         hop_index=0,
@@ -273,7 +277,10 @@ def test_add_link_hop_complete():
     flow.path = [switch1, switch2]
     flow.topology = {switch1: {switch2: {"delay": 8}}}
 
-    flow._bandwidth_history = [10, 20, 30]
+    flow._min_bandwidth = 10
+    flow._max_bandwidth = 30
+    flow._bandwidth_sum = 60
+    flow._transfer_steps = 3
 
     server = MagicMock(spec=EdgeServer)
     switch2.edge_servers = [server]
@@ -327,7 +334,7 @@ def test_collect():
         data_input=5,
         data_output=10,
     )
-    dp._link_hops = [link_hop]
+    dp._record_link_hop(astuple(link_hop))
 
     expected_metrics = {
         "Id": dp.id,
@@ -341,11 +348,14 @@ def test_collect():
         "Propagation Delay": 8,
         "Total Delay": 18,
         "Total Path": [[3, 4, 3, 4], [4, 4, 4]],
-        "Hops": [asdict(link_hop)],
     }
 
+    # Hops are only detailed once the data packet reaches a terminal status
     assert dp.collect() == expected_metrics
 
+    dp._status = "finished"
+    assert dp.collect() == {**expected_metrics, "Status": "finished", "Hops": [asdict(link_hop)]}
+
 
 def test_to_dict():
 
@@ -372,20 +382,21 @@ def test_to_dict():
         data_input=5,
         data_output=10,
     )
-    dp._link_hops = [link_hop]
+    dp._record_link_hop(astuple(link_hop))
 
     expected_metrics = {
         "id": dp.id,
         "user": dp.user.id,
         "application": dp.application.id,
         "size": dp.size,
+        "count": dp.count,
         "status": dp._status,
         "current_hop": dp._current_hop,
         "current_link": dp._current_link,
         "is_processing": dp._is_processing,
         "processing_remaining_time": dp._processing_remaining_time,
         "total_path": [[sw.id for sw in hop] for hop in dp._total_path],
-        "hops": [asdict(h) for h in dp._link_hops],
+        "hops": [asdict(link_hop)],
     }
 
     assert dp._to_dict() == expected_metrics
@@ -532,9 +543,7 @@ def test_all_service_same_server_add_link_hop():
 
     dp._total_path = [MagicMock(), [switch], MagicMock()]
     dp._current_hop = 1
-    linkhop = MagicMock(spec=LinkHop)
-    linkhop.end_time = 5
-    dp._link_hops = [linkhop]
+    dp._record_link_hop(astuple(LinkHop(0, 0, 1, 3, 0, 5, 0, 5, 0, 0, 10, 10, 10, 50, 50)))
 
     service = MagicMock(spec=Service)
     service.processing_time = 4
@@ -560,7 +569,8 @@ def test_all_service_same_server_add_link_hop():
 
     dp._add_link_hop(flow=None, service=service)
 
-    assert dp._link_hops[-1] == expected
+    assert dp.get_hops()[-1] == expected
+    assert dp.transmission_delay_total == 5 and dp.processing_delay_total == 4 and dp.total_delay == 9
 
 
 def test_step_finished():
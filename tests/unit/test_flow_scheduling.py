@@ -0,0 +1,146 @@
+from edge_sim_py.components.flow_scheduling.max_min_fairness import calculate_fair_allocation, max_min_fairness
+from edge_sim_py.components.flow_scheduling.vectorized_max_min_fairness import calculate_vectorized_fair_allocation
+from edge_sim_py.components.flow_scheduling.network_wide_max_min_fairness import (
+    calculate_network_wide_allocation,
+    network_wide_max_min_fairness,
+)
+from edge_sim_py.components.network_flow import NetworkFlow
+from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.components.network_switch import NetworkSwitch
+from edge_sim_py.components.topology import Topology
+
+import numpy as np
+
+
+def _line_topology(bandwidths: list) -> tuple:
+
+    for cls in (NetworkFlow, NetworkLink, NetworkSwitch, Topology):
+        cls._instances = []
+        cls._object_count = 0
+
+    topology = Topology()
+    switches = [NetworkSwitch() for _ in range(len(bandwidths) + 1)]
+    for index, bandwidth in enumerate(bandwidths):
+        link = NetworkLink()
+        link["bandwidth"] = bandwidth
+        link["nodes"] = [switches[index], switches[index + 1]]
+        topology.add_edge(switches[index], switches[index + 1])
+        topology._adj[switches[index]][switches[index + 1]] = link
+        topology._adj[switches[index + 1]][switches[index]] = link
+
+    return topology, switches
+
+
+def test_calculate_fair_allocation():
+
+    assert calculate_fair_allocation(capacity=10, demands=[2, 8, 8]) == [2, 4, 4]
+    assert calculate_fair_allocation(capacity=12, demands=[10, 1, 2, 10]) == [4.5, 1, 2, 4.5]
+
+    # Leftover bandwidth is kept by the items when all demands are fulfilled by the initial equal share
+    assert calculate_fair_allocation(capacity=10, demands=[1, 2]) == [5, 5]
+
+
+def test_calculate_weighted_fair_allocation():
+
+    # Weighted items receive the sum of the shares of the identical items they represent
+    for capacity, demands, weights in [(10, [4, 16, 8], [2, 2, 1]), (12, [30, 1], [3, 1]), (10, [1, 2], [1, 1])]:
+        expanded_demands = [demand / weight for demand, weight in zip(demands, weights) for _ in range(weight)]
+        expanded_shares = calculate_fair_allocation(capacity=capacity, demands=expanded_demands)
+
+        shares = calculate_fair_allocation(capacity=capacity, demands=demands, weights=weights)
+        assert np.allclose(shares, [expanded_shares[sum(weights[:index])] * weight for index, weight in enumerate(weights)])
+
+
+def test_calculate_vectorized_fair_allocation():
+
+    links_demands = [(10, [2, 8, 8]), (12, [10, 1, 2, 10]), (10, [1, 2]), (7.5, [0, 3, 1.25, 20, 20])]
+
+    allocation = calculate_vectorized_fair_allocation(
+        capacities=np.array([capacity for capacity, _ in links_demands], dtype=float),
+        links=np.array([link for link, (_, demands) in enumerate(links_demands) for _ in demands]),
+        demands=np.array([demand for _, demands in links_demands for demand in demands], dtype=float),
+    )
+
+    expected_allocation = [share for capacity, demands in links_demands for share in calculate_fair_allocation(capacity=capacity, demands=demands)]
+    assert np.allclose(allocation, expected_allocation)
+
+
+def test_max_min_fairness_only_recalculates_changed_links():
+
+    topology, switches = _line_topology(bandwidths=[10, 10])
+    flow1 = NetworkFlow(topology=topology, path=switches[0:2], data_to_transfer=100)
+    flow2 = NetworkFlow(topology=topology, path=switches[0:3], data_to_transfer=100)
+    link1, link2 = topology[switches[0]][switches[1]], topology[switches[1]][switches[2]]
+
+    max_min_fairness(topology=topology, flows=NetworkFlow.all())
+    assert flow1.bandwidth == {link1["id"]: 5}
+    assert flow2.bandwidth == {link1["id"]: 5, link2["id"]: 10}
+
+    # Links whose flows did not change are not recalculated
+    flow2.bandwidth[link2["id"]] = 7
+    max_min_fairness(topology=topology, flows=NetworkFlow.all())
+    assert flow2.bandwidth[link2["id"]] == 7
+
+    # Finished flows release their bandwidth and stop being inspected afterwards
+    flow1.status = "finished"
+    flow1.data_to_transfer = 0
+    link1["active_flows"].remove(flow1)
+    max_min_fairness(topology=topology, flows=NetworkFlow.all())
+    assert flow2.bandwidth == {link1["id"]: 10, link2["id"]: 7}
+    assert flow1 not in topology._flow_tracker.active_flows
+
+
+def test_flow_tracker_remove_flows():
+
+    topology, switches = _line_topology(bandwidths=[10])
+    flows = [NetworkFlow(topology=topology, path=switches[0:2], data_to_transfer=100) for _ in range(3)]
+
+    max_min_fairness(topology=topology, flows=NetworkFlow.all())
+    new_flow = NetworkFlow(topology=topology, path=switches[0:2], data_to_transfer=100)
+
+    # Removing inspected flows keeps the flows created since the last update pending, without inspecting the others again
+    flow_tracker = topology._flow_tracker
+    flow_tracker.remove_flows(flows=NetworkFlow.all(), removed_flows=[flows[0], flows[2]])
+    assert NetworkFlow.all() == [flows[1], new_flow]
+    assert flow_tracker.known_flows == 1 and flow_tracker.last_known_flow is flows[1]
+    assert flow_tracker.has_pending_changes(flows=NetworkFlow.all())
+
+
+def test_flow_tracker_has_pending_changes():
+
+    topology, switches = _line_topology(bandwidths=[10])
+    flow = NetworkFlow(topology=topology, path=switches[0:2], data_to_transfer=100)
+
+    max_min_fairness(topology=topology, flows=NetworkFlow.all())
+    assert not topology._flow_tracker.has_pending_changes(flows=NetworkFlow.all())
+
+    # Flows that have more bandwidth than needed lead to bandwidth shares being recalculated
+    flow.data_to_transfer = 5
+    assert topology._flow_tracker.has_pending_changes(flows=NetworkFlow.all())
+
+    # New flows lead to bandwidth shares being recalculated
+    flow.data_to_transfer = 50
+    NetworkFlow(topology=topology, path=switches[0:2], data_to_transfer=100)
+    assert topology._flow_tracker.has_pending_changes(flows=NetworkFlow.all())
+
+
+def test_calculate_network_wide_allocation():
+
+    # Flow 0 crosses both links and is bottlenecked by link 1, so flow 1 gets the bandwidth left on link 0
+    assert calculate_network_wide_allocation(capacities=[10, 2], demands=[100, 100], paths=[[0, 1], [0]]) == [2, 8]
+
+    # Flows with smaller demands free bandwidth for the others
+    assert calculate_network_wide_allocation(capacities=[10], demands=[1, 100, 100], paths=[[0], [0], [0]]) == [1, 4.5, 4.5]
+
+
+def test_network_wide_max_min_fairness():
+
+    topology, switches = _line_topology(bandwidths=[10, 2])
+    flow1 = NetworkFlow(topology=topology, path=switches[0:2], data_to_transfer=100)
+    flow2 = NetworkFlow(topology=topology, path=switches[0:3], data_to_transfer=100)
+    link1, link2 = topology[switches[0]][switches[1]], topology[switches[1]][switches[2]]
+
+    network_wide_max_min_fairness(topology=topology, flows=NetworkFlow.all())
+
+    assert flow1.bandwidth == {link1["id"]: 8}
+    assert flow2.bandwidth == {link1["id"]: 2, link2["id"]: 2}
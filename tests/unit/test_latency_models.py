@@ -0,0 +1,70 @@
+from edge_sim_py.components.latency_models.mm1_latency import get_mean_packet_size, get_request_rate, mm1_latency
+from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.components.network_switch import NetworkSwitch
+from edge_sim_py.components.topology import Topology
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _line_topology(delays: list, bandwidth: int) -> tuple:
+
+    for cls in (NetworkLink, NetworkSwitch, Topology):
+        cls._instances = []
+        cls._object_count = 0
+
+    topology = Topology()
+    switches = [NetworkSwitch() for _ in range(len(delays) + 1)]
+    for index, delay in enumerate(delays):
+        link = NetworkLink()
+        link["delay"] = delay
+        link["bandwidth"] = bandwidth
+        link["nodes"] = [switches[index], switches[index + 1]]
+        topology.add_edge(switches[index], switches[index + 1])
+        topology._adj[switches[index]][switches[index + 1]] = link
+        topology._adj[switches[index + 1]][switches[index]] = link
+
+    return topology, switches
+
+
+def _user(app: object, communication_path: list) -> MagicMock:
+
+    user = MagicMock()
+    user.applications = [app]
+    user.communication_paths = {str(app.id): communication_path}
+    user.access_patterns = {str(app.id): MagicMock(duration_values=[1], interval_values=[3])}
+    user.packet_size_strategy = {"mode": "fixed", "size": 20, "min": 0, "max": 0}
+    user.base_station.wireless_delay = 1
+    user.delays = {}
+
+    return user
+
+
+def test_get_request_rate_and_mean_packet_size():
+
+    assert get_request_rate(access_pattern=MagicMock(duration_values=[1, 3], interval_values=[6])) == 0.25
+    assert get_request_rate(access_pattern=None) == 0
+
+    assert get_mean_packet_size(packet_size_strategy={"mode": "fixed", "size": 20, "min": 0, "max": 0}) == 20
+    assert get_mean_packet_size(packet_size_strategy={"mode": "random", "size": 0, "min": 10, "max": 30}) == 20
+
+
+def test_mm1_latency():
+
+    topology, switches = _line_topology(delays=[1, 2], bandwidth=100)
+    service = MagicMock(_available=True, processing_time=1)
+    app = MagicMock(id=1, services=[service])
+    users = [_user(app=app, communication_path=[[1, 2, 3], [3]]) for _ in range(2)]
+
+    mm1_latency(topology=topology, users=users)
+
+    # Each user sends 0.25 requests of size 20 per step, so links have utilization 0.1 and the service has utilization 0.5
+    expected_delay = 1 + (1 + 2) + 2 * (20 / 100) / (1 - 0.1) + 1 / (1 - 0.5)
+    for user in users:
+        assert user.delays["1"] == pytest.approx(expected_delay)
+
+    # Saturated services lead to infinite delays
+    service.processing_time = 2
+    mm1_latency(topology=topology, users=users)
+    assert all(user.delays["1"] == float("inf") for user in users)
@@ -0,0 +1,78 @@
+import sys
+
+import pytest
+
+from edge_sim_py.metrics import ArrowMetricsWriter, MetricsWriter, ParquetMetricsWriter, read_metrics
+
+
+def test_metrics_writer_appends_records(tmp_path):
+
+    writer = MetricsWriter(logs_directory=f"{tmp_path}/logs")
+    writer.write(key="EdgeServer", records=[{"Time Step": 0, "CPU": 1}])
+    writer.write(key="EdgeServer", records=[{"Time Step": 1, "CPU": 2}, {"Time Step": 2, "CPU": {1: 3}}])
+
+    records = read_metrics(writer.get_file_path(key="EdgeServer"))
+    assert next(records) == {"Time Step": 0, "CPU": 1}
+    assert list(records) == [{"Time Step": 1, "CPU": 2}, {"Time Step": 2, "CPU": {1: 3}}]
+
+    # Files from previous simulations are overwritten by new writers
+    MetricsWriter(logs_directory=f"{tmp_path}/logs").write(key="EdgeServer", records=[{"Time Step": 0, "CPU": 4}])
+    assert list(read_metrics(writer.get_file_path(key="EdgeServer"))) == [{"Time Step": 0, "CPU": 4}]
+
+
+def test_read_metrics_ignores_incomplete_records(tmp_path):
+
+    writer = MetricsWriter(logs_directory=str(tmp_path))
+    writer.write(key="User", records=[{"Time Step": 0}, {"Time Step": 1}])
+
+    with open(writer.get_file_path(key="User"), "rb+") as metrics_file:
+        metrics_file.truncate(metrics_file.seek(0, 2) - 1)
+
+    assert list(read_metrics(writer.get_file_path(key="User"))) == [{"Time Step": 0}]
+
+
+@pytest.mark.parametrize("writer_class", [ParquetMetricsWriter, ArrowMetricsWriter])
+def test_columnar_metrics_writers(tmp_path, writer_class):
+
+    pytest.importorskip("pyarrow")
+
+    writer = writer_class(logs_directory=str(tmp_path))
+    writer.write(key="NetworkFlow", records=[{"Time Step": 0, "Status": "active", "Data to Transfer": 10, "Path": [1, 2]}])
+    writer.write(key="NetworkFlow", records=[{"Time Step": 1, "Status": "finished", "Data to Transfer": 2.5, "Path": [1, 2]}])
+    writer.close()
+
+    assert list(read_metrics(writer.get_file_path(key="NetworkFlow"))) == [
+        {"Time Step": 0, "Status": "active", "Data to Transfer": 10, "Path": [1, 2]},
+        {"Time Step": 1, "Status": "finished", "Data to Transfer": 2.5, "Path": [1, 2]},
+    ]
+
+
+@pytest.mark.parametrize("writer_class", [ParquetMetricsWriter, ArrowMetricsWriter])
+def test_columnar_metrics_writers_evolve_schemas(tmp_path, writer_class):
+
+    pytest.importorskip("pyarrow")
+
+    writer = writer_class(logs_directory=str(tmp_path))
+    writer.write(key="DataPacket", records=[{"Time Step": 0, "Id": 1, "Status": "active"}])
+    writer.write(key="DataPacket", records=[{"Time Step": 1, "Id": 1, "Status": "finished", "Hops": [{"Link": 1}]}])
+    writer.close()
+
+    # Records written after the writer is closed (e.g., by a resumed simulation) are appended to the existing file
+    writer.write(key="DataPacket", records=[{"Time Step": 2, "Id": 2, "Status": "active", "Hops": None}])
+    writer.close()
+
+    records = list(read_metrics(writer.get_file_path(key="DataPacket")))
+    assert records == [
+        {"Time Step": 0, "Id": 1, "Status": "active", "Hops": None},
+        {"Time Step": 1, "Id": 1, "Status": "finished", "Hops": [{"Link": 1}]},
+        {"Time Step": 2, "Id": 2, "Status": "active", "Hops": None},
+    ]
+    assert all(type(record["Time Step"]) is int and type(record["Id"]) is int for record in records)
+
+
+def test_columnar_metrics_writers_require_pyarrow(tmp_path, monkeypatch):
+
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError):
+        ParquetMetricsWriter(logs_directory=str(tmp_path))
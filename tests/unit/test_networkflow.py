@@ -1,3 +1,5 @@
+import pytest
+
 from unittest.mock import MagicMock
 from edge_sim_py.components.data_packet import DataPacket
 from edge_sim_py.components.network_flow import NetworkFlow
@@ -19,6 +21,7 @@ def test_step_flow_data_packet():
     }
 
     model = MagicMock()
+    model.schedule.steps = 0
     flow.model = model
 
     flow.step()
@@ -26,3 +29,60 @@ def test_step_flow_data_packet():
     dp._on_flow_finished.assert_called_once_with(flow)
 
     flow.model.schedule.remove.assert_called_once_with(flow)
+
+
+def test_step_flow_projects_completion():
+
+    flow = NetworkFlow(data_to_transfer=25, metadata={"type": "data_packet", "object": MagicMock(spec=DataPacket)})
+    flow.bandwidth = {0: 10, 1: 5}
+
+    model = MagicMock()
+    model.schedule.steps = 1
+    flow.model = model
+
+    flow.step()
+    assert flow._completion_step == 5
+    assert flow.data_to_transfer == 20
+
+    # The flow progress is calculated from the bottleneck bandwidth until it changes
+    model.schedule.steps = 3
+    assert flow.data_to_transfer == 15
+
+    flow.bandwidth = {0: 10, 1: 10}
+    flow.step()
+    assert flow._completion_step == 4
+    assert flow.data_to_transfer == 5
+
+    model.schedule.steps = 4
+    flow.step()
+    assert flow.status == "finished"
+    assert flow.end == 5
+    assert flow.data_to_transfer == 0
+    assert (flow._min_bandwidth, flow._max_bandwidth, flow._bandwidth_sum / flow._transfer_steps) == (5, 10, 7.5)
+
+
+@pytest.mark.parametrize("data_to_transfer, bandwidths", [(62, [31 / 6]), (796, [0.8]), (100, [10 / 3, 0.7]), (53.7, [1 / 7, 2.9, 5])])
+def test_step_flow_matches_per_step_subtraction(data_to_transfer, bandwidths):
+
+    flow = NetworkFlow(data_to_transfer=data_to_transfer, metadata={"type": "data_packet", "object": MagicMock(spec=DataPacket)})
+    model = MagicMock()
+    model.schedule.steps = 0
+    flow.model = model
+
+    # Reference: the bandwidth share (which changes every 5 steps) is subtracted from the data to transfer at every step
+    remaining, history, reference = data_to_transfer, [], []
+    while remaining > 0:
+        bandwidth = bandwidths[min(len(history) // 5, len(bandwidths) - 1)]
+        remaining -= bandwidth
+        history.append(bandwidth)
+        reference.append(max(remaining, 0))
+
+    for step, data in enumerate(reference):
+        model.schedule.steps = step
+        flow.bandwidth = {0: history[step]}
+        flow.step()
+        assert flow.data_to_transfer == data
+
+    assert flow.status == "finished"
+    assert flow.end == len(reference)
+    assert flow._bandwidth_sum == sum(history)
@@ -0,0 +1,132 @@
+import json
+
+from edge_sim_py.components.application import Application
+from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.components.network_switch import NetworkSwitch
+from edge_sim_py.components.topology import Topology
+
+
+def _triangle_topology() -> tuple:
+
+    for cls in (NetworkLink, NetworkSwitch, Topology):
+        cls._instances = []
+        cls._object_count = 0
+
+    topology = Topology()
+    switches = [NetworkSwitch() for _ in range(3)]
+    links = {}
+    for (i, j), delay in {(0, 1): 1, (1, 2): 1, (0, 2): 5}.items():
+        link = NetworkLink()
+        link["delay"] = delay
+        link["nodes"] = [switches[i], switches[j]]
+        topology.add_edge(switches[i], switches[j])
+        topology._adj[switches[i]][switches[j]] = link
+        topology._adj[switches[j]][switches[i]] = link
+        links[(i, j)] = link
+
+    return topology, switches, links
+
+
+def test_get_shortest_path_cache():
+
+    topology, switches, _ = _triangle_topology()
+
+    path = topology.get_shortest_path(source=switches[0], target=switches[2], weight="delay")
+    assert path == [switches[0], switches[1], switches[2]]
+    assert topology.get_shortest_path(source=switches[0], target=switches[2]) == [switches[0], switches[2]]
+
+    # Cached paths are served from memory and are not affected by changes to the returned lists
+    path.pop()
+    assert topology.get_shortest_path(source=switches[0], target=switches[2], weight="delay") == [switches[0], switches[1], switches[2]]
+    assert len(topology._shortest_paths) == 2
+
+
+def test_shortest_path_cache_invalidation():
+
+    topology, switches, links = _triangle_topology()
+    assert topology.get_shortest_path(source=switches[0], target=switches[2], weight="delay") == [switches[0], switches[1], switches[2]]
+    assert topology.calculate_path_delay(path=[switches[0], switches[1], switches[2]]) == 2
+
+    # Changing link properties that influence routing
+    links[(1, 2)]["delay"] = 10
+    assert topology.get_shortest_path(source=switches[0], target=switches[2], weight="delay") == [switches[0], switches[2]]
+    assert topology.calculate_path_delay(path=[switches[0], switches[1], switches[2]]) == 11
+
+    # Removing links
+    topology.remove_edge(switches[0], switches[2])
+    assert topology.get_shortest_path(source=switches[0], target=switches[2], weight="delay") == [switches[0], switches[1], switches[2]]
+
+
+def test_precompute_shortest_paths():
+
+    topology, switches, _ = _triangle_topology()
+    topology.precompute_shortest_paths(weight="delay")
+
+    assert len(topology._shortest_paths) == 9
+    assert topology.get_shortest_path(source=switches[2], target=switches[0], weight="delay") == [switches[2], switches[1], switches[0]]
+
+
+def test_communication_path_occupancy():
+
+    topology, switches, links = _triangle_topology()
+    app1, app2 = object(), object()
+
+    # Applications are associated with links while any of their communication paths include them
+    topology._allocate_communication_path(communication_path=[switches], app=app1)
+    topology._allocate_communication_path(communication_path=[switches[:2]], app=app1)
+    topology._allocate_communication_path(communication_path=[switches[:2]], app=app2)
+    assert list(links[(0, 1)]["applications"]) == [app1, app2]
+
+    topology._release_communication_path(communication_path=[switches], app=app1)
+    assert list(links[(0, 1)]["applications"]) == [app1, app2]
+    assert list(links[(1, 2)]["applications"]) == []
+
+    topology._release_communication_path(communication_path=[switches[:2]], app=app1)
+    assert list(links[(0, 1)]["applications"]) == [app2]
+
+    # Exported links keep the number of communication paths of each application that include them
+    app3 = Application()
+    topology._release_communication_path(communication_path=[switches[:2]], app=app2)
+    topology._allocate_communication_path(communication_path=[switches[:2]], app=app3)
+    topology._allocate_communication_path(communication_path=[switches[:2]], app=app3)
+    links[(0, 1)]["topology"] = topology
+    assert links[(0, 1)]._to_dict()["relationships"]["applications"] == [{"class": "Application", "id": app3.id}] * 2
+
+    # Applications listed multiple times (e.g., when loading datasets) keep their number of communication paths
+    links[(0, 1)]["applications"] = [app3, app3]
+    topology._release_communication_path(communication_path=[switches[:2]], app=app3)
+    assert list(links[(0, 1)]["applications"]) == [app3]
+
+    # Lists assigned to occupancy attributes (e.g., when loading datasets) are converted automatically
+    links[(0, 2)]["active_flows"] = [app1, app2]
+    links[(0, 2)]["active_flows"].remove(app1)
+    assert links[(0, 2)]["active_flows"] == [app2]
+
+
+def test_network_link_mapping_interface():
+
+    topology, switches, links = _triangle_topology()
+    link = links[(0, 1)]
+
+    # Link properties are stored in slots but remain accessible through the mapping interface used by NetworkX
+    assert link.delay == link["delay"] == topology[switches[0]][switches[1]]["delay"] == 1
+    assert link.get("bandwidth") == 0 and link.get("unknown", 7) == 7
+    assert "delay" in link and "unknown" not in link
+    assert list(link)[:4] == ["id", "topology", "nodes", "delay"]
+    assert dict(link.items())["nodes"] == [switches[0], switches[1]]
+    assert len(link) == len(list(link.keys())) == 11
+    assert json.loads(json.dumps(link, default=str))["delay"] == 1
+
+    # User-defined properties are stored as dictionary items and can also be accessed as attributes
+    link["jitter"] = 2
+    link.loss = 0.1
+    assert link.jitter == 2 and link["loss"] == 0.1 and len(link) == 13
+    del link.jitter
+    assert "jitter" not in link and link.pop("loss") == 0.1
+
+    # Updating links through NetworkX keeps track of routing changes
+    routing_changes = NetworkLink._routing_changes
+    topology.add_edge(switches[0], switches[1], delay=3)
+    assert topology[switches[0]][switches[1]] is link and link.delay == 3
+    assert NetworkLink._routing_changes == routing_changes + 1
+    assert topology.calculate_path_delay(path=[switches[0], switches[1], switches[2]]) == 4
@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock, patch
+from edge_sim_py.components.user_access_patterns import CircularDurationAndIntervalAccessPattern
 from edge_sim_py.components.application import Application
 from edge_sim_py.components.data_packet import DataPacket
 from edge_sim_py.components.network_switch import NetworkSwitch
@@ -11,6 +12,7 @@ def test_user_start_flow():
     app = MagicMock(spec=Application)
     app.id = 1
     mock_dp = MagicMock(spec=DataPacket)
+    mock_dp.count = 1
     user.communication_paths = {"1": [[1, 2]]}
 
     model = MagicMock()
@@ -59,7 +61,7 @@ def test_generate_datapacket():
 
     user._generate_datapacket(app)
 
-    app._register_datapacket.assert_called_with(user=user, size=1)
+    app._register_datapacket.assert_called_with(user=user, size=1, aggregation_key=None)
 
     with patch("random.randint", return_value=10):
 
@@ -67,4 +69,41 @@ def test_generate_datapacket():
 
         user._generate_datapacket(app)
 
-        app._register_datapacket.assert_called_with(user=user, size=10)
+        app._register_datapacket.assert_called_with(user=user, size=10, aggregation_key=None)
+
+
+def test_user_making_requests():
+
+    user = User()
+    app = MagicMock(spec=Application)
+    app.id = 1
+
+    access_pattern = CircularDurationAndIntervalAccessPattern(user=user, app=app, start=3, duration_values=[2], interval_values=[1])
+    access_pattern.get_next_access(start=access_pattern.history[-1]["next_access"])
+
+    assert [user._is_making_requests(app=app, step=step) for step in range(1, 10)] == [False, False, True, True, False, True, True, False, False]
+
+    # The legacy view covers the steps up to the start of the first access before the simulation starts
+    assert user.making_requests == {"1": {"1": False, "2": False, "3": True}}
+
+    user.model = MagicMock()
+    user.model.schedule.steps = 6
+    assert user.making_requests == {"1": {"1": False, "2": False, "3": True, "4": True, "5": False, "6": True, "7": True}}
+
+
+def test_user_making_requests_from_datasets():
+
+    user = User()
+    app = MagicMock(spec=Application)
+    app.id = 1
+
+    CircularDurationAndIntervalAccessPattern(user=user, app=app, start=3, duration_values=[1], interval_values=[10])
+
+    # Steps marked as requested in datasets are kept as intervals in addition to the access pattern history
+    user.making_requests = {"1": {"1": False, "2": False, "3": True, "4": False, "5": True, "6": True}}
+    assert user._loaded_requests == {"1": [[3, 3], [5, 6]]}
+    assert [user._is_making_requests(app=app, step=step) for step in range(1, 8)] == [False, False, True, False, True, True, False]
+    assert user.making_requests == {"1": {"1": False, "2": False, "3": True, "4": False, "5": True, "6": True}}
+
+    # Requests are no longer collected at each step, as they are derived from the access history
+    assert "Making Requests" not in user.collect()